@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+
+
+class DjangoCmsRestConfig(AppConfig):
+    name = "djangocms_rest"
+    verbose_name = "django CMS REST API"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from cms.models import Page, Placeholder
+
+        from djangocms_rest.changes import log_plugin_moves
+        from djangocms_rest.signals import send_page_moved
+
+        # Pages moved outside the admin invalidate the page index and the view restrictions, too
+        Page.move_page = send_page_moved(Page.move_page)
+        # Moved plugins update their placeholders in the change feed
+        Placeholder.move_plugin = log_plugin_moves(Placeholder.move_plugin)
+
+        # Connect the signal receivers invalidating the page index and the view restrictions,
+        # and recording deletions for the change feed
+        from djangocms_rest import changes, page_index, permissions  # noqa: F401
@@ -0,0 +1,19 @@
+from django.urls import path
+from rest_framework.urlpatterns import format_suffix_patterns
+from . import async_views
+
+urlpatterns = [
+    path("", async_views.LanguageList.as_view(), name="cms-language-list"),
+    path("<slug:language>/pages", async_views.PageList.as_view(), name="cms-page-list"),
+    path("<slug:language>/pages/", async_views.PageDetail.as_view(), name="cms-page-root"),
+    path("<slug:language>/pages/<path:path>/", async_views.PageDetail.as_view(), name="cms-page-detail"),
+    path("<slug:language>/placeholders/", async_views.PlaceholderList.as_view(), name="cms-placeholder-list"),
+    path(
+        "<slug:language>/placeholders/<int:content_type_id>/<int:object_id>/<str:slot>/",
+        async_views.PlaceholderDetail.as_view(),
+        name="cms-placeholder-detail",
+    ),
+    path("<slug:language>/changes", async_views.ChangeList.as_view(), name="cms-change-list"),
+]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
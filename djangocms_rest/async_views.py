@@ -0,0 +1,110 @@
+"""
+Async variants of the API views for ASGI deployments. They run the database and cache
+access of a request in the request's worker thread without blocking the event loop, and
+render the placeholders of a page concurrently. Use ``djangocms_rest.async_urls`` instead
+of ``djangocms_rest.urls`` to serve them.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework.response import Response
+
+from djangocms_rest import views
+from djangocms_rest.serializers.pageserializer import PageContentSerializer, get_page_placeholders
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer
+from djangocms_rest.timing import start_timer
+
+
+class AsyncAPIView(views.APIView):
+    """
+    Base class for the async API views. ``dispatch`` mirrors DRF's ``APIView.dispatch``,
+    running the synchronous parts (authentication, permissions, throttling, handlers that
+    are not coroutines) with ``sync_to_async``. Timed requests (see ``djangocms_rest.timing``)
+    do not count queries: they run in other threads.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        start_timer(request, self.__class__)
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if asyncio.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class LanguageList(AsyncAPIView, views.LanguageList):
+    __doc__ = views.LanguageList.__doc__
+
+
+class PageList(AsyncAPIView, views.PageList):
+    __doc__ = views.PageList.__doc__
+
+
+class PageDetail(AsyncAPIView, views.PageDetail):
+    __doc__ = views.PageDetail.__doc__
+
+    async def get(self, request, language, path="", format=None):
+        def get_page_content():
+            not_modified, page_content, fields, expand_placeholders = self.get_page_content(
+                request, language, path
+            )
+            placeholders = None
+            if not not_modified and expand_placeholders:
+                placeholders = get_page_placeholders(page_content)
+                for placeholder in placeholders:
+                    placeholder.page = page_content.page
+            return not_modified, page_content, fields, placeholders
+
+        not_modified, page_content, fields, placeholders = await sync_to_async(get_page_content)()
+        if not_modified:
+            return not_modified
+        contents = None
+        if placeholders is not None:
+            contents = await PlaceholderRenderer(request).arender_placeholders(
+                placeholders, context={}, language=page_content.language, use_cache=True
+            )
+
+        def serialize():
+            return PageContentSerializer(
+                request,
+                page_content,
+                expand_placeholders=placeholders is not None,
+                fields=fields,
+                placeholder_contents=contents,
+                read_only=True,
+            ).data
+
+        return Response(await sync_to_async(serialize)())
+
+
+class PlaceholderDetail(AsyncAPIView, views.PlaceholderDetail):
+    __doc__ = views.PlaceholderDetail.__doc__
+
+
+class PlaceholderList(AsyncAPIView, views.PlaceholderList):
+    __doc__ = views.PlaceholderList.__doc__
+
+
+class ChangeList(AsyncAPIView, views.ChangeList):
+    __doc__ = views.ChangeList.__doc__
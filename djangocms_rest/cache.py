@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU cache. Entries expire ``ttl`` seconds after they
+    have been set. If there are more than ``max_entries`` entries or their (pickled) size
+    exceeds ``max_size`` bytes, the least recently used entries are evicted.
+
+    Values are shared between all readers and must not be modified.
+    """
+
+    def __init__(self, max_entries: int, max_size: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_many(self, keys) -> dict:
+        """Returns the values of all keys which are in the cache and have not expired."""
+        values = {}
+        timestamp = time.monotonic()
+        with self._lock:
+            for key in keys:
+                try:
+                    value, size, expires = self._entries[key]
+                except KeyError:
+                    self.misses += 1
+                    continue
+                if expires <= timestamp:
+                    self._delete(key)
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                values[key] = value
+                self.hits += 1
+        return values
+
+    def set_many(self, data: dict, ttl: float | None = None) -> None:
+        """
+        Sets the values of several keys for ``ttl`` seconds at most. Values larger than
+        ``max_size`` are not cached.
+        """
+        sizes = {key: len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) for key, value in data.items()}
+        expires = time.monotonic() + (self.ttl if ttl is None else min(ttl, self.ttl))
+        with self._lock:
+            for key, value in data.items():
+                if key in self._entries:
+                    self._delete(key)
+                if sizes[key] > self.max_size:
+                    continue
+                self._entries[key] = (value, sizes[key], expires)
+                self.size += sizes[key]
+            while len(self._entries) > self.max_entries or self.size > self.max_size:
+                self._delete(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """Returns the hit, miss, and eviction counters and the current number of entries and size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self.size,
+        }
+
+    def _delete(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+_local_cache = None
+
+
+def get_local_cache() -> LocalCache | None:
+    """
+    Returns the process's local placeholder cache or ``None`` if it is disabled. It is
+    configured by these settings:
+
+    * ``DJANGOCMS_REST_LOCAL_CACHE_ENTRIES``: maximum number of entries (default: 0, disabled)
+    * ``DJANGOCMS_REST_LOCAL_CACHE_SIZE``: maximum size in bytes (default: 8 MiB)
+    * ``DJANGOCMS_REST_LOCAL_CACHE_TTL``: seconds entries are kept (default: 60)
+    """
+    global _local_cache
+
+    config = (
+        getattr(settings, "DJANGOCMS_REST_LOCAL_CACHE_ENTRIES", 0),
+        getattr(settings, "DJANGOCMS_REST_LOCAL_CACHE_SIZE", 8 * 1024 * 1024),
+        getattr(settings, "DJANGOCMS_REST_LOCAL_CACHE_TTL", 60),
+    )
+    if not config[0]:
+        return None
+    if _local_cache is None or (_local_cache.max_entries, _local_cache.max_size, _local_cache.ttl) != config:
+        _local_cache = LocalCache(*config)
+    return _local_cache
@@ -0,0 +1,419 @@
+"""
+Change feed: the pages and placeholders added, updated, or deleted since an opaque cursor,
+built from the ``creation_date`` and ``changed_date`` values of pages, page contents and
+plugins, and a log of deleted page contents, placeholders and plugins, of moved plugins,
+and of changed page paths (``DeletionLogEntry``).
+"""
+from __future__ import annotations
+
+import base64
+import functools
+import json
+import threading
+from datetime import datetime, timedelta
+
+from cms import operations
+from cms.models import CMSPlugin, PageContent, PageUrl, Placeholder
+from cms.signals import post_obj_operation, pre_obj_operation
+from cms.utils.conf import get_cms_setting
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.shortcuts import get_current_site
+from django.db import transaction
+from django.db.models import Q, prefetch_related_objects
+from django.db.models.signals import pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils.timezone import now
+
+from djangocms_rest.models import DeletionLogEntry
+from djangocms_rest.permissions import get_permission_evaluator, get_view_restrictions
+from djangocms_rest.serializers.placeholder import get_declared_slots
+from djangocms_rest.utils import get_url_builder
+
+
+def encode_cursor(timestamp: datetime) -> str:
+    return base64.urlsafe_b64encode(timestamp.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """Returns the time of the cursor. Raises ``ValueError`` for invalid cursors."""
+    timestamp = datetime.fromisoformat(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    if settings.USE_TZ != (timestamp.tzinfo is not None):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return timestamp
+
+
+def get_deletion_log_horizon() -> datetime:
+    """Returns the time since when deletions are logged: Older cursors cannot be served."""
+    return now() - timedelta(days=getattr(settings, "DJANGOCMS_REST_DELETION_LOG_DAYS", 30))
+
+
+def get_cursor_time() -> datetime:
+    """
+    Returns the time of the next cursor: ``DJANGOCMS_REST_CHANGES_CURSOR_LAG`` seconds
+    (default: 5) ago. Changes committed after the feed's queries may carry an earlier date;
+    they are only missed if their transaction took longer than the lag. Changes within the
+    lag are reported again with the next cursor.
+    """
+    return now() - timedelta(seconds=getattr(settings, "DJANGOCMS_REST_CHANGES_CURSOR_LAG", 5))
+
+
+def get_changes(request, site, language: str, since: datetime | None = None) -> dict:
+    """
+    Returns the pages and placeholders of the site's page contents in the language which
+    have been added, updated, or deleted since the cursor time, and the cursor of this
+    change set. Without a cursor (or with a cursor older than the deletion log), all
+    pages and placeholders are returned as added and ``reset`` is ``True``.
+
+    A page is updated if its page or page content or its path has changed (its previous
+    path is deleted), a placeholder if one of its plugins has been changed, deleted, or
+    moved (plugins moved to other placeholders update both placeholders). Deleted pages and placeholders may be added
+    again, e.g., under the same path: Clients apply the deletions first. Deleted pages and
+    placeholders are only listed if the user could view their page when it was deleted.
+    """
+    from djangocms_rest.views import _set_inherited_templates
+
+    cursor = get_cursor_time()
+    reset = since is None or since < get_deletion_log_horizon()
+    if reset:
+        since = None
+    page_contents = PageContent.objects.filter(page__node__site=site, language=language).select_related("page__node")
+    content_type = ContentType.objects.get_for_model(PageContent)
+    if since is None:
+        deletions = []
+        changed_page_contents = list(page_contents)
+        placeholders = Placeholder.objects.filter(content_type=content_type, object_id__in=page_contents.values("pk"))
+    else:
+        deletions = list(
+            DeletionLogEntry.objects.filter(
+                Q(site_id=site.pk) | Q(site_id__isnull=True), deleted_date__gte=since, language=language
+            ).order_by("deleted_date")
+        )
+        changed_page_contents = list(
+            page_contents.filter(
+                Q(creation_date__gte=since)
+                | Q(changed_date__gte=since)
+                | Q(page__changed_date__gte=since)
+                | Q(page__in=[entry.url_args[0] for entry in deletions if entry.kind == DeletionLogEntry.PAGE_URL])
+            )
+        )
+        changed_plugins = CMSPlugin.objects.filter(language=language, changed_date__gte=since)
+        placeholders = Placeholder.objects.filter(content_type=content_type).filter(
+            Q(object_id__in=[
+                page_content.pk for page_content in changed_page_contents if page_content.creation_date >= since
+            ])
+            | Q(pk__in=changed_plugins.values("placeholder_id"))
+            | Q(pk__in=[entry.url_args[0] for entry in deletions if entry.kind == DeletionLogEntry.PLUGIN])
+        )
+    placeholders = list(placeholders)
+
+    # The page contents of the changed placeholders, with their pages and urls
+    sources = {page_content.pk: page_content for page_content in changed_page_contents}
+    missing = {placeholder.object_id for placeholder in placeholders} - sources.keys()
+    if missing:
+        sources.update((page_content.pk, page_content) for page_content in page_contents.filter(pk__in=missing))
+    pages = [page_content.page for page_content in sources.values()]
+    prefetch_related_objects(pages, "urls")
+    _set_inherited_templates(list(sources.values()))
+    if request.user.is_anonymous:
+        pages = [page for page in pages if not page.login_required]
+    evaluator = get_permission_evaluator(request, site)
+    visible_pages = {page.pk for page in evaluator.filter(pages)}
+
+    url_builder = get_url_builder(request)
+    changes = {
+        "pages": {"added": [], "updated": [], "deleted": []},
+        "placeholders": {"added": [], "updated": [], "deleted": []},
+    }
+    for page_content in changed_page_contents:
+        if page_content.page_id in visible_pages:
+            state = "added" if since is None or page_content.creation_date >= since else "updated"
+            page_content.page.urls_cache = {url.language: url for url in page_content.page.urls.all()}
+            changes["pages"][state].append({"path": get_page_url(url_builder, get_page_url_args(page_content))})
+    for placeholder in placeholders:
+        page_content = sources.get(placeholder.object_id)
+        if page_content is None or page_content.page_id not in visible_pages:
+            continue
+        if placeholder.slot in get_declared_slots(page_content):
+            state = "added" if since is None or page_content.creation_date >= since else "updated"
+            changes["placeholders"][state].append(
+                get_placeholder_reference(url_builder, language, content_type.pk, page_content.pk, placeholder.slot)
+            )
+    for entry in deletions:
+        if entry.login_required and request.user.is_anonymous or not evaluator.can_view_audience(entry.audience):
+            continue
+        if entry.kind == DeletionLogEntry.PAGE:
+            changes["pages"]["deleted"].append({"path": get_page_url(url_builder, entry.url_args)})
+        elif entry.kind == DeletionLogEntry.PLACEHOLDER:
+            changes["placeholders"]["deleted"].append(get_placeholder_reference(url_builder, *entry.url_args))
+    return {"cursor": encode_cursor(cursor), "reset": reset, **changes}
+
+
+def get_page_url(url_builder, url_args) -> str:
+    """Returns the detail url of a page from its url arguments (see ``get_page_url_args``)."""
+    return url_builder.build("cms-page-detail" if len(url_args) > 1 else "cms-page-root", *url_args)
+
+
+def get_placeholder_reference(url_builder, language, content_type_id, object_id, slot) -> dict:
+    return {
+        "content_type_id": content_type_id,
+        "object_id": object_id,
+        "slot": slot,
+        "details": url_builder.build("cms-placeholder-detail", language, content_type_id, object_id, slot),
+    }
+
+
+_page_paths = {}  # operation token -> page urls before the operation (see ``get_page_paths``)
+
+
+def get_page_paths(**filters) -> dict:
+    """Returns the page id, language and path of the page urls with a path by page url pk."""
+    return {
+        pk: (page_id, language, path)
+        for pk, page_id, language, path in PageUrl.objects.filter(path__isnull=False, **filters).values_list(
+            "pk", "page_id", "language", "path"
+        )
+    }
+
+
+def get_page_restrictions(page) -> dict:
+    """
+    Returns the view restrictions of the page as logged with its deletion, see
+    ``PermissionEvaluator.can_view_audience``.
+    """
+    if get_cms_setting("PERMISSION"):
+        audience = get_view_restrictions(page.node.site_id).get_audience(page.node.path)
+    else:
+        audience = []
+    return {"login_required": page.login_required, "audience": audience}
+
+
+class _LogBatch:
+    """The log entries of a transaction, saved once it is committed."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def add(self, entries) -> None:
+        for entry in entries:
+            key = (entry.kind, entry.site_id, entry.language, json.dumps(entry.url_args))
+            self.entries.setdefault(key, entry)
+
+    def save(self) -> None:
+        DeletionLogEntry.objects.filter(deleted_date__lt=get_deletion_log_horizon()).delete()
+        DeletionLogEntry.objects.bulk_create(self.entries.values())
+
+
+_log_batches = threading.local()
+
+
+def log_changes(*entries) -> None:
+    """
+    Saves the log entries when the current transaction is committed (right away outside of
+    transactions). The entries of a transaction, e.g., of all plugins of a deleted page, are
+    saved with one query, and log entries older than the deletion log horizon are dropped
+    once per transaction.
+    """
+    batch = getattr(_log_batches, "batch", None)
+    # A batch is pending until its transaction is committed or rolled back
+    if batch is None or not any(
+        callback[1] == batch.save for callback in transaction.get_connection().run_on_commit
+    ):
+        batch = _log_batches.batch = _LogBatch()
+        batch.add(entries)
+        transaction.on_commit(batch.save)
+    else:
+        batch.add(entries)
+
+
+def get_page_url_args(page_content) -> list:
+    """Returns the arguments of the page content's detail url (as ``PageContentSerializer`` builds it)."""
+    page = page_content.page
+    if page.is_home:
+        return [page_content.language]
+    return [page_content.language, page.get_path(page_content.language)]
+
+
+@receiver(pre_delete, sender=PageContent, dispatch_uid="djangocms_rest_changes_page_content_deleted")
+def log_page_content_deletion(sender, instance, **kwargs):
+    """Logs the deleted page content."""
+    log_changes(DeletionLogEntry(
+        kind=DeletionLogEntry.PAGE,
+        site_id=instance.page.node.site_id,
+        language=instance.language,
+        url_args=get_page_url_args(instance),
+        **get_page_restrictions(instance.page),
+    ))
+
+
+@receiver(pre_delete, sender=Placeholder, dispatch_uid="djangocms_rest_changes_placeholder_deleted")
+def log_placeholder_deletion(sender, instance, **kwargs):
+    """Logs deleted placeholders of page contents."""
+    if instance.content_type_id != ContentType.objects.get_for_model(PageContent).pk:
+        return
+    source = PageContent.objects.filter(pk=instance.object_id).select_related("page__node").first()
+    if source:
+        log_changes(DeletionLogEntry(
+            kind=DeletionLogEntry.PLACEHOLDER,
+            site_id=source.page.node.site_id,
+            language=source.language,
+            url_args=[source.language, instance.content_type_id, instance.object_id, instance.slot],
+            **get_page_restrictions(source.page),
+        ))
+
+
+@receiver(pre_delete, sender=CMSPlugin, dispatch_uid="djangocms_rest_changes_plugin_deleted")
+def log_plugin_deletion(sender, instance, **kwargs):
+    """Logs the placeholders of deleted plugins: The placeholders have been updated."""
+    if instance.placeholder_id:
+        log_changes(
+            DeletionLogEntry(kind=DeletionLogEntry.PLUGIN, language=instance.language, url_args=[instance.placeholder_id])
+        )
+
+
+def log_placeholder_changes(*placeholders) -> None:
+    """
+    Logs ``(placeholder, language)`` pairs as updated: Moving plugins shifts positions and
+    parents with queryset updates, which do not change the plugins' changed dates.
+    """
+    log_changes(*{
+        placeholder.pk: DeletionLogEntry(kind=DeletionLogEntry.PLUGIN, language=language, url_args=[placeholder.pk])
+        for placeholder, language in placeholders
+        if placeholder is not None and language
+    }.values())
+
+
+def log_plugin_moves(move_plugin):
+    """Wraps ``Placeholder.move_plugin`` to log the source and target placeholders as updated."""
+    if getattr(move_plugin, "logs_plugin_moves", False):
+        return move_plugin
+
+    @functools.wraps(move_plugin)
+    def wrapper(self, plugin, *args, **kwargs):
+        result = move_plugin(self, plugin, *args, **kwargs)
+        target_placeholder = kwargs.get("target_placeholder", args[1] if len(args) > 1 else None)
+        log_placeholder_changes((self, plugin.language), (target_placeholder, plugin.language))
+        return result
+
+    wrapper.logs_plugin_moves = True
+    return wrapper
+
+
+@receiver(post_obj_operation, dispatch_uid="djangocms_rest_changes_plugin_operation")
+def log_plugin_operation(
+    sender, operation, plugin=None, source_placeholder=None, source_language=None, target_placeholder=None,
+    target_language=None, **kwargs
+):
+    """
+    Logs the placeholders plugins have been moved, cut, or pasted from and to in the admin
+    as updated.
+    """
+    if operation in (
+        operations.MOVE_PLUGIN,
+        operations.CUT_PLUGIN,
+        operations.PASTE_PLUGIN,
+        operations.PASTE_PLACEHOLDER,
+        operations.ADD_PLUGINS_FROM_PLACEHOLDER,
+    ):
+        language = getattr(plugin, "language", None)
+        log_placeholder_changes(
+            (source_placeholder, source_language or language), (target_placeholder, target_language or language)
+        )
+
+
+def log_page_path_changes(paths) -> None:
+    """
+    Logs the previous paths of page urls (by page url pk, see ``get_page_paths``) as
+    deleted pages and their pages as updated.
+    """
+    pages = {
+        page_url.pk: page_url.page for page_url in PageUrl.objects.filter(pk__in=paths).select_related("page__node")
+    }
+    entries = []
+    for pk, (page_id, language, path) in paths.items():
+        page = pages[pk]
+        entries += [
+            DeletionLogEntry(
+                kind=DeletionLogEntry.PAGE,
+                site_id=page.node.site_id,
+                language=language,
+                url_args=[language, path] if path else [language],
+                **get_page_restrictions(page),
+            ),
+            DeletionLogEntry(
+                kind=DeletionLogEntry.PAGE_URL, site_id=page.node.site_id, language=language, url_args=[page_id]
+            ),
+        ]
+    if entries:
+        log_changes(*entries)
+
+
+@receiver(pre_save, sender=PageUrl, dispatch_uid="djangocms_rest_changes_page_url_saved")
+def log_page_url_change(sender, instance, raw=False, **kwargs):
+    """
+    Logs the previous path of a saved page url, and of the managed urls of its descendants
+    which are derived from it, if the path changes.
+    """
+    if raw or instance.pk is None:
+        return
+    previous = PageUrl.objects.filter(pk=instance.pk).values_list("path", flat=True).first()
+    if not previous or previous == instance.path:
+        return
+    paths = {instance.pk: (instance.page_id, instance.language, previous)}
+    paths.update(get_page_paths(
+        language=instance.language,
+        managed=True,
+        path__startswith=previous + "/",
+        page__node__site=instance.page.node.site_id,
+    ))
+    log_page_path_changes(paths)
+
+
+def get_edited_page(request):
+    """
+    Returns the page whose page content the request's admin change form edits, or ``None``
+    if it is not known.
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    object_id = resolver_match.kwargs.get("object_id") if resolver_match else None
+    if not object_id:
+        return None
+    page_content = PageContent.admin_manager.filter(pk=object_id).select_related("page__node").first()
+    return page_content.page if page_content else None
+
+
+@receiver(pre_obj_operation, dispatch_uid="djangocms_rest_changes_pre_obj_operation")
+def record_page_paths(sender, operation, token, request=None, obj=None, language=None, **kwargs):
+    """
+    Records the page paths before moving a page or changing a page's slug or path in the
+    admin. These operations rewrite the paths of the page's descendants without saving
+    their page urls (or changing the pages' or page contents' changed dates).
+    """
+    if operation == operations.MOVE_PAGE and obj is not None:
+        _page_paths[token] = get_page_paths(page__node__site=obj.node.site_id, page__node__path__startswith=obj.node.path)
+    elif operation == operations.CHANGE_PAGE_TRANSLATION:
+        # The operation does not pass the page: It is the object of the admin change form
+        page = get_edited_page(request)
+        if page is not None:
+            _page_paths[token] = get_page_paths(
+                language=language, page__node__site=page.node.site_id, page__node__path__startswith=page.node.path
+            )
+        else:
+            _page_paths[token] = get_page_paths(language=language, page__node__site=get_current_site(request).pk)
+
+
+@receiver(post_obj_operation, dispatch_uid="djangocms_rest_changes_post_obj_operation")
+def log_page_paths(sender, operation, token, obj=None, **kwargs):
+    """Logs the previous paths of the page urls changed by the operation (see ``record_page_paths``)."""
+    previous = _page_paths.pop(token, None)
+    if previous is None or obj is None:
+        return
+    if operation == operations.MOVE_PAGE:
+        current = get_page_paths(pk__in=previous)
+    else:
+        current = get_page_paths(page__node__site=obj.node.site_id, page__node__path__startswith=obj.node.path)
+    log_page_path_changes({
+        pk: previous[pk]
+        for pk, (_, _, path) in current.items()
+        if pk in previous and previous[pk][2] != path
+    })
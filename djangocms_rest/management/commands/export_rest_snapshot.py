@@ -0,0 +1,45 @@
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from djangocms_rest.snapshot import SnapshotExporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports the language list, page lists, page details and placeholder details of the API "
+        "as a directory tree of JSON files mirroring the URL structure, e.g., to serve the API from "
+        "a CDN or object storage."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", help="snapshot directory")
+        parser.add_argument(
+            "--base-url", help="scheme and host of the exported API urls (default: https://<current site domain>)"
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="only rewrite the files of pages and placeholders changed since the last export",
+        )
+        parser.add_argument("--workers", type=int, default=4, help="rendering threads (default: 4)")
+
+    def handle(self, *args, directory, base_url, incremental, workers, **options):
+        exporter = SnapshotExporter(
+            directory,
+            base_url or f"https://{Site.objects.get_current().domain}",
+            workers=workers,
+            incremental=incremental,
+        )
+        try:
+            result = exporter.export()
+        except ValueError as e:
+            raise CommandError(e)
+        if options["verbosity"] > 1:
+            for path in result.written:
+                self.stdout.write(f"Written {path}")
+            for path in result.deleted:
+                self.stdout.write(f"Deleted {path}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {len(result.written) + len(result.unchanged)} resources to {directory}: "
+            f"{len(result.written)} written, {len(result.unchanged)} unchanged, {len(result.deleted)} deleted"
+        ))
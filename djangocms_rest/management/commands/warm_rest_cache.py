@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import django
+from cms.utils.conf import get_cms_setting
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from djangocms_rest.warming import get_pages_to_warm, warm_pages
+
+
+def init_worker():
+    # Spawned worker processes need to set up Django, forked ones open their own connections
+    if not apps.ready:
+        django.setup()
+    connections.close_all()
+
+
+def warm_batch(page_pks, languages, index, base_url, min_duration):
+    """Warms a batch of pages, taking at least ``min_duration`` seconds to limit the database load."""
+    start = time.monotonic()
+    try:
+        return warm_pages(page_pks, languages=languages, index=index, base_url=base_url)
+    finally:
+        time.sleep(max(0, min_duration - (time.monotonic() - start)))
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders the placeholders of all pages into the REST placeholder cache ahead of the first "
+        "requests, e.g., after a deploy or a cache flush. The pages are warmed in batches by a pool "
+        "of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--site", type=int, action="append", dest="sites", help="site id (repeatable)")
+        parser.add_argument(
+            "--language", action="append", dest="languages", help="language code (repeatable)"
+        )
+        parser.add_argument(
+            "--since", help="only warm pages changed since this ISO 8601 date or date and time"
+        )
+        parser.add_argument(
+            "--index",
+            action="store_true",
+            help="also index the paths and placeholders for the page and placeholder detail endpoints",
+        )
+        parser.add_argument("--processes", type=int, default=4, help="worker processes (default: 4)")
+        parser.add_argument("--batch-size", type=int, default=50, help="pages per batch (default: 50)")
+        parser.add_argument(
+            "--max-rate", type=float, default=0, help="maximum number of pages warmed per second (default: no limit)"
+        )
+        parser.add_argument(
+            "--base-url", help="scheme and host of the rendering requests (default: https://<site domain>)"
+        )
+
+    def handle(self, *args, sites, languages, since, index, processes, batch_size, max_rate, base_url, **options):
+        if not get_cms_setting("PLACEHOLDER_CACHE"):
+            raise CommandError("The placeholder cache is disabled (CMS_PLACEHOLDER_CACHE).")
+        if since:
+            since = self.parse_since(since)
+        if processes > 1 and isinstance(caches["default"], LocMemCache):
+            self.stderr.write("The local-memory cache is not shared between processes: warming in this process.")
+            processes = 1
+
+        page_pks = get_pages_to_warm(sites, since)
+        batches = [page_pks[i:i + batch_size] for i in range(0, len(page_pks), batch_size)]
+        # Each worker's batches take long enough for all workers to stay below the maximum rate
+        workers = max(1, min(processes, len(batches)))
+        min_duration = batch_size * workers / max_rate if max_rate else 0
+        arguments = (languages, index, base_url, min_duration)
+
+        start = time.monotonic()
+        totals = [0, 0, 0]  # pages, placeholders, rendered placeholders
+        if workers > 1:
+            # Worker processes must not share the database connections of this one
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+                futures = [executor.submit(warm_batch, batch, *arguments) for batch in batches]
+                for future in as_completed(futures):
+                    self.report(totals, future.result(), len(page_pks), options["verbosity"])
+        else:
+            for batch in batches:
+                self.report(totals, warm_batch(batch, *arguments), len(page_pks), options["verbosity"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {totals[0]} pages: rendered {totals[2]} of {totals[1]} placeholders "
+            f"in {time.monotonic() - start:.1f}s"
+        ))
+
+    def parse_since(self, value):
+        try:
+            since = parse_datetime(value)
+            date = parse_date(value) if since is None else None
+        except ValueError:
+            since = date = None
+        if since is None:
+            if date is None:
+                raise CommandError(f"Expected an ISO 8601 date or date and time for --since, got {value!r}.")
+            since = datetime.combine(date, datetime.min.time())
+        if settings.USE_TZ and timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def report(self, totals, result, pages, verbosity):
+        """Adds the result of a batch to the totals and reports the progress."""
+        for i, value in enumerate(result):
+            totals[i] += value
+        if verbosity > 0:
+            self.stdout.write(f"{totals[0]}/{pages} pages, {totals[2]} placeholders rendered")
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:36
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('page', 'page'), ('placeholder', 'placeholder'), ('plugin', 'plugin'), ('page_url', 'page url')], max_length=20, verbose_name='kind')),
+                ('site_id', models.PositiveIntegerField(null=True, verbose_name='site id')),
+                ('language', models.CharField(max_length=15, verbose_name='language')),
+                ('url_args', models.JSONField(default=list, verbose_name='url arguments')),
+                ('deleted_date', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='deleted date')),
+                ('login_required', models.BooleanField(default=False, verbose_name='login required')),
+                ('audience', models.JSONField(default=list, verbose_name='audience')),
+            ],
+            options={
+                'verbose_name': 'deletion log entry',
+                'verbose_name_plural': 'deletion log entries',
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import models
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy as _
+
+
+class DeletionLogEntry(models.Model):
+    """
+    A deleted page content, placeholder, or plugin, a moved plugin, or a changed page path,
+    recorded for the change feed (see ``djangocms_rest.changes``). Entries are kept for
+    ``DJANGOCMS_REST_DELETION_LOG_DAYS`` days (default: 30).
+    """
+
+    PAGE = "page"
+    PLACEHOLDER = "placeholder"
+    PLUGIN = "plugin"
+    PAGE_URL = "page_url"
+
+    kind = models.CharField(
+        _("kind"),
+        max_length=20,
+        choices=[
+            (PAGE, _("page")),
+            (PLACEHOLDER, _("placeholder")),
+            (PLUGIN, _("plugin")),
+            (PAGE_URL, _("page url")),
+        ],
+    )
+    site_id = models.PositiveIntegerField(_("site id"), null=True)
+    language = models.CharField(_("language"), max_length=15)
+    #: Arguments of the deleted object's detail url (for deleted or moved plugins: the placeholder id, for
+    #: page urls: the page id)
+    url_args = models.JSONField(_("url arguments"), default=list)
+    deleted_date = models.DateTimeField(_("deleted date"), default=now, db_index=True)
+    #: View restrictions of the deleted page (see ``djangocms_rest.changes.get_page_restrictions``)
+    login_required = models.BooleanField(_("login required"), default=False)
+    audience = models.JSONField(_("audience"), default=list)
+
+    class Meta:
+        verbose_name = _("deletion log entry")
+        verbose_name_plural = _("deletion log entries")
+
+    def __str__(self):
+        return f"{self.kind} {self.url_args} ({self.deleted_date})"
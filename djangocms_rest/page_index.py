@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from cms.models import Page, PageContent, PageUrl, Placeholder
+from cms.signals import page_moved, post_obj_operation
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+#: Cache key of the index version. Changing the version invalidates all index entries.
+PAGE_INDEX_VERSION_KEY = "djangocms_rest:page_index:version"
+
+
+def _get_page_index_key(site_id: int, language: str, path: str) -> str:
+    return f"djangocms_rest:page_index:{site_id}:{language}:{hashlib.sha1(path.encode()).hexdigest()}"
+
+
+def _get_placeholder_index_key(content_type_id: int, object_id: int, slot: str) -> str:
+    return (
+        f"djangocms_rest:placeholder_index:{content_type_id}:{object_id}:"
+        f"{hashlib.sha1(slot.encode()).hexdigest()}"
+    )
+
+
+def _get_index_entry(key: str) -> tuple:
+    values = cache.get_many([PAGE_INDEX_VERSION_KEY, key])
+    version = values.get(PAGE_INDEX_VERSION_KEY)
+    entry = values.get(key)
+    if version is None or entry is None or entry[0] != version:
+        return version, None
+    return version, entry[1:]
+
+
+def _set_index_entry(key: str, version, *values) -> None:
+    if version is None:
+        version = clear_page_index()
+    cache.set(key, (version, *values), getattr(settings, "DJANGOCMS_REST_PAGE_INDEX_TIMEOUT", 3600))
+
+
+def get_page_index_entry(site_id: int, language: str, path: str) -> tuple:
+    """
+    Returns the current index version and the indexed page content pk and page urls of
+    the path as ``(version, (page_content_pk, page_urls))``, or ``(version, None)`` if the
+    path is not indexed. Version and entry are read with a single cache read.
+    """
+    return _get_index_entry(_get_page_index_key(site_id, language, path))
+
+
+def set_page_index_entry(site_id: int, language: str, path: str, version, page_content_pk: int, page_urls) -> None:
+    """
+    Indexes the page content (for the language or one of its fallbacks) and the page urls
+    of the path. ``version`` is the index version read before the page was looked up: the
+    entry is outdated if the index has been invalidated in the meantime.
+    """
+    _set_index_entry(_get_page_index_key(site_id, language, path), version, page_content_pk, list(page_urls))
+
+
+def get_placeholder_index_entry(content_type_id: int, object_id: int, slot: str) -> tuple:
+    """
+    Returns the current index version and the indexed placeholder and its page content
+    (with page and node) as ``(version, (placeholder, page_content))``, or ``(version, None)``
+    if the placeholder is not indexed. Version and entry are read with a single cache read.
+    """
+    return _get_index_entry(_get_placeholder_index_key(content_type_id, object_id, slot))
+
+
+def set_placeholder_index_entry(placeholder: Placeholder, version, page_content: PageContent) -> None:
+    """
+    Indexes the placeholder and its page content. ``version`` is the index version read
+    before the placeholder was looked up.
+    """
+    _set_index_entry(
+        _get_placeholder_index_key(placeholder.content_type_id, placeholder.object_id, placeholder.slot),
+        version,
+        placeholder,
+        page_content,
+    )
+
+
+@receiver(post_save, sender=Page, dispatch_uid="djangocms_rest_page_index_page_saved")
+@receiver(post_delete, sender=Page, dispatch_uid="djangocms_rest_page_index_page_deleted")
+@receiver(post_save, sender=PageContent, dispatch_uid="djangocms_rest_page_index_page_content_saved")
+@receiver(post_delete, sender=PageContent, dispatch_uid="djangocms_rest_page_index_page_content_deleted")
+@receiver(post_save, sender=PageUrl, dispatch_uid="djangocms_rest_page_index_page_url_saved")
+@receiver(post_delete, sender=PageUrl, dispatch_uid="djangocms_rest_page_index_page_url_deleted")
+@receiver(post_save, sender=Placeholder, dispatch_uid="djangocms_rest_page_index_placeholder_saved")
+@receiver(post_delete, sender=Placeholder, dispatch_uid="djangocms_rest_page_index_placeholder_deleted")
+@receiver(page_moved, dispatch_uid="djangocms_rest_page_index_page_moved")
+@receiver(post_obj_operation, dispatch_uid="djangocms_rest_page_index_obj_operation")
+def clear_page_index(**kwargs):
+    """
+    Invalidates all index entries. Connected to the signals sent when pages, their contents,
+    urls, or placeholders are changed, when pages are moved (see ``send_page_moved``), and
+    after page operations in the admin.
+    """
+    version = int(time.time() * 1000000)
+    cache.set(PAGE_INDEX_VERSION_KEY, version, None)
+    return version
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from cms.models import Page, PagePermission, TreeNode
+from cms.models.permissionmodels import PermissionTuple
+from cms.signals import page_moved, post_obj_operation
+from cms.utils.conf import get_cms_setting
+from cms.utils.page_permissions import user_can_change_page, user_can_view_all_pages
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+#: Cache key of the permission version. Changing the version invalidates all cached view restrictions.
+PERMISSION_VERSION_KEY = "djangocms_rest:permissions:version"
+
+_view_restrictions = {}  # site id -> (version, ViewRestrictions)
+_view_restrictions_lock = threading.Lock()
+
+
+class ViewRestrictions:
+    """
+    The view restrictions of a site's pages: the ``PermissionTuple``, user id, and group id
+    of each ``PagePermission`` with ``can_view``, and the node paths of the pages which are
+    not restricted, i.e., visible to anonymous users if ``CMS_PUBLIC_FOR`` is ``"all"``.
+    """
+
+    def __init__(self, restrictions, unrestricted_paths):
+        self.restrictions = restrictions
+        self.unrestricted_paths = frozenset(unrestricted_paths)
+
+    @classmethod
+    def load(cls, site_id: int) -> ViewRestrictions:
+        restrictions = [
+            (PermissionTuple((grant_on, path)), user_id, group_id)
+            for grant_on, path, user_id, group_id in PagePermission.objects.filter(
+                can_view=True, page__node__site_id=site_id
+            ).values_list("grant_on", "page__node__path", "user_id", "group_id")
+        ]
+        paths = TreeNode.objects.filter(site_id=site_id).values_list("path", flat=True)
+        return cls(
+            restrictions,
+            [path for path in paths if not any(perm.contains(path) for perm, _, _ in restrictions)],
+        )
+
+    def get_audience(self, path: str) -> list[tuple[int | None, int | None]]:
+        """Returns the user and group ids of the restrictions of the node path."""
+        return [(user_id, group_id) for perm, user_id, group_id in self.restrictions if perm.contains(path)]
+
+
+def _get_view_restrictions_key(site_id: int) -> str:
+    return f"djangocms_rest:permissions:view_restrictions:{site_id}"
+
+
+def get_permission_version() -> int:
+    """
+    Returns the current permission version. It changes whenever view restrictions may have
+    changed, e.g., to validate responses filtered by them.
+    """
+    version = cache.get(PERMISSION_VERSION_KEY)
+    if version is None:
+        version = clear_permission_cache()
+    return version
+
+
+def get_view_restrictions(site_id: int) -> ViewRestrictions:
+    """
+    Returns the view restrictions of the site. They are loaded once per permission version
+    and shared through the cache and by all requests of the process.
+    """
+    key = _get_view_restrictions_key(site_id)
+    values = cache.get_many([PERMISSION_VERSION_KEY, key])
+    version = values.get(PERMISSION_VERSION_KEY)
+    if version is None:
+        version = clear_permission_cache()
+    with _view_restrictions_lock:
+        local = _view_restrictions.get(site_id)
+    if local and local[0] == version:
+        return local[1]
+    entry = values.get(key)
+    if entry and entry[0] == version:
+        restrictions = entry[1]
+    else:
+        restrictions = ViewRestrictions.load(site_id)
+        cache.set(key, (version, restrictions), None)
+    with _view_restrictions_lock:
+        _view_restrictions[site_id] = (version, restrictions)
+    return restrictions
+
+
+class PermissionEvaluator:
+    """
+    Evaluates the view permissions of a user for a site's pages like ``user_can_view_page``
+    and ``get_visible_nodes`` do, but from the site's (cached) view restrictions. Anonymous
+    users are checked against the paths of the unrestricted pages only.
+    """
+
+    def __init__(self, user, site):
+        self.user = user
+        self.site = site
+        public_for = get_cms_setting("PUBLIC_FOR")
+        self.can_see_unrestricted = public_for == "all" or (public_for == "staff" and user.is_staff)
+        self._restrictions = None
+        self._group_ids = None
+        self._can_view_all = None
+
+    @property
+    def restrictions(self) -> ViewRestrictions:
+        if self._restrictions is None:
+            self._restrictions = get_view_restrictions(self.site.pk)
+        return self._restrictions
+
+    @property
+    def group_ids(self) -> frozenset:
+        if self._group_ids is None:
+            self._group_ids = frozenset(self.user.groups.values_list("pk", flat=True))
+        return self._group_ids
+
+    @property
+    def can_view_all(self) -> bool:
+        if self._can_view_all is None:
+            self._can_view_all = user_can_view_all_pages(self.user, self.site)
+        return self._can_view_all
+
+    def can_view(self, page: Page) -> bool:
+        if self.user.is_superuser:
+            return True
+        if not get_cms_setting("PERMISSION"):
+            return self.can_see_unrestricted
+        if not self.user.is_authenticated:
+            return self.can_see_unrestricted and page.node.path in self.restrictions.unrestricted_paths
+
+        audience = self.restrictions.get_audience(page.node.path)
+        if not audience:
+            return self.can_see_unrestricted or self.can_view_all
+        if self.can_view_all:
+            return True
+        if any(user_id == self.user.pk or group_id in self.group_ids for user_id, group_id in audience):
+            return True
+        return user_can_change_page(self.user, page, self.site)
+
+    def can_view_audience(self, audience) -> bool:
+        """
+        Returns whether the user can view a page whose view restrictions have the audience
+        (see ``ViewRestrictions.get_audience``), e.g., as recorded when the page was deleted.
+        Unlike ``can_view``, the user's permission to change the page is not considered.
+        """
+        if self.user.is_superuser:
+            return True
+        if not get_cms_setting("PERMISSION"):
+            return self.can_see_unrestricted
+        if not self.user.is_authenticated:
+            return self.can_see_unrestricted and not audience
+        if not audience:
+            return self.can_see_unrestricted or self.can_view_all
+        if self.can_view_all:
+            return True
+        return any(user_id == self.user.pk or group_id in self.group_ids for user_id, group_id in audience)
+
+    def filter(self, pages) -> list[Page]:
+        """Returns the pages the user can view."""
+        return [page for page in pages if self.can_view(page)]
+
+
+def get_permission_evaluator(request, site) -> PermissionEvaluator:
+    """Returns the permission evaluator of the request, creating it on first use."""
+    try:
+        evaluator = request._djangocms_rest_permission_evaluator
+    except AttributeError:
+        evaluator = None
+    if evaluator is None or evaluator.site.pk != site.pk:
+        evaluator = request._djangocms_rest_permission_evaluator = PermissionEvaluator(request.user, site)
+    return evaluator
+
+
+@receiver(post_save, sender=PagePermission, dispatch_uid="djangocms_rest_permissions_page_permission_saved")
+@receiver(post_delete, sender=PagePermission, dispatch_uid="djangocms_rest_permissions_page_permission_deleted")
+@receiver(post_save, sender=Page, dispatch_uid="djangocms_rest_permissions_page_saved")
+@receiver(post_delete, sender=Page, dispatch_uid="djangocms_rest_permissions_page_deleted")
+@receiver(page_moved, dispatch_uid="djangocms_rest_permissions_page_moved")
+@receiver(post_obj_operation, dispatch_uid="djangocms_rest_permissions_obj_operation")
+def clear_permission_cache(**kwargs):
+    """
+    Invalidates the cached view restrictions. Connected to the signals sent when page
+    permissions or pages are changed, when pages are moved (see ``send_page_moved``), and
+    after page operations in the admin: Moves change the node paths the restrictions are
+    stored by, so that moved pages would lose their restrictions.
+    """
+    version = int(time.time() * 1000000)
+    cache.set(PERMISSION_VERSION_KEY, version, None)
+    return version
@@ -0,0 +1,64 @@
+import json
+import re
+import secrets
+from functools import partial
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+from djangocms_rest.timing import get_timer
+
+
+class RawJSON(bytes):
+    """
+    JSON-encoded data. The ``JSONRenderer`` writes it into responses as is, i.e.,
+    without decoding and re-encoding it.
+    """
+
+    @classmethod
+    def dumps(cls, data) -> "RawJSON":
+        """Encodes the data the way the ``JSONRenderer`` does by default."""
+        return cls(JSONRenderer().render(data))
+
+    def loads(self):
+        return json.loads(self)
+
+
+class RawJSONEncoder(encoders.JSONEncoder):
+    """
+    Encodes ``RawJSON`` instances as numbered sentinel strings and collects them in
+    ``fragments`` to be spliced into the output afterwards. The sentinels contain a
+    random ``token``: Strings of the data cannot match them.
+    """
+
+    def __init__(self, *args, fragments, token, **kwargs):
+        self.fragments = fragments
+        self.token = token
+        super().__init__(*args, **kwargs)
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            self.fragments.append(obj)
+            return f"\x00rawjson:{self.token}:{len(self.fragments) - 1}"
+        return super().default(obj)
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer which splices ``RawJSON`` data, e.g., cached placeholder contents,
+    into its output.
+    """
+
+    #: Views may pass ``RawJSON`` data to this renderer
+    raw_json = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        fragments = []
+        token = secrets.token_hex(8)
+        self.encoder_class = partial(RawJSONEncoder, fragments=fragments, token=token)
+        with get_timer((renderer_context or {}).get("request")).phase("json"):
+            ret = super().render(data, accepted_media_type, renderer_context)
+            if fragments:
+                pattern = re.compile(rb'"\\u0000rawjson:' + token.encode() + rb':(\d+)"')
+                ret = pattern.sub(lambda match: fragments[int(match[1])], ret)
+        return ret
@@ -1,9 +1,28 @@
+from __future__ import annotations
+
+from operator import attrgetter
+
 from django.db import models
-from django.urls import reverse
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 
-from djangocms_rest.serializers.placeholder import PlaceholderRelationFieldSerializer
+from djangocms_rest.serializers.placeholder import (
+    PlaceholderRelationFieldSerializer,
+    PlaceholderRenderer,
+    get_declared_slots,
+)
+from djangocms_rest.utils import get_url_builder
+
+
+def get_page_placeholders(page_content) -> list:
+    """Returns the placeholders of the page content that are declared in its template."""
+    declared_slots = get_declared_slots(page_content)
+    return [
+        placeholder
+        for placeholder in page_content.get_placeholders()
+        if placeholder.slot in declared_slots
+    ]
 
 
 class PageTreeSerializer(serializers.ListSerializer):
@@ -13,9 +32,9 @@ class PageTreeSerializer(serializers.ListSerializer):
 
     def tree_to_representation(self, item):
         repr = self.child.to_representation(item)
-        if item.page.node in self.tree:
+        if item.page.node_id in self.tree:
             repr["children"] = [
-                self.tree_to_representation(child) for child in self.tree[item.page.node]
+                self.tree_to_representation(child) for child in self.tree[item.page.node_id]
             ]
         return repr
 
@@ -55,62 +74,138 @@ class PageContentSerializer(serializers.Serializer):
         child=serializers.CharField(), allow_empty=True, required=False
     )
 
-    def __init__(self, request: Request, *args, **kwargs) -> None:
+    #: Fields of the representation in their order
+    representation_fields = (
+        "title",
+        "page_title",
+        "menu_title",
+        "meta_description",
+        "redirect",
+        "placeholders",
+        "in_navigation",
+        "soft_root",
+        "template",
+        "xframe_options",
+        "limit_visibility_in_menu",
+        "language",
+        "absolute_url",
+        "path",
+        "is_home",
+        "languages",
+    )
+
+    def __init__(
+        self,
+        request: Request,
+        *args,
+        expand_placeholders: bool = False,
+        fields=None,
+        placeholder_contents: dict | None = None,
+        **kwargs,
+    ) -> None:
         self.request = request
+        self.url_builder = get_url_builder(request)
+        self.expand_placeholders = expand_placeholders
+        # Contents rendered beforehand by placeholder pk, e.g., concurrently by an async view
+        self.placeholder_contents = placeholder_contents
+        # Only the requested fields are computed: A field is either computed by a
+        # ``get_<field>`` method or an attribute of the page content
+        self.getters = [
+            (name, getattr(self, f"get_{name}", None) or attrgetter(name))
+            for name in self.representation_fields
+            if fields is None or name in fields
+        ]
         super().__init__(*args, **kwargs)
 
     @classmethod
     def many_init(cls, request, instances, *args, **kwargs):
-        kwargs['child'] = cls(request)
+        kwargs['child'] = cls(request, fields=kwargs.pop("fields", None))
         if kwargs.pop("as_tree", True):
             tree = {}
             for instance in instances:
-                if instance.page.node.parent in tree:
-                    tree[instance.page.node.parent].append(instance)
-                else:
-                    tree[instance.page.node.parent] = [instance]
+                tree.setdefault(instance.page.node.parent_id, []).append(instance)
             return PageTreeSerializer(tree, *args, **kwargs)
         return serializers.ListSerializer(instances, *args, **kwargs)
 
-    def to_representation(self, page_content):
-        declared_slots = [
-            placeholder.slot
-            for placeholder in page_content.page.get_declared_placeholders()
-        ]
-        placeholders = [
-            placeholder
-            for placeholder in page_content.page.get_placeholders(page_content.language)
-            if placeholder.slot in declared_slots
-        ]
+    @classmethod
+    def get_requested_fields(cls, request: Request):
+        """
+        Returns the set of fields requested with the ``?fields=<field>,...`` and
+        ``?omit=<field>,...`` query parameters, or ``None`` if all fields are requested.
+        """
+        fields = {
+            param: set(filter(None, request.GET[param].split(",")))
+            for param in ("fields", "omit")
+            if param in request.GET
+        }
+        for param, names in fields.items():
+            unknown = names.difference(cls.representation_fields)
+            if unknown:
+                raise ValidationError({param: f"Unknown fields: {', '.join(sorted(unknown))}."})
+        if not fields:
+            return None
+        return fields.get("fields", set(cls.representation_fields)) - fields.get("omit", set())
 
-        return {
-            "title": page_content.title,
-            "page_title": page_content.page_title or page_content.title,
-            "menu_title": page_content.menu_title or page_content.title,
-            "meta_description": page_content.meta_description,
-            "redirect": page_content.redirect,
-            "placeholders": PlaceholderRelationFieldSerializer(
-                self.request,
-                page_content,
+    def expand(self, page_content, placeholders, urls):
+        """
+        Returns the rendered content of all placeholders by slot. All placeholders are
+        rendered together, i.e. with one cache read and one batch of plugin queries.
+        """
+        for placeholder in placeholders:
+            placeholder.page = page_content.page
+        if self.placeholder_contents is not None:
+            contents = self.placeholder_contents
+        else:
+            contents = PlaceholderRenderer(self.request).render_placeholders(
                 placeholders,
-                page_content.language,
-            ).data,
-            "in_navigation": page_content.in_navigation,
-            "soft_root": page_content.soft_root,
-            "template": page_content.template,
-            "xframe_options": page_content.xframe_options,
-            "limit_visibility_in_menu": page_content.limit_visibility_in_menu,
-            "language": page_content.language,
-            "absolute_url": page_content.page.get_absolute_url(
-                page_content.language
-            ),
-            "path": f"{self.request.scheme}://{self.request.get_host()}" + reverse(
-                "cms-page-root",
-                args=(page_content.language,)
-            ) if page_content.page.is_home else f"{self.request.scheme}://{self.request.get_host()}" + reverse(
-                "cms-page-detail",
-                args=(page_content.language, page_content.page.get_path(page_content.language),)
-            ),
-            "is_home": page_content.page.is_home,
-            "languages": page_content.page.languages.split(","),
+                context={},
+                language=page_content.language,
+                use_cache=True,
+            )
+        return {
+            placeholder.slot: {
+                "slot": placeholder.slot,
+                "label": placeholder.get_label(),
+                "language": page_content.language,
+                "content": contents[placeholder.pk],
+                "details": urls[placeholder.slot],
+            }
+            for placeholder in placeholders
         }
+
+    def get_page_title(self, page_content):
+        return page_content.page_title or page_content.title
+
+    def get_menu_title(self, page_content):
+        return page_content.menu_title or page_content.title
+
+    def get_placeholders(self, page_content):
+        placeholders = get_page_placeholders(page_content)
+        placeholder_urls = PlaceholderRelationFieldSerializer(
+            self.request,
+            page_content,
+            placeholders,
+            page_content.language,
+        ).data
+        if self.expand_placeholders:
+            return self.expand(page_content, placeholders, placeholder_urls)
+        return placeholder_urls
+
+    def get_absolute_url(self, page_content):
+        return page_content.page.get_absolute_url(page_content.language)
+
+    def get_path(self, page_content):
+        if page_content.page.is_home:
+            return self.url_builder.build("cms-page-root", page_content.language)
+        return self.url_builder.build(
+            "cms-page-detail", page_content.language, page_content.page.get_path(page_content.language)
+        )
+
+    def get_is_home(self, page_content):
+        return page_content.page.is_home
+
+    def get_languages(self, page_content):
+        return page_content.page.languages.split(",")
+
+    def to_representation(self, page_content):
+        return {name: getter(page_content) for name, getter in self.getters}
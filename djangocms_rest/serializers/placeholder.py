@@ -1,81 +1,350 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
 import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-from cms.cache.placeholder import (
-    _get_placeholder_cache_key,
-    _get_placeholder_cache_version_key,
-)
-from cms.models import Placeholder
+from asgiref.sync import sync_to_async
+from cms.cache.placeholder import _get_placeholder_cache_version_key
+from cms.models import CMSPlugin, Placeholder
 from cms.plugin_rendering import BaseRenderer, ContentRenderer
 from cms.utils.conf import get_cms_setting
-from cms.utils.plugins import get_plugins
+from cms.utils.helpers import get_header_name, get_timezone_name
+from cms.utils.placeholder import get_declared_placeholders_for_obj
+from cms.utils.plugins import assign_plugins, get_plugins
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
-from django.db import models
-from django.template.defaulttags import now
-from django.urls import reverse
+from django.db import close_old_connections, connections, models, transaction
+from django.db.models import Count, Max
+from django.dispatch import receiver
+from django.utils.autoreload import file_changed
+from django.utils.timezone import now
 from rest_framework import serializers
 from rest_framework.request import Request
 from sekizai.context import SekizaiContext
 from sekizai.helpers import get_varname
 
+from djangocms_rest.cache import get_local_cache
+from djangocms_rest.renderers import RawJSON
+from djangocms_rest.serializers.plugins import (
+    BasePluginSerializer,
+    get_compiled_plugin_serializer,
+    get_plugin_serializer,
+)
+from djangocms_rest.timing import get_timer
+from djangocms_rest.utils import get_url_builder
+
+
+#: Seconds between two cache reads of a worker waiting for another worker to rebuild a cache entry
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+#: Cache entry with a soft expiry (a timestamp) after which the content is stale
+StaleableCacheEntry = namedtuple("StaleableCacheEntry", ("content", "expires"))
+
+logger = logging.getLogger(__name__)
 
-def _get_placeholder_cache_version(placeholder, lang, site_id):
+_refresh_executor = None
+_render_executor = None
+_render_worker = threading.local()
+
+
+_declared_slots = {}
+
+
+def get_declared_slots(obj) -> tuple:
     """
-    Gets the (placeholder x lang)'s current version and vary-on header-names
-    list, if present, otherwise resets to («timestamp», []).
+    Returns the slots of the placeholders declared in the object's template. The slots are
+    determined once per template and process.
     """
-    from django.core.cache import cache
+    if obj is None:
+        return ()
+    if not hasattr(obj, "get_template"):
+        get_declared_placeholders_for_obj(obj)  # raises NotImplementedError
+    template = obj.get_template()
+    try:
+        return _declared_slots[template]
+    except KeyError:
+        slots = tuple(placeholder.slot for placeholder in get_declared_placeholders_for_obj(obj))
+        _declared_slots[template] = slots
+        return slots
+
+
+@receiver(file_changed, dispatch_uid="djangocms_rest_declared_slots")
+def clear_declared_slots(sender, file_path, **kwargs):
+    """Forgets the declared slots if the development server's autoreloader detects a template change."""
+    if file_path.suffix != ".py":
+        _declared_slots.clear()
+
+
+def get_refresh_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool which refreshes stale placeholder cache entries. Its size is
+    set by the ``DJANGOCMS_REST_REFRESH_WORKERS`` setting (default: 2).
+    """
+    global _refresh_executor
 
-    key = _get_placeholder_cache_version_key(placeholder, lang, site_id) + ":rest"
-    cached = cache.get(key)
-    if cached:
-        version, vary_on_list = cached
-    else:
-        version = int(time.time() * 1000000)
-        vary_on_list = []
-        _set_placeholder_cache_version(
-            placeholder, lang, site_id, version, vary_on_list
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "DJANGOCMS_REST_REFRESH_WORKERS", 2),
+            thread_name_prefix="djangocms-rest-refresh",
         )
-    return version, vary_on_list
+    return _refresh_executor
+
+
+def get_render_executor() -> ThreadPoolExecutor | None:
+    """
+    Returns the thread pool which renders placeholders missing from the cache concurrently,
+    or ``None`` if they are rendered one after another. Its size is set by the
+    ``DJANGOCMS_REST_RENDER_WORKERS`` setting (default: 0, disabled).
+    """
+    global _render_executor
+
+    max_workers = getattr(settings, "DJANGOCMS_REST_RENDER_WORKERS", 0)
+    if not max_workers:
+        return None
+    if _render_executor is None or _render_executor._max_workers != max_workers:
+        if _render_executor is not None:
+            _render_executor.shutdown(wait=False)
+        _render_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="djangocms-rest-render")
+    return _render_executor
+
 
+def can_render_concurrently() -> bool:
+    """
+    Returns ``False`` inside transactions (e.g., in tests): Other threads use their own
+    database connections and would not see the transaction's changes. Also returns ``False``
+    in render workers, which must not wait for other render workers.
+    """
+    if getattr(_render_worker, "active", False):
+        return False
+    return not any(connection.in_atomic_block for connection in connections.all(initialized_only=True))
 
-def _set_placeholder_cache_version(
-    placeholder, lang, site_id, version, vary_on_list=None, duration=None
-):
+
+class PlaceholderCacheVersions(dict):
+    """
+    Placeholder cache versions by placeholder pk, kept by a renderer from its cache lookup
+    to the cache write. ``unsaved`` holds the pks of versions created by the lookup which
+    are written with the contents.
     """
-    Sets the (placeholder x lang)'s version and vary-on header-names list.
+
+    def __init__(self):
+        super().__init__()
+        self.unsaved = set()
+
+
+def _get_placeholder_cache_versions(placeholders, lang, site_id, versions=None):
+    """
+    Gets the current versions and vary-on header-names lists of all (placeholder x lang)
+    pairs by placeholder pk with a single cache read. Missing versions are reset to
+    («timestamp», []) with a single cache write.
+
+    Versions already in ``versions`` (``PlaceholderCacheVersions``) are not read again,
+    the others are added to it. Missing versions are not written then but marked unsaved:
+    ``set_placeholder_rest_cache_many`` writes them with the contents.
+
+    These are django CMS's placeholder cache versions: Invalidating a placeholder's
+    cache in django CMS also invalidates its REST cache entries.
     """
     from django.core.cache import cache
 
-    key = _get_placeholder_cache_version_key(placeholder, lang, site_id) + ":rest"
+    result = {
+        placeholder.pk: versions[placeholder.pk]
+        for placeholder in placeholders
+        if versions is not None and placeholder.pk in versions
+    }
+    keys = {
+        _get_placeholder_cache_version_key(placeholder, lang, site_id): placeholder.pk
+        for placeholder in placeholders
+        if placeholder.pk not in result
+    }
+    if not keys:
+        return result
+    cached = cache.get_many(keys)
+    result.update({keys[key]: value for key, value in cached.items() if value})
+    missing = {key: (int(time.time() * 1000000), []) for key in keys if not cached.get(key)}
+    if missing:
+        if versions is None:
+            cache.set_many(missing, None)
+        else:
+            versions.unsaved.update(keys[key] for key in missing)
+        result.update({keys[key]: value for key, value in missing.items()})
+    if versions is not None:
+        versions.update({pk: result[pk] for pk in keys.values()})
+    return result
 
-    if not version or version < 1:
-        version = int(time.time() * 1000000)
 
-    if vary_on_list is None:
-        vary_on_list = []
+def _save_placeholder_cache_versions(placeholders, lang, site_id, versions) -> None:
+    """Writes the unsaved versions of the placeholders (see ``PlaceholderCacheVersions``)."""
+    from django.core.cache import cache
 
-    cache.set(key, (version, vary_on_list), duration)
+    unsaved = [placeholder for placeholder in placeholders if placeholder.pk in versions.unsaved]
+    if unsaved:
+        cache.set_many({
+            _get_placeholder_cache_version_key(placeholder, lang, site_id): versions[placeholder.pk]
+            for placeholder in unsaved
+        }, None)
+        versions.unsaved.difference_update(placeholder.pk for placeholder in unsaved)
 
 
-def set_placeholder_rest_cache(placeholder, lang, site_id, content, request):
+def _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list):
     """
-    Sets the (correct) placeholder cache with the rendered placeholder.
+    Returns the cache key for the placeholder's REST content of the given version
+    respecting the vary-on header-names. This is the key django CMS uses for the
+    rendered placeholder with a ":rest" suffix.
+    """
+    prefix = get_cms_setting("CACHE_PREFIX")
+    tz = get_timezone_name()
+    cache_key = f"{prefix}|render_placeholder|id:{placeholder.pk}|lang:{lang}|site:{site_id}|tz:{tz}|v:{version}"
+
+    sub_key_list = []
+    for key in vary_on_list:
+        value = request.META.get(get_header_name(key)) or "_"
+        sub_key_list.append(key + ":" + value)
+    if sub_key_list:
+        cache_key += "|" + "|".join(sub_key_list)
+
+    if len(cache_key) > 200:
+        # Same as django CMS: Leave room for django's key version suffix
+        cache_key = f"{prefix}|{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}"
+    return cache_key + ":rest"
+
+
+def set_placeholder_rest_cache_many(contents, lang, site_id, request, versions=None):
+    """
+    Sets the (correct) placeholder caches with the rendered placeholders. ``contents`` maps
+    placeholders to their rendered content. The contents and the "touched" cache versions
+    are written with one cache write per cache duration (usually just one).
+
+    The versions the renderer's cache lookup has read (``versions``, see
+    ``PlaceholderCacheVersions``) are not read again. Of these, only unsaved ones and ones
+    whose vary-on header-names changed are written: Touching them could revert an
+    invalidation which happened while the contents were rendered.
+
+    The contents are stored JSON-encoded (as ``RawJSON``). If the
+    ``DJANGOCMS_REST_STALE_WHILE_REVALIDATE`` setting is a number of seconds, the contents
+    are kept that much longer than their cache duration and marked stale after it. The
+    soft expiry is also recorded if the local cache is enabled: Processes filling their
+    local cache from the shared entries keep them no longer than the shared cache does.
     """
     from django.core.cache import cache
 
-    key = _get_placeholder_cache_key(placeholder, lang, site_id, request) + ":rest"
+    grace = getattr(settings, "DJANGOCMS_REST_STALE_WHILE_REVALIDATE", 0)
+    local_cache = get_local_cache()
+    current = _get_placeholder_cache_versions(contents, lang, site_id, versions)
+    entries_by_duration = defaultdict(dict)
+    for placeholder, content in contents.items():
+        version, stored_vary_on_list = current[placeholder.pk]
+        vary_on_list = placeholder.get_vary_cache_on(request)
+        duration = min(
+            get_cms_setting("CACHE_DURATIONS")["content"],
+            placeholder.get_cache_expiration(request, now()),
+        )
+        if not isinstance(content, RawJSON):
+            content = RawJSON.dumps(content)
+        if (grace or local_cache is not None) and duration > 0:
+            content = StaleableCacheEntry(content, time.time() + duration)
+            duration += grace
+        entries = entries_by_duration[duration]
+        entries[
+            _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list)
+        ] = content
+        if versions is None or placeholder.pk in versions.unsaved or vary_on_list != stored_vary_on_list:
+            # "touch" the cache-version, so that it stays as fresh as this content.
+            entries[_get_placeholder_cache_version_key(placeholder, lang, site_id)] = (version, vary_on_list)
+            if versions is not None:
+                versions.unsaved.discard(placeholder.pk)
+                versions[placeholder.pk] = (version, vary_on_list)
+
+    for duration, entries in entries_by_duration.items():
+        cache.set_many(entries, duration)
+        if local_cache is not None and duration > 0:
+            local_cache.set_many(
+                {key: value for key, value in entries.items() if key.endswith(":rest")}, ttl=duration
+            )
+
+
+def _get_placeholder_rest_cache_keys(placeholders, lang, site_id, request, versions=None):
+    """Returns the current REST cache keys of the placeholders by placeholder pk."""
+    versions = _get_placeholder_cache_versions(placeholders, lang, site_id, versions)
+    return {
+        placeholder.pk: _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, *versions[placeholder.pk])
+        for placeholder in placeholders
+    }
+
+
+def get_placeholder_rest_cache_entries(placeholders, lang, site_id, request, versions=None):
+    """
+    Returns the cached, JSON-encoded contents (``RawJSON``) of several placeholders and
+    whether they are stale as ``(content, stale)`` pairs by placeholder pk. Versions and
+    contents are read with one cache read each. Placeholders without a cache entry are omitted.
+    The versions read are kept in ``versions`` (see ``PlaceholderCacheVersions``), if given.
+
+    Contents are read from the process's local cache (see ``get_local_cache``) first, if
+    enabled. Only the versions and the contents missing locally are read from the cache.
+    Shared contents are kept locally for the rest of their lifetime in the shared cache
+    (contents without a recorded expiry are not kept locally).
+    """
+    from django.core.cache import cache
+
+    keys = {
+        key: pk
+        for pk, key in _get_placeholder_rest_cache_keys(placeholders, lang, site_id, request, versions).items()
+    }
+    if not keys:
+        return {}
+    local_cache = get_local_cache()
+    if local_cache is not None:
+        # The keys contain the cache versions: Local entries are as valid as shared ones
+        cached = local_cache.get_many(keys)
+        missing = [key for key in keys if key not in cached]
+        if missing:
+            shared = cache.get_many(missing)
+            grace = getattr(settings, "DJANGOCMS_REST_STALE_WHILE_REVALIDATE", 0)
+            timestamp = time.time()
+            for key, content in shared.items():
+                if isinstance(content, StaleableCacheEntry) and content.expires + grace > timestamp:
+                    local_cache.set_many({key: content}, ttl=content.expires + grace - timestamp)
+            cached.update(shared)
+    else:
+        cached = cache.get_many(keys)
+    entries = {}
+    timestamp = time.time()
+    for key, content in cached.items():
+        if isinstance(content, StaleableCacheEntry):
+            entries[keys[key]] = (content.content, content.expires <= timestamp)
+        else:
+            entries[keys[key]] = (content, False)
+    return entries
 
-    duration = min(
-        get_cms_setting("CACHE_DURATIONS")["content"],
-        placeholder.get_cache_expiration(request, now()),
-    )
-    cache.set(key, content, duration)
-    # "touch" the cache-version, so that it stays as fresh as this content.
-    version, vary_on_list = _get_placeholder_cache_version(placeholder, lang, site_id)
-    _set_placeholder_cache_version(
-        placeholder, lang, site_id, version, vary_on_list, duration=duration
-    )
+
+def get_placeholder_rest_cache_many(placeholders, lang, site_id, request):
+    """
+    Returns the cached contents of several placeholders by placeholder pk respecting
+    the placeholders' VARY headers. Versions and contents are read with one cache read
+    each. Placeholders without a cache entry are omitted.
+    """
+    return {
+        pk: _loads(content)
+        for pk, (content, _) in get_placeholder_rest_cache_entries(placeholders, lang, site_id, request).items()
+    }
+
+
+def _loads(content):
+    # Entries written before contents were stored JSON-encoded are returned as they are
+    return content.loads() if isinstance(content, RawJSON) else content
+
+
+def set_placeholder_rest_cache(placeholder, lang, site_id, content, request):
+    """
+    Sets the (correct) placeholder cache with the rendered placeholder.
+    """
+    set_placeholder_rest_cache_many({placeholder: content}, lang, site_id, request)
 
 
 def get_placeholder_rest_cache(placeholder, lang, site_id, request):
@@ -83,14 +352,82 @@ def get_placeholder_rest_cache(placeholder, lang, site_id, request):
     Returns the placeholder from cache respecting the placeholder's
     VARY headers.
     """
+    return get_placeholder_rest_cache_many([placeholder], lang, site_id, request).get(placeholder.pk)
+
+
+def lock_placeholder_rest_cache(placeholders, lang, site_id, request, timeout, versions=None):
+    """
+    Tries to acquire the rebuild locks of the placeholders' REST cache entries. Returns
+    the keys of the acquired locks by placeholder pk and the keys of the cache entries and
+    the locks held by other workers by placeholder pk. Locks expire after ``timeout``
+    seconds, should their holder never release them.
+
+    Unsaved ``versions`` (see ``PlaceholderCacheVersions``) are written first: Other
+    workers wait for entries of the same versions.
+    """
+    from django.core.cache import cache
+
+    if versions is not None:
+        _get_placeholder_cache_versions(placeholders, lang, site_id, versions)
+        _save_placeholder_cache_versions(placeholders, lang, site_id, versions)
+    acquired, held = {}, {}
+    for pk, key in _get_placeholder_rest_cache_keys(placeholders, lang, site_id, request, versions).items():
+        lock_key = key + ":lock"
+        if cache.add(lock_key, True, timeout):
+            acquired[pk] = lock_key
+        else:
+            held[pk] = (key, lock_key)
+    return acquired, held
+
+
+def unlock_placeholder_rest_cache(lock_keys):
+    """Releases rebuild locks acquired with ``lock_placeholder_rest_cache``."""
     from django.core.cache import cache
 
-    key = (
-        _get_placeholder_cache_key(placeholder, lang, site_id, request, soft=True)
-        + ":rest"
+    if lock_keys:
+        cache.delete_many(lock_keys)
+
+
+def wait_for_placeholder_rest_cache(held, wait):
+    """
+    Waits up to ``wait`` seconds for other workers to rebuild the REST cache entries of
+    placeholders whose rebuild locks they hold (as returned by ``lock_placeholder_rest_cache``).
+    Returns the rebuilt, JSON-encoded contents by placeholder pk. Placeholders whose lock has been released
+    or has expired without a cache entry having been written are omitted right away.
+    """
+    from django.core.cache import cache
+
+    contents = {}
+    deadline = time.monotonic() + wait
+    while held:
+        keys = [key for pair in held.values() for key in pair]
+        cached = cache.get_many(keys)
+        for pk, (key, lock_key) in list(held.items()):
+            if key in cached:
+                content = cached[key]
+                contents[pk] = content.content if isinstance(content, StaleableCacheEntry) else content
+                del held[pk]
+            elif lock_key not in cached:
+                # The lock holder gave up
+                del held[pk]
+        if not held or time.monotonic() >= deadline:
+            break
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+    return contents
+
+
+def get_placeholder_validators(placeholders, lang, site_id):
+    """
+    Returns values which change whenever the rendered content of the placeholders
+    changes: the placeholder cache versions the REST cache keys are built upon, and the
+    number and the latest change of the placeholders' plugins.
+    """
+    versions = _get_placeholder_cache_versions(placeholders, lang, site_id)
+    versions = tuple(versions[placeholder.pk][0] for placeholder in placeholders)
+    plugins = CMSPlugin.objects.filter(placeholder__in=placeholders, language=lang).aggregate(
+        count=Count("pk"), changed_date=Max("changed_date")
     )
-    content = cache.get(key)
-    return content
+    return versions, plugins["count"], plugins["changed_date"]
 
 
 class PlaceholderRenderer(BaseRenderer):
@@ -98,6 +435,15 @@ class PlaceholderRenderer(BaseRenderer):
     The `PlaceholderRenderer` class is a custom renderer that renders a placeholder object.
     """
 
+    def __init__(self, request):
+        super().__init__(request)
+        self._plugin_serializers = {}
+        self.timer = get_timer(request)
+        # Return cached contents JSON-encoded if the response renderer can splice them in
+        self.raw_json = getattr(getattr(request, "accepted_renderer", None), "raw_json", False)
+        # The cache versions read by the cache lookup by language and site
+        self._cache_versions = defaultdict(PlaceholderCacheVersions)
+
     def placeholder_cache_is_enabled(self):
         if not get_cms_setting("PLACEHOLDER_CACHE"):
             return False
@@ -106,51 +452,240 @@ class PlaceholderRenderer(BaseRenderer):
         return True
 
     def render_placeholder(self, placeholder, context, language, use_cache=False):
+        return self.render_placeholders([placeholder], context, language, use_cache)[placeholder.pk]
+
+    def render_placeholders(self, placeholders, context, language, use_cache=False, site_id=None) -> dict:
+        """
+        Renders several placeholders at once and returns their contents by placeholder pk.
+        Cached contents are read with a single cache access, the plugins of all other
+        placeholders are fetched in one batch, and the new contents are cached with a
+        single cache write.
+
+        If the ``DJANGOCMS_REST_RENDER_WORKERS`` setting is set, placeholders missing from
+        the cache are rendered concurrently by a thread pool of that size (see
+        ``can_render_concurrently``) and merged in the order of the placeholders.
+
+        If the ``DJANGOCMS_REST_SINGLE_FLIGHT`` setting is ``True``, only one worker at a
+        time rebuilds a missing cache entry. Other workers wait for up to
+        ``DJANGOCMS_REST_SINGLE_FLIGHT_WAIT`` seconds (default: 2) for the entry and only
+        render the placeholder themselves if it does not appear in time.
+
+        Stale cache entries (see ``set_placeholder_rest_cache_many``) are returned as they
+        are and refreshed in the background. Cached contents are returned JSON-encoded
+        (as ``RawJSON``) if the request's renderer can write them into the response as is.
+
+        The contents are cached for the site ``site_id``, by default the request's current
+        site (which follows the ``SITE_ID`` setting if it is set).
+        """
         context.update({"request": self.request})
-        if use_cache and placeholder.cache_placeholder:
-            use_cache = self.placeholder_cache_is_enabled()
+        use_cache = use_cache and self.placeholder_cache_is_enabled()
+        if site_id is None:
+            site_id = get_current_site(self.request).pk
+
+        contents = self.get_cached_contents(placeholders, language, site_id) if use_cache else {}
+        missing = [placeholder for placeholder in placeholders if placeholder.pk not in contents]
+        executor = get_render_executor()
+        if executor and len(missing) > 1 and can_render_concurrently():
+            # Each worker renders a share of the placeholders (with one batch of plugin queries)
+            workers = min(executor._max_workers, len(missing))
+            futures = [
+                executor.submit(
+                    self._render_in_thread, missing[i::workers], context, language, site_id, use_cache
+                )
+                for i in range(workers)
+            ]
+            rendered = {}
+            for future in futures:
+                rendered.update(future.result())
+            contents.update((placeholder.pk, rendered[placeholder.pk]) for placeholder in missing)
         else:
-            use_cache = False
-
-        if use_cache:
-            cached_value = get_placeholder_rest_cache(
-                placeholder,
+            contents.update(self.render_missing(missing, context, language, site_id, use_cache))
+        return contents
+
+    async def arender_placeholders(self, placeholders, context, language, use_cache=False) -> dict:
+        """
+        Async variant of ``render_placeholders``: The cached contents are read with a single
+        cache access, all other placeholders are rendered concurrently, each in a worker
+        thread with its own database connection (in the render thread pool if
+        ``DJANGOCMS_REST_RENDER_WORKERS`` is set). Inside transactions, they are rendered one
+        after another in the request's thread.
+        """
+
+        def get_cached_contents():
+            context.update({"request": self.request})
+            site_id = get_current_site(self.request).pk
+            if use_cache and self.placeholder_cache_is_enabled():
+                return site_id, True, self.get_cached_contents(placeholders, language, site_id)
+            return site_id, False, {}
+
+        site_id, use_cache, contents = await sync_to_async(get_cached_contents)()
+        missing = [placeholder for placeholder in placeholders if placeholder.pk not in contents]
+        if len(missing) > 1 and await sync_to_async(can_render_concurrently)():
+            results = await asyncio.gather(*(
+                sync_to_async(self._render_in_thread, thread_sensitive=False, executor=get_render_executor())(
+                    [placeholder], context, language, site_id, use_cache
+                )
+                for placeholder in missing
+            ))
+        else:
+            results = [
+                await sync_to_async(self.render_missing)(missing, context, language, site_id, use_cache)
+            ]
+        for result in results:
+            contents.update(result)
+        return {placeholder.pk: contents[placeholder.pk] for placeholder in placeholders}
+
+    def get_cached_contents(self, placeholders, language, site_id) -> dict:
+        """
+        Returns the cached contents of the placeholders by placeholder pk and schedules the
+        refresh of stale ones.
+        """
+        with self.timer.phase("cache-get"):
+            entries = get_placeholder_rest_cache_entries(
+                [placeholder for placeholder in placeholders if placeholder.cache_placeholder],
                 lang=language,
-                site_id=get_current_site(self.request).pk,
+                site_id=site_id,
                 request=self.request,
+                versions=self._cache_versions[language, site_id],
             )
+        self.timer.count("cache-hits", len(entries))
+        self.timer.count("cache-misses", len(placeholders) - len(entries))
+        if self.raw_json:
+            contents = {pk: content for pk, (content, _) in entries.items()}
         else:
-            cached_value = None
-
-        if cached_value is not None:
-            # User has opted to use the cache
-            # and there is something in the cache
-            return cached_value["content"]
-
-        plugin_content = self.render_plugins(
-            placeholder,
-            language=language,
-            context=context,
-        )
-
-        if use_cache:
-            set_placeholder_rest_cache(
-                placeholder,
+            contents = {pk: _loads(content) for pk, (content, _) in entries.items()}
+        stale = [placeholder for placeholder in placeholders if entries.get(placeholder.pk, (None, False))[1]]
+        if stale:
+            self.schedule_refresh(stale, language, site_id)
+        return contents
+
+    def render_missing(self, placeholders, context, language, site_id, use_cache) -> dict:
+        """
+        Renders the placeholders missing from the cache, or waits for other workers
+        rebuilding their cache entries (single-flight).
+        """
+        contents = {}
+        held = {}
+        if use_cache and placeholders and getattr(settings, "DJANGOCMS_REST_SINGLE_FLIGHT", False):
+            locks, held = lock_placeholder_rest_cache(
+                [placeholder for placeholder in placeholders if placeholder.cache_placeholder],
                 lang=language,
-                site_id=get_current_site(self.request).pk,
-                content=plugin_content,
+                site_id=site_id,
                 request=self.request,
+                timeout=getattr(settings, "DJANGOCMS_REST_SINGLE_FLIGHT_TIMEOUT", 10),
+                versions=self._cache_versions[language, site_id],
             )
-
-        if placeholder.pk not in self._rendered_placeholders:
-            # First time this placeholder is rendered
-            self._rendered_placeholders[placeholder.pk] = plugin_content
-
-        return plugin_content
+            try:
+                contents.update(self._render_placeholders(
+                    [placeholder for placeholder in placeholders if placeholder.pk not in held],
+                    context, language, site_id, use_cache,
+                ))
+            finally:
+                unlock_placeholder_rest_cache(list(locks.values()))
+            if held:
+                rebuilt = wait_for_placeholder_rest_cache(held, getattr(settings, "DJANGOCMS_REST_SINGLE_FLIGHT_WAIT", 2))
+                contents.update(rebuilt if self.raw_json else {pk: _loads(content) for pk, content in rebuilt.items()})
+            placeholders = [placeholder for placeholder in placeholders if placeholder.pk not in contents]
+
+        contents.update(self._render_placeholders(placeholders, context, language, site_id, use_cache))
+        return contents
+
+    def _render_in_thread(self, placeholders, context, language, site_id, use_cache) -> dict:
+        """``render_missing`` for worker threads, which manage their own database connections."""
+        _render_worker.active = True
+        close_old_connections()
+        try:
+            return self.render_missing(placeholders, context, language, site_id, use_cache)
+        finally:
+            close_old_connections()
+            _render_worker.active = False
+
+    def schedule_refresh(self, placeholders, language, site_id):
+        """
+        Schedules re-rendering the placeholders into the cache on the refresh thread pool
+        once the current transaction (if any) has been committed. Placeholders whose cache
+        entry is already being rebuilt by another worker are skipped.
+        """
+        locks, _ = lock_placeholder_rest_cache(
+            placeholders,
+            lang=language,
+            site_id=site_id,
+            request=self.request,
+            timeout=getattr(settings, "DJANGOCMS_REST_SINGLE_FLIGHT_TIMEOUT", 10),
+        )
+        placeholders = [placeholder for placeholder in placeholders if placeholder.pk in locks]
+        if placeholders:
+            transaction.on_commit(partial(
+                get_refresh_executor().submit,
+                self.refresh,
+                placeholders,
+                language,
+                site_id,
+                list(locks.values()),
+            ))
+
+    def refresh(self, placeholders, language, site_id, lock_keys):
+        """Re-renders the placeholders into the cache and releases their rebuild locks."""
+        try:
+            # Fresh instances: The request's instances may carry their (outdated) plugins
+            placeholders = Placeholder.objects.filter(pk__in=[placeholder.pk for placeholder in placeholders])
+            PlaceholderRenderer(self.request)._render_placeholders(
+                list(placeholders), {}, language, site_id, use_cache=True
+            )
+        except Exception:
+            logger.exception("Refreshing the placeholder cache failed")
+        finally:
+            unlock_placeholder_rest_cache(lock_keys)
+            connections.close_all()
+
+    def _render_placeholders(self, placeholders, context, language, site_id, use_cache):
+        """Renders the placeholders and caches the contents if ``use_cache`` is ``True``."""
+        self.prefetch_plugins(placeholders, language)
+        contents, rendered = {}, {}
+        for placeholder in placeholders:
+            plugin_content = self.render_plugins(
+                placeholder,
+                language=language,
+                context=context,
+            )
+            if placeholder.pk not in self._rendered_placeholders:
+                # First time this placeholder is rendered
+                self._rendered_placeholders[placeholder.pk] = plugin_content
+            contents[placeholder.pk] = plugin_content
+            # Rendering the plugins might have revealed that the placeholder cannot be cached
+            if placeholder.cache_placeholder:
+                rendered[placeholder] = plugin_content
+
+        if use_cache and rendered:
+            with self.timer.phase("cache-set"):
+                set_placeholder_rest_cache_many(
+                    rendered,
+                    lang=language,
+                    site_id=site_id,
+                    request=self.request,
+                    versions=self._cache_versions[language, site_id],
+                )
+        return contents
+
+    def prefetch_plugins(self, placeholders, language: str) -> None:
+        """
+        Fetches the plugin trees of all given placeholders at once and casts the plugins
+        down to their plugin models with one query per plugin type. Placeholders which
+        already carry their plugins are skipped.
+        """
+        placeholders = [
+            placeholder
+            for placeholder in placeholders
+            if not hasattr(placeholder, "_plugins_cache")
+        ]
+        if placeholders:
+            with self.timer.phase("plugins"):
+                assign_plugins(self.request, placeholders, template=None, lang=language)
 
     def render_plugins(
         self, placeholder: Placeholder, language: str, context: dict
     ) -> list:
+        self.prefetch_plugins([placeholder], language)
         plugins = get_plugins(
             self.request,
             placeholder=placeholder,
@@ -161,50 +696,58 @@ class PlaceholderRenderer(BaseRenderer):
         def render_children(plugins):
             for plugin in plugins:
                 plugin_content = self.render_plugin(plugin, context)
+                if not plugin_content:
+                    continue
                 if getattr(plugin, "child_plugin_instances", None):
-                    plugin_content["children"] = render_children(
+                    plugin_content["children"] = list(render_children(
                         plugin.child_plugin_instances
-                    )
-                if plugin_content:
-                    yield plugin_content
+                    ))
+                yield plugin_content
 
         return list(render_children(plugins))
 
     def render_plugin(self, instance, context):
+        # Plugins fetched by ``prefetch_plugins`` are already downcast: no query here
         instance, plugin = instance.get_plugin_instance()
         if not instance:
             return None
-        if hasattr(instance, "serializer") and issubclass(
-            instance.serializer, serializers.Serializer
-        ):
-            json = instance.serializer(instance, context=context).data
         if hasattr(instance, "serialize"):
-            json = instance.serialize(context=context)
-
-        class PluginSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = instance.__class__
-                exclude = (
-                    "id",
-                    "placeholder",
-                    "language",
-                    "position",
-                    "creation_date",
-                    "changed_date",
-                    "parent",
-                )
-
-        json = PluginSerializer(instance, context=context).data
-        return json
+            return instance.serialize(context=context)
+        serializer = self.get_plugin_serializer(instance.__class__, context)
+        if serializer is None:
+            # Serializers supplied by plugins may depend on their instance: one per plugin
+            return get_plugin_serializer(instance.__class__)(instance, context=context).data
+        return serializer.to_representation(instance)
+
+    def get_plugin_serializer(self, model, context):
+        """
+        Returns a serializer instance for the plugin model, or ``None`` if the plugin model
+        supplies its own serializer class, which is instantiated for each plugin. Instances of
+        the generated serializers are reused for all plugins of the same model rendered by
+        this renderer to avoid building their fields for each plugin. If the
+        ``DJANGOCMS_REST_COMPILED_SERIALIZERS`` setting is ``True``, compiled serializers are
+        used for plugin models with simple fields only.
+        """
+        if model not in self._plugin_serializers:
+            serializer = None
+            if getattr(settings, "DJANGOCMS_REST_COMPILED_SERIALIZERS", False):
+                serializer = get_compiled_plugin_serializer(model)
+            if serializer is None:
+                serializer_class = get_plugin_serializer(model)
+                if issubclass(serializer_class, BasePluginSerializer):
+                    serializer = serializer_class(context=context)
+                    # Build the fields now: Render workers share the serializer
+                    serializer.fields
+            self._plugin_serializers[model] = serializer
+        return self._plugin_serializers[model]
 
 
 class PlaceholderSerializer(serializers.Serializer):
     slot = serializers.CharField()
     label = serializers.CharField()
     language = serializers.CharField()
-    content = serializers.ListSerializer(
-        child=serializers.JSONField(), allow_empty=True, required=False
-    )
+    # A list of plugins, or the JSON-encoded list
+    content = serializers.JSONField(required=False)
 
     def __init__(
         self, request: Request, placeholder: Placeholder, language: str, *args, **kwargs
@@ -244,11 +787,19 @@ class PlaceholderSerializer(serializers.Serializer):
 
 
 class PlaceholderRelationFieldSerializer(serializers.Serializer):
-    def __init__(self, request: Request, instance: models.Model, placeholders, language: str, *args, **kwargs) -> None:
+    def __init__(
+        self, request: Request, instance: models.Model, placeholders, language: str, *args, **kwargs
+    ) -> None:
+        if placeholders is None:
+            # The instance's placeholders declared in its template
+            declared_slots = get_declared_slots(instance)
+            placeholders = [
+                placeholder for placeholder in instance.get_placeholders() if placeholder.slot in declared_slots
+            ] if instance else []
         self.placeholders = placeholders
         self.language: str = language
         super().__init__(instance,*args, **kwargs)
-        self.host: str = f"{request.scheme}://{request.get_host()}"
+        self.url_builder = get_url_builder(request)
 
         for placeholder in self.placeholders:
             self.fields[placeholder.slot] = serializers.JSONField()
@@ -260,15 +811,12 @@ class PlaceholderRelationFieldSerializer(serializers.Serializer):
 
         return (
             {
-                placeholder.slot: self.host
-                + reverse(
+                placeholder.slot: self.url_builder.build(
                     "cms-placeholder-detail",
-                    args=(
-                        self.language,
-                        content_type_id,
-                        instance.pk,
-                        placeholder.slot,
-                    ),
+                    self.language,
+                    content_type_id,
+                    instance.pk,
+                    placeholder.slot,
                 )
                 for placeholder in self.placeholders
             }
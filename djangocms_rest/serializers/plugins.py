@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from cms.models import CMSPlugin
+from rest_framework import serializers
+
+
+#: Fields of the CMSPlugin base model that are not part of the plugin's serialization
+EXCLUDED_PLUGIN_FIELDS = (
+    "id",
+    "placeholder",
+    "language",
+    "position",
+    "creation_date",
+    "changed_date",
+    "parent",
+)
+
+_plugin_serializers = {}
+
+
+class BasePluginSerializer(serializers.ModelSerializer):
+    """Base class of the serializers created for plugin models without a serializer of their own."""
+
+
+def build_plugin_serializer(model: type[CMSPlugin]) -> type[serializers.Serializer]:
+    """Creates a model serializer class for a plugin model."""
+    meta = type("Meta", (), {"model": model, "exclude": EXCLUDED_PLUGIN_FIELDS})
+    return type(f"{model.__name__}Serializer", (BasePluginSerializer,), {"Meta": meta})
+
+
+def register_plugin_serializer(model: type[CMSPlugin], serializer: type[serializers.Serializer]) -> None:
+    """Registers the serializer class used to serialize instances of a plugin model."""
+    _plugin_serializers[model] = serializer
+    _compiled_serializers.pop(model, None)
+
+
+def get_plugin_serializer(model: type[CMSPlugin]) -> type[serializers.Serializer]:
+    """
+    Returns the serializer class for a plugin model. The class is created once on first
+    use and then reused. A serializer class provided by the plugin model through its
+    ``serializer`` attribute takes precedence.
+    """
+    try:
+        return _plugin_serializers[model]
+    except KeyError:
+        serializer = getattr(model, "serializer", None)
+        if not (isinstance(serializer, type) and issubclass(serializer, serializers.Serializer)):
+            serializer = build_plugin_serializer(model)
+        register_plugin_serializer(model, serializer)
+        return serializer
+
+
+#: DRF field classes a compiled serializer converts inline (by value conversion function)
+_INLINE_CONVERSIONS = {
+    serializers.CharField: "str",
+    serializers.IntegerField: "int",
+}
+#: DRF field classes whose ``to_representation`` a compiled serializer calls directly
+_DIRECT_CONVERSIONS = tuple(
+    field_class
+    for field_class in (
+        serializers.BooleanField,
+        serializers.DateField,
+        serializers.DateTimeField,
+        getattr(serializers, "BigIntegerField", None),  # DRF 3.16+
+    )
+    if field_class is not None
+)
+
+_compiled_serializers = {}
+
+
+class CompiledPluginSerializer:
+    """
+    Serializer-like wrapper around a generated function which reads the model fields
+    of an instance as flat attribute accesses instead of going through DRF's field dispatch.
+    Its representation is identical to the one of the serializer it has been compiled from.
+    """
+
+    def __init__(self, serializer_class, to_representation):
+        self.serializer_class = serializer_class
+        self.to_representation = to_representation
+
+
+def compile_serializer(serializer_class: type[serializers.ModelSerializer]) -> CompiledPluginSerializer | None:
+    """
+    Compiles a model serializer whose fields are all simple model fields (char, text,
+    integer, boolean, date, and foreign key primary keys). Returns ``None`` if the
+    serializer has any other field.
+    """
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    namespace = {}
+    lines = []
+    items = []
+
+    for i, field in enumerate(serializer._readable_fields):
+        if field.source == "*" or field.source_attrs != [field.source]:
+            return None
+        if type(field) is serializers.PrimaryKeyRelatedField and field.pk_field is None:
+            attname = model._meta.get_field(field.source).attname
+            expression = f"v{i}"
+        elif type(field) in _INLINE_CONVERSIONS:
+            attname = field.source
+            expression = f"None if v{i} is None else {_INLINE_CONVERSIONS[type(field)]}(v{i})"
+        elif type(field) in _DIRECT_CONVERSIONS:
+            attname = field.source
+            namespace[f"f{i}"] = field.to_representation
+            expression = f"None if v{i} is None else f{i}(v{i})"
+        else:
+            return None
+        lines.append(f"    v{i} = instance.{attname}")
+        items.append(f"        {field.field_name!r}: {expression},")
+
+    source = "\n".join(["def to_representation(instance):", *lines, "    return {", *items, "    }"])
+    exec(compile(source, f"<compiled {serializer_class.__name__}>", "exec"), namespace)
+    return CompiledPluginSerializer(serializer_class, namespace["to_representation"])
+
+
+def get_compiled_plugin_serializer(model: type[CMSPlugin]) -> CompiledPluginSerializer | None:
+    """
+    Returns the compiled serializer for a plugin model or ``None`` if the plugin model
+    provides its own serializer or has fields which cannot be compiled.
+    """
+    try:
+        return _compiled_serializers[model]
+    except KeyError:
+        serializer_class = get_plugin_serializer(model)
+        if issubclass(serializer_class, BasePluginSerializer):
+            compiled = compile_serializer(serializer_class)
+        else:
+            compiled = None
+        _compiled_serializers[model] = compiled
+        return compiled
@@ -0,0 +1,28 @@
+import functools
+
+from cms.signals import page_moved
+from django.dispatch import Signal
+
+#: Sent after a timed API request has been rendered (see ``djangocms_rest.timing``) with
+#: the arguments ``request``, ``response``, ``timings`` (seconds by phase), and
+#: ``counters`` (e.g., cache hits and misses, and queries). The sender is the view class.
+request_timed = Signal()
+
+
+def send_page_moved(move_page):
+    """
+    Wraps ``Page.move_page`` to send django CMS's ``page_moved`` signal (with the argument
+    ``instance``) after the move, as its docstring promises: django CMS 4 moves the node
+    and rewrites the page urls with queryset updates, which send no signals at all.
+    """
+    if getattr(move_page, "sends_page_moved", False):
+        return move_page
+
+    @functools.wraps(move_page)
+    def wrapper(self, *args, **kwargs):
+        page = move_page(self, *args, **kwargs)
+        page_moved.send(sender=self.__class__, instance=self)
+        return page
+
+    wrapper.sends_page_moved = True
+    return wrapper
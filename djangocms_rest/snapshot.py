@@ -0,0 +1,164 @@
+"""
+Exports the API as a static snapshot: a directory tree of JSON files mirroring the URL
+structure below the API root, e.g., for serving the API from a CDN or object storage.
+See the ``export_rest_snapshot`` management command.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import close_old_connections
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from djangocms_rest.serializers.placeholder import can_render_concurrently
+
+#: Name of the manifest file in the snapshot directory
+MANIFEST = "manifest.json"
+
+#: URL paths written to files, URL paths unchanged since the last export, and URL paths deleted
+ExportResult = namedtuple("ExportResult", ("written", "unchanged", "deleted"))
+
+
+class SnapshotExporter:
+    """
+    Exports the responses of all API endpoints an anonymous client can reach by following
+    the links from the language list: the page lists, page details and placeholder details.
+    Each response is written to ``<url path>.json``, or ``<url path>index.json`` if the URL
+    path ends with a slash, e.g., ``en/pages.json`` and ``en/pages/about/index.json``.
+    Files are written as soon as their response is rendered, each by writing a temporary
+    file and renaming it, so that a snapshot being updated can be served at any time.
+
+    A manifest records the ETag, the content hash, and the links of each response. In
+    incremental mode, the responses are requested conditionally with the recorded ETags:
+    Unchanged pages and placeholders are neither rendered nor written (nor are responses
+    whose content hash has not changed). Files of resources which are no longer linked are
+    deleted.
+
+    With ``workers`` threads, the responses of each level of links (page lists, page
+    details, placeholders) are rendered concurrently, unless inside a transaction (see
+    ``can_render_concurrently``).
+    """
+
+    def __init__(self, directory, base_url: str, workers: int = 0, incremental: bool = False):
+        self.directory = Path(directory)
+        self.base_url = base_url.rstrip("/")
+        self.workers = workers
+        self.incremental = incremental
+        self.root = reverse("cms-language-list")
+        url = urlsplit(self.base_url)
+        self.host = url.netloc
+        self.secure = url.scheme == "https"
+        self.request_factory = RequestFactory(HTTP_HOST=url.netloc, HTTP_ACCEPT="application/json")
+
+    def export(self) -> ExportResult:
+        manifest = self.read_manifest()
+        previous = manifest["resources"] if manifest.get("base_url") == self.base_url else {}
+        resources, written, unchanged = {}, [], []
+        pending = [self.root]
+        while pending:
+            for path, resource, changed in self.map(self.export_resource, pending, previous):
+                resources[path] = resource
+                (written if changed else unchanged).append(path)
+            # Links to follow: each resource is exported once
+            links = (link for path in pending for link in resources[path]["links"])
+            pending = [link for link in dict.fromkeys(links) if link not in resources]
+
+        deleted = [path for path in manifest.get("resources", {}) if path not in resources]
+        for path in deleted:
+            self.get_file(path).unlink(missing_ok=True)
+        self.write(MANIFEST, json.dumps({"base_url": self.base_url, "resources": resources}, indent=1).encode())
+        return ExportResult(written, unchanged, deleted)
+
+    def map(self, function, paths, previous):
+        if self.workers > 1 and len(paths) > 1 and can_render_concurrently():
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="djangocms-rest-export") as executor:
+                return list(executor.map(partial(self._call_in_thread, function, previous=previous), paths))
+        return [function(path, previous) for path in paths]
+
+    @staticmethod
+    def _call_in_thread(function, path, previous):
+        """Calls the function in a worker thread, which manages its own database connections."""
+        close_old_connections()
+        try:
+            return function(path, previous)
+        finally:
+            close_old_connections()
+
+    def export_resource(self, path: str, previous: dict) -> tuple:
+        """
+        Exports the response of the URL path. Returns the path, its manifest entry, and
+        whether its file has been written.
+        """
+        resource = previous.get(path) if self.incremental else None
+        response = self.get(path, etag=resource and resource["etag"])
+        if response.status_code == 304 and self.get_file(path).exists():
+            return path, resource, False
+        if response.status_code != 200:
+            raise ValueError(f"GET {path} returned status {response.status_code}")
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        links = self.get_links(json.loads(content))
+        changed = not (resource and resource["hash"] == digest and self.get_file(path).exists())
+        if changed:
+            self.write(path, content)
+        return path, {"etag": response.get("ETag"), "hash": digest, "links": links}, changed
+
+    def get(self, path: str, etag: str | None = None):
+        """Returns the rendered response of an anonymous GET request for the URL path."""
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        request = self.request_factory.get(path, secure=self.secure, **headers)
+        # The host of the exported urls is not validated against ALLOWED_HOSTS: It is not sent by a client
+        request.get_host = partial(str, self.host)
+        request.user = AnonymousUser()
+        match = resolve(path)
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, "render"):
+            # "304 Not Modified" responses are plain HTTP responses
+            response.render()
+        return response
+
+    def get_links(self, data) -> list[str]:
+        """Returns the URL paths of the API URLs in the response data."""
+        prefix = self.base_url + self.root
+        if isinstance(data, str):
+            return [data[len(self.base_url):]] if data.startswith(prefix) else []
+        if isinstance(data, dict):
+            data = data.values()
+        elif not isinstance(data, list):
+            return []
+        return [link for value in data for link in self.get_links(value)]
+
+    def get_file(self, path: str) -> Path:
+        """Returns the file of the URL path (or of the manifest)."""
+        if path == MANIFEST:
+            return self.directory / MANIFEST
+        relative = path[len(self.root):]
+        relative = relative + "index.json" if relative.endswith("/") or not relative else relative + ".json"
+        file = (self.directory / relative).resolve()
+        if self.directory.resolve() not in file.parents:
+            raise ValueError(f"{path} is outside the snapshot directory")
+        return file
+
+    def write(self, path: str, content: bytes) -> None:
+        """Replaces the file of the URL path with the content."""
+        file = self.get_file(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        temporary = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            f.write(content)
+        os.replace(temporary, file)
+
+    def read_manifest(self) -> dict:
+        try:
+            return json.loads(self.get_file(MANIFEST).read_text())
+        except FileNotFoundError:
+            return {}
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from django.conf import settings
+from django.db import connections
+
+from djangocms_rest.signals import request_timed
+
+
+class Timer:
+    """
+    Records the time spent in the phases of a request (in seconds, summed up if a phase
+    is entered several times, e.g., by render workers) and counters such as cache hits.
+    Phases may be nested: the time spent building URLs is also part of serializing.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.timings = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.timings[name] = self.timings.get(name, 0) + duration
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def count_queries(self):
+        """Counts the queries of the current thread's database connections."""
+
+        def execute(execute, sql, params, many, context):
+            self.count("queries")
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(execute))
+            yield
+
+    def get_header(self) -> str:
+        """Returns the timings and counters as ``Server-Timing`` header value."""
+        metrics = [f"{name};dur={duration * 1000:.2f}" for name, duration in self.timings.items()]
+        metrics += [f'{name};desc="{value}"' for name, value in self.counters.items()]
+        return ", ".join(metrics)
+
+
+class NullTimer:
+    """Timer of requests which are not timed: records nothing."""
+
+    enabled = False
+    _phase = nullcontext()
+
+    def phase(self, name: str):
+        return self._phase
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+    def count_queries(self):
+        return self._phase
+
+
+NULL_TIMER = NullTimer()
+
+
+def start_timer(request, sender) -> Timer | NullTimer:
+    """
+    Starts timing the request if the ``DJANGOCMS_REST_SERVER_TIMING`` setting is ``True``
+    or a receiver of the ``request_timed`` signal is connected for the view class.
+    """
+    if not getattr(settings, "DJANGOCMS_REST_SERVER_TIMING", False) and not request_timed.has_listeners(sender):
+        return NULL_TIMER
+    request._djangocms_rest_timer = Timer()
+    return request._djangocms_rest_timer
+
+
+def get_timer(request) -> Timer | NullTimer:
+    """Returns the timer of the request (``NULL_TIMER`` if the request is not timed)."""
+    return getattr(request, "_djangocms_rest_timer", NULL_TIMER)
+
+
+def finish_timer(sender, request, response) -> None:
+    """
+    Adds the ``Server-Timing`` header (if the ``DJANGOCMS_REST_SERVER_TIMING`` setting is
+    ``True``) and sends the ``request_timed`` signal. Renderable responses are finished
+    after rendering to include the time spent encoding them.
+    """
+    timer = get_timer(request)
+    if not timer.enabled:
+        return
+    if hasattr(response, "add_post_render_callback") and not response.is_rendered:
+        response.add_post_render_callback(lambda response: finish_timer(sender, request, response))
+        return
+    timer.timings["total"] = time.perf_counter() - timer.start
+    if getattr(settings, "DJANGOCMS_REST_SERVER_TIMING", False):
+        response.headers["Server-Timing"] = timer.get_header()
+    request_timed.send(
+        sender=sender, request=request, response=response, timings=timer.timings, counters=timer.counters
+    )
@@ -7,11 +7,13 @@ urlpatterns = [
     path("<slug:language>/pages", views.PageList.as_view(), name="cms-page-list"),
     path("<slug:language>/pages/", views.PageDetail.as_view(), name="cms-page-root"),
     path("<slug:language>/pages/<path:path>/", views.PageDetail.as_view(), name="cms-page-detail"),
+    path("<slug:language>/placeholders/", views.PlaceholderList.as_view(), name="cms-placeholder-list"),
     path(
         "<slug:language>/placeholders/<int:content_type_id>/<int:object_id>/<str:slot>/",
         views.PlaceholderDetail.as_view(),
         name="cms-placeholder-detail",
     ),
+    path("<slug:language>/changes", views.ChangeList.as_view(), name="cms-change-list"),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from urllib.parse import quote
+
+from django.urls import NoReverseMatch, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+
+from djangocms_rest.timing import get_timer
+
+#: Characters ``reverse()`` does not quote in URL arguments
+_SAFE = RFC3986_SUBDELIMS + "/~:@"
+_INT_MARKER = 918273600
+_STR_MARKER = "djangocmsrest{}x"
+
+
+class URLBuilder:
+    """
+    Builds absolute URLs for a request. Each URL pattern is reversed once into a format
+    template which is then filled in with the (quoted) arguments by plain string formatting.
+    The arguments are quoted like ``reverse()`` quotes them, but not validated against the
+    pattern's converters. URL patterns which cannot be turned into a template are reversed
+    for each URL.
+    """
+
+    def __init__(self, request):
+        self.host = f"{request.scheme}://{request.get_host()}"
+        self.timer = get_timer(request)
+        self._templates = {}
+
+    def build(self, viewname: str, *args) -> str:
+        with self.timer.phase("urls"):
+            key = (viewname, len(args))
+            try:
+                template = self._templates[key]
+            except KeyError:
+                template = self._templates[key] = self.compile(viewname, args)
+            if template is None:
+                return self.host + reverse(viewname, args=args)
+            return self.host + template.format(*(quote(str(arg), safe=_SAFE) for arg in args))
+
+    @staticmethod
+    def compile(viewname: str, args) -> str | None:
+        """
+        Returns the format template of the URL pattern or ``None`` if the URL built from
+        the template for the given arguments differs from the one ``reverse()`` returns.
+        """
+        markers = [
+            _INT_MARKER + i if isinstance(arg, int) else _STR_MARKER.format(i)
+            for i, arg in enumerate(args)
+        ]
+        try:
+            template = reverse(viewname, args=markers).replace("{", "{{").replace("}", "}}")
+        except NoReverseMatch:
+            return None
+        for i, marker in enumerate(markers):
+            if template.count(str(marker)) != 1:
+                return None
+            template = template.replace(str(marker), f"{{{i}}}")
+        if template.format(*(quote(str(arg), safe=_SAFE) for arg in args)) != reverse(viewname, args=args):
+            return None
+        return template
+
+
+def get_url_builder(request) -> URLBuilder:
+    """Returns the URL builder of the request, creating it on first use."""
+    try:
+        return request._djangocms_rest_url_builder
+    except AttributeError:
+        request._djangocms_rest_url_builder = URLBuilder(request)
+        return request._djangocms_rest_url_builder
@@ -1,20 +1,153 @@
-from cms.models import Page, PageUrl, Placeholder, PageContent
-from cms.utils.conf import get_languages
-from cms.utils.i18n import get_language_tuple
-from cms.utils.page_permissions import user_can_view_page
+import hashlib
+
+from cms import constants
+from cms.cache import _get_cache_version
+from cms.models import EmptyPageContent, Page, PageContent, PageUrl, Placeholder
+from cms.utils.conf import get_cms_setting, get_languages
+from cms.utils.i18n import get_fallback_languages, get_language_tuple
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.db.models import Count, Max, Prefetch, prefetch_related_objects
 from django.http import Http404
-from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework import renderers
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView as DRFAPIView
 
-from djangocms_rest.serializers.pageserializer import PageContentSerializer
-from djangocms_rest.serializers.placeholder import PlaceholderSerializer
+from djangocms_rest.changes import decode_cursor, get_changes
+from djangocms_rest.page_index import (
+    get_page_index_entry,
+    get_placeholder_index_entry,
+    set_page_index_entry,
+    set_placeholder_index_entry,
+)
+from djangocms_rest.permissions import get_permission_evaluator, get_permission_version
+from djangocms_rest.renderers import JSONRenderer
+from djangocms_rest.serializers.pageserializer import PageContentSerializer, get_page_placeholders
+from djangocms_rest.serializers.placeholder import (
+    PlaceholderRenderer,
+    PlaceholderSerializer,
+    get_placeholder_validators,
+)
+from djangocms_rest.timing import finish_timer, get_timer, start_timer
+from djangocms_rest.utils import get_url_builder
+
+
+def _set_template_caches(pages):
+    """
+    Resolves inherited templates of the page contents in memory. ``pages`` need to carry
+    their prefetched page contents. Templates which cannot be resolved from the given pages
+    are left to the page content to look up.
+    """
+    pages_by_node = {page.node_id: page for page in pages}
+    default_template = get_cms_setting("TEMPLATES")[0][0]
+    resolved = {}
+
+    def get_template(node_id, language):
+        if (node_id, language) not in resolved:
+            page = pages_by_node.get(node_id)
+            if page is None:
+                template = None
+            else:
+                page_content = page.page_content_cache.get(language)
+                if page_content and page_content.template != constants.TEMPLATE_INHERITANCE_MAGIC:
+                    template = page_content.template or default_template
+                elif page.node.parent_id is None:
+                    template = default_template
+                else:
+                    template = get_template(page.node.parent_id, language)
+            resolved[(node_id, language)] = template
+        return resolved[(node_id, language)]
+
+    for page in pages:
+        for page_content in page.filtered_translations:
+            template = get_template(page.node_id, page_content.language)
+            if template is not None:
+                page_content._template_cache = template
+
+
+def _set_inherited_templates(page_contents):
+    """
+    Resolves the inherited templates of page contents (carrying their pages and nodes)
+    with a single query instead of one query per page content.
+    """
+    inheriting = [
+        page_content
+        for page_content in page_contents
+        if page_content.template == constants.TEMPLATE_INHERITANCE_MAGIC and not hasattr(page_content, "_template_cache")
+    ]
+    if not inheriting:
+        return
+    ancestor_paths = {page_content: page_content.page.node.get_ancestor_paths() for page_content in inheriting}
+    templates = {
+        (path, language): template
+        for path, language, template in PageContent.objects.filter(
+            page__node__path__in=set().union(*ancestor_paths.values()),
+            language__in={page_content.language for page_content in inheriting},
+        )
+        .exclude(template=constants.TEMPLATE_INHERITANCE_MAGIC)
+        .values_list("page__node__path", "language", "template")
+    }
+    default_template = get_cms_setting("TEMPLATES")[0][0]
+    for page_content, paths in ancestor_paths.items():
+        page_content._template_cache = next(
+            (
+                templates[(path, page_content.language)]
+                for path in sorted(paths, reverse=True)
+                if (path, page_content.language) in templates
+            ),
+            default_template,
+        )
+
+
+def _get_languages(language, site):
+    """Returns the language and its fallback languages."""
+    return [language] + [
+        lang for lang in get_fallback_languages(language, site_id=site.pk) if lang != language
+    ]
 
 
 class APIView(DRFAPIView):
     # This is a base class for all API views. It sets the allowed methods to GET and OPTIONS.
     http_method_names = ("get", "options")
+    # Splice cached JSON into responses instead of decoding and re-encoding it
+    renderer_classes = [
+        JSONRenderer if renderer_class is renderers.JSONRenderer else renderer_class
+        for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES
+    ]
+
+    etag = None
+
+    def get_conditional_response(self, request, *validators):
+        """
+        Builds a strong ETag from the validators and the requested variant of the resource
+        (path and query, media type and user). Returns a "304 Not Modified" response if the
+        client's copy is current, ``None`` otherwise. The ETag is added to the final response.
+
+        There is no Last-Modified header: Deleting or moving pages and plugins changes the
+        resources without changing any of their dates, so that ``If-Modified-Since``
+        requests would keep stale copies.
+        """
+        variant = (request.get_full_path(), request.accepted_media_type, request.user.pk)
+        self.etag = quote_etag(hashlib.sha1(repr((variant, validators)).encode()).hexdigest())
+        return get_conditional_response(request, etag=self.etag)
+
+    def dispatch(self, request, *args, **kwargs):
+        # Time the request if the Server-Timing header or the request_timed signal is used
+        with start_timer(request, self.__class__).count_queries():
+            return super().dispatch(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # 304 responses carry the ETag, too: Clients and caches refresh their stored headers
+        if response.status_code in (200, 304) and self.etag and not response.has_header("ETag"):
+            response.headers["ETag"] = self.etag
+        finish_timer(self.__class__, request, response)
+        return response
 
 
 class LanguageList(APIView):
@@ -28,39 +161,140 @@ class LanguageList(APIView):
         if languages is None:
             raise Http404
         for conf in languages:
-            conf["pages"] = f"{request.scheme}://{request.get_host()}" + reverse(
-                "cms-page-list", args=(conf["code"],)
-            )
+            conf["pages"] = get_url_builder(request).build("cms-page-list", conf["code"])
         return Response(languages)
 
 
 class PageList(APIView):
-    """List of all pages on this site for a given language."""
+    """List of all pages on this site for a given language.
+
+    Optional (if the get parameters `?fields=<field>,...` or `?omit=<field>,...` are added
+    to the API url): Only the requested fields are computed and returned."""
+
+    def get_pages(self, request, site, language, placeholders=True):
+        """
+        Loads all pages of the site together with their nodes, urls, page contents and
+        (if ``placeholders`` is ``True``) placeholders for the language and its fallbacks
+        using a fixed number of queries. View restrictions are evaluated once for all pages.
+        """
+        languages = _get_languages(language, site)
+        page_contents = PageContent.objects.filter(language__in=languages)
+        if placeholders:
+            page_contents = page_contents.prefetch_related("placeholders")
+        pages = list(
+            Page.objects.filter(node__site=site)
+            .select_related("node")
+            .order_by("node__path")
+        )
+        prefetch_related_objects(
+            pages,
+            Prefetch(
+                "urls",
+                queryset=PageUrl.objects.filter(language__in=languages),
+                to_attr="filtered_urls",
+            ),
+            Prefetch(
+                "pagecontent_set",
+                queryset=page_contents,
+                to_attr="filtered_translations",
+            ),
+        )
+        for page in pages:
+            for page_url in page.filtered_urls:
+                page.urls_cache[page_url.language] = page_url
+            for lang in languages:
+                page.urls_cache.setdefault(lang, None)
+            for page_content in page.filtered_translations:
+                page.page_content_cache[page_content.language] = page_content
+            for lang in languages:
+                page.page_content_cache.setdefault(lang, EmptyPageContent(language=lang, page=page))
+        _set_template_caches(pages)
+
+        if request.user.is_anonymous:
+            pages = [page for page in pages if not page.login_required]
+        with get_timer(request).phase("permissions"):
+            return get_permission_evaluator(request, site).filter(pages)
+
+    def get_validators(self, site, language):
+        """
+        Returns the number and the latest change of the site's pages and page contents, and
+        the permission version: The list only contains the pages the user can view.
+        """
+        pages = Page.objects.filter(node__site=site).aggregate(
+            count=Count("pk"), changed_date=Max("changed_date")
+        )
+        page_contents = PageContent.objects.filter(
+            page__node__site=site, language__in=_get_languages(language, site)
+        ).aggregate(count=Count("pk"), changed_date=Max("changed_date"))
+        return (
+            pages["count"],
+            pages["changed_date"],
+            page_contents["count"],
+            page_contents["changed_date"],
+            _get_cache_version(),
+            get_permission_version(),
+        )
 
     def get(self, request, language, format=None):
         site = get_current_site(request)
         allowed_languages = [lang[0] for lang in get_language_tuple(site.id)]
         if language not in allowed_languages:
             raise Http404
-        qs = Page.objects.filter(node__site=site)
-        if request.user.is_anonymous:
-            qs = qs.filter(login_required=False)
-        pages = (
-            page.get_content_obj(language, fallback=True)
-            for page in qs
-            if user_can_view_page(request.user, page) and page.get_content_obj(language, fallback=True)
-        )
-        serializer = PageContentSerializer(request, pages, many=True, read_only=True)
-        return Response(serializer.data)
+        fields = PageContentSerializer.get_requested_fields(request)
+        timer = get_timer(request)
+        with timer.phase("validate"):
+            not_modified = self.get_conditional_response(request, *self.get_validators(site, language))
+        if not_modified:
+            return not_modified
+        with timer.phase("lookup"):
+            pages = [
+                page.get_content_obj(language, fallback=True)
+                for page in self.get_pages(
+                    request, site, language, placeholders=fields is None or "placeholders" in fields
+                )
+            ]
+        with timer.phase("serialize"):
+            serializer = PageContentSerializer(
+                request,
+                [page_content for page_content in pages if page_content],
+                many=True,
+                read_only=True,
+                fields=fields,
+            )
+            return Response(serializer.data)
 
 
 class PageDetail(APIView):
     """
     Retrieve a page instance. The page instance includes the placeholders and
     their links to retrieve dynamic content.
-    """
 
-    def get_object(self, site, path):
+    Optional (if the get parameter `?expand=placeholders` is added to the API url):
+    The placeholders include their content (as returned by the placeholder endpoint)
+    together with the link to the placeholder.
+
+    Optional (if the get parameters `?fields=<field>,...` or `?omit=<field>,...` are added
+    to the API url): Only the requested fields are computed and returned."""
+
+    def get_object(self, site, path, language):
+        """
+        Returns the page at the path and its content for the language (or a fallback language).
+        Paths are looked up in the page index first: For an indexed path, only the page content
+        together with its page is fetched.
+        """
+        version, entry = get_page_index_entry(site.pk, language, path)
+        if entry:
+            page_content_pk, page_urls = entry
+            page_content = PageContent.objects.select_related("page__node").filter(pk=page_content_pk).first()
+            if page_content:
+                page = page_content.page
+                page.urls_cache = {url.language: url for url in page_urls}
+                page.page_content_cache = {
+                    language: EmptyPageContent(language=language, page=page),
+                    page_content.language: page_content,
+                }
+                return page, page.get_content_obj(language, fallback=True)
+
         page_urls = (
             PageUrl.objects.get_for_site(site)
             .filter(path=path)
@@ -73,23 +307,59 @@ class PageDetail(APIView):
             raise Http404
         else:
             page.urls_cache = {url.language: url for url in page_urls}
-        return page
+        page_content = page.get_content_obj(language, fallback=True)
+        if page_content:
+            set_page_index_entry(site.pk, language, path, version, page_content.pk, page_urls)
+        return page, page_content
 
-    def get(self, request, language, path="", format=None):
+    def get_page_content(self, request, language, path):
+        """
+        Resolves the page content to serialize after checking the language and the user's
+        view permission. Returns a "304 Not Modified" response (or ``None``), the page content,
+        the requested fields, and whether the placeholders are to be expanded.
+        """
         site = get_current_site(request)
         allowed_languages = [lang[0] for lang in get_language_tuple(site.pk)]
         if language not in allowed_languages:
             raise Http404
-        page = self.get_object(site, path)
+        timer = get_timer(request)
+        with timer.phase("lookup"):
+            page, page_content = self.get_object(site, path, language)
 
         # Check if the user has permission to view the page
-        if not user_can_view_page(request.user, page):
-            raise Http404
+        with timer.phase("permissions"):
+            if not get_permission_evaluator(request, site).can_view(page):
+                raise Http404
 
-        serializer = PageContentSerializer(
-            request, page.get_content_obj(language, fallback=True), read_only=True
+        fields = PageContentSerializer.get_requested_fields(request)
+        expand_placeholders = "placeholders" in request.GET.get("expand", "").split(",") and (
+            fields is None or "placeholders" in fields
         )
-        return Response(serializer.data)
+        validators = [
+            page.pk,
+            page.node.path,
+            page.changed_date,
+            page_content.pk,
+            getattr(page_content, "changed_date", None),
+            _get_cache_version(),
+        ]
+        with timer.phase("validate"):
+            if expand_placeholders:
+                validators += get_placeholder_validators(
+                    get_page_placeholders(page_content), page_content.language, site.pk
+                )
+            not_modified = self.get_conditional_response(request, *validators)
+        return not_modified, page_content, fields, expand_placeholders
+
+    def get(self, request, language, path="", format=None):
+        not_modified, page_content, fields, expand_placeholders = self.get_page_content(request, language, path)
+        if not_modified:
+            return not_modified
+        with get_timer(request).phase("serialize"):
+            serializer = PageContentSerializer(
+                request, page_content, expand_placeholders=expand_placeholders, fields=fields, read_only=True
+            )
+            return Response(serializer.data)
 
 
 class PlaceholderDetail(APIView):
@@ -108,31 +378,222 @@ class PlaceholderDetail(APIView):
       as separate attributes"""
 
     def get_placeholder(self, content_type_id, object_id, slot):
-        try:
-            placeholder = Placeholder.objects.get(
-                content_type_id=content_type_id, object_id=object_id, slot=slot
-            )
-        except Placeholder.DoesNotExist:
-            raise Http404
-        return placeholder
+        """
+        Returns the placeholder and its source. Placeholders of page contents are looked up in
+        the page index first, and their page contents are fetched together with page and node.
+        """
+        version, entry = get_placeholder_index_entry(content_type_id, object_id, slot)
+        if entry:
+            placeholder, source = entry
+        else:
+            try:
+                placeholder = Placeholder.objects.get(
+                    content_type_id=content_type_id, object_id=object_id, slot=slot
+                )
+            except Placeholder.DoesNotExist:
+                raise Http404
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None:
+                raise Http404
+            if issubclass(model, PageContent):
+                source = model.objects.select_related("page__node").filter(pk=object_id).first()
+            else:
+                source = model.objects.filter(pk=object_id).first()
+            if source is None:
+                raise Http404
+            if isinstance(source, PageContent):
+                set_placeholder_index_entry(placeholder, version, source)
+        if isinstance(source, PageContent):
+            # Avoid source lookups when retrieving the placeholder label
+            source.page.page_content_cache.setdefault(source.language, source)
+            placeholder.page = source.page
+        return placeholder, source
 
     def get(self, request, language, content_type_id, object_id, slot, format=None):
-        placeholder = self.get_placeholder(content_type_id, object_id, slot)
-        if placeholder is None:
-            raise Http404
-        source = (
-            placeholder.content_type.model_class()
-            .objects.filter(pk=placeholder.object_id)
-            .first()
-        )
-        if source is None:
-            raise Http404
+        site = get_current_site(request)
+        timer = get_timer(request)
+        with timer.phase("lookup"):
+            placeholder, source = self.get_placeholder(content_type_id, object_id, slot)
         # Check if the user has permission to view the page (should the placeholder be on a page)
-        if isinstance(source, PageContent) and not user_can_view_page(
-            request.user, source.page
-        ):
+        with timer.phase("permissions"):
+            if isinstance(source, PageContent) and not get_permission_evaluator(request, site).can_view(source.page):
+                raise Http404
+        with timer.phase("validate"):
+            not_modified = self.get_conditional_response(
+                request,
+                getattr(source, "changed_date", None),
+                *get_placeholder_validators([placeholder], language, site.pk),
+            )
+        if not_modified:
+            return not_modified
+        with timer.phase("serialize"):
+            serializer = PlaceholderSerializer(
+                request, placeholder, language, read_only=True
+            )
+            return Response(serializer.data)
+
+
+class PlaceholderList(APIView):
+    """Retrieves the content of several placeholders at once. The placeholders are given as
+    `?placeholder=<content_type_id>:<object_id>:<slot>` get parameters which can be repeated.
+
+    For each placeholder found (and visible to the user) the list contains:
+
+    - "content_type_id", "object_id": The placeholder's source object
+    - "slot": The slot name of the placeholder.
+    - "content": The content of the placeholder as a nested JSON tree
+    - "language": The language of the content
+    - "label": The verbose label of the placeholder
+    - "details": The link to the placeholder's endpoint
+
+    Requests for more than ``DJANGOCMS_REST_PLACEHOLDER_LIST_MAX`` placeholders (default: 100)
+    are rejected."""
+
+    def get_lookups(self, request):
+        values = request.GET.getlist("placeholder")
+        max_lookups = getattr(settings, "DJANGOCMS_REST_PLACEHOLDER_LIST_MAX", 100)
+        if len(values) > max_lookups:
+            raise ValidationError({"placeholder": f"At most {max_lookups} placeholders can be requested at once."})
+        lookups = []
+        for value in values:
+            try:
+                content_type_id, object_id, slot = value.split(":", 2)
+                lookups.append((int(content_type_id), int(object_id), slot))
+            except ValueError:
+                raise ValidationError(
+                    {"placeholder": f"Expected <content_type_id>:<object_id>:<slot>, got {value!r}."}
+                )
+        return lookups
+
+    def get_placeholders(self, lookups):
+        """Fetches all placeholders with one query."""
+        placeholders = Placeholder.objects.filter(
+            content_type_id__in={content_type_id for content_type_id, object_id, slot in lookups},
+            object_id__in={object_id for content_type_id, object_id, slot in lookups},
+            slot__in={slot for content_type_id, object_id, slot in lookups},
+        )
+        placeholders_by_lookup = {
+            (placeholder.content_type_id, placeholder.object_id, placeholder.slot): placeholder
+            for placeholder in placeholders
+        }
+        return [placeholders_by_lookup[lookup] for lookup in dict.fromkeys(lookups) if lookup in placeholders_by_lookup]
+
+    def get_sources(self, request, site, placeholders):
+        """
+        Fetches the placeholders' source objects with one query per content type and
+        returns those visible to the user by content type and object id. View permissions
+        are checked once for all pages.
+        """
+        object_ids = {}
+        for placeholder in placeholders:
+            object_ids.setdefault(placeholder.content_type_id, set()).add(placeholder.object_id)
+
+        sources = {}
+        for content_type_id, ids in object_ids.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None:
+                continue
+            queryset = model.objects.filter(pk__in=ids)
+            if model is PageContent:
+                queryset = queryset.select_related("page__node")
+            sources.update({(content_type_id, source.pk): source for source in queryset})
+        _set_inherited_templates([source for source in sources.values() if isinstance(source, PageContent)])
+
+        pages = [source.page for source in sources.values() if isinstance(source, PageContent)]
+        with get_timer(request).phase("permissions"):
+            visible_pages = {page.pk for page in get_permission_evaluator(request, site).filter(pages)}
+        return {
+            key: source
+            for key, source in sources.items()
+            if not isinstance(source, PageContent) or source.page_id in visible_pages
+        }
+
+    def get(self, request, language, format=None):
+        site = get_current_site(request)
+        allowed_languages = [lang[0] for lang in get_language_tuple(site.pk)]
+        if language not in allowed_languages:
             raise Http404
-        serializer = PlaceholderSerializer(
-            request, placeholder, language, read_only=True
+        timer = get_timer(request)
+        with timer.phase("lookup"):
+            placeholders = self.get_placeholders(self.get_lookups(request))
+            sources = self.get_sources(request, site, placeholders)
+        placeholders = [
+            placeholder
+            for placeholder in placeholders
+            if (placeholder.content_type_id, placeholder.object_id) in sources
+        ]
+        for placeholder in placeholders:
+            # Avoid source lookups when retrieving the placeholder labels
+            source = sources[(placeholder.content_type_id, placeholder.object_id)]
+            if isinstance(source, PageContent):
+                source.page.page_content_cache.setdefault(source.language, source)
+                placeholder.page = source.page
+            else:
+                placeholder.page = None
+
+        with timer.phase("validate"):
+            not_modified = self.get_conditional_response(
+                request,
+                *(getattr(source, "changed_date", None) for source in sources.values()),
+                *get_placeholder_validators(placeholders, language, site.pk),
+                get_permission_version(),
+            )
+        if not_modified:
+            return not_modified
+
+        with timer.phase("serialize"):
+            return Response(self.serialize(request, placeholders, language))
+
+    def serialize(self, request, placeholders, language):
+        """Returns the data of the placeholders including their rendered contents."""
+        contents = PlaceholderRenderer(request).render_placeholders(
+            placeholders, context={}, language=language, use_cache=True
         )
-        return Response(serializer.data)
+        url_builder = get_url_builder(request)
+        return [
+            {
+                "content_type_id": placeholder.content_type_id,
+                "object_id": placeholder.object_id,
+                "slot": placeholder.slot,
+                "label": placeholder.get_label(),
+                "language": language,
+                "content": contents[placeholder.pk],
+                "details": url_builder.build(
+                    "cms-placeholder-detail",
+                    language,
+                    placeholder.content_type_id,
+                    placeholder.object_id,
+                    placeholder.slot,
+                ),
+            }
+            for placeholder in placeholders
+        ]
+
+
+class ChangeList(APIView):
+    """Pages and placeholders added, updated, or deleted since a cursor, e.g., for incremental
+    builds of static sites. Pass the `"cursor"` of a response as `?since=<cursor>` get parameter
+    to retrieve the changes since that response.
+
+    - "cursor": The cursor of this response
+    - "reset": `true` if all pages and placeholders are returned as added, i.e., without cursor
+      or for a cursor older than the deletion log: Clients discard their copy of the site
+    - "pages": The "added", "updated" and "deleted" pages with their "path" (the link to the page)
+    - "placeholders": The "added", "updated" and "deleted" placeholders with their
+      "content_type_id", "object_id", "slot" and "details" (the link to the placeholder)
+
+    Clients apply the deletions first: A page may be deleted and added again at the same path."""
+
+    def get(self, request, language, format=None):
+        site = get_current_site(request)
+        allowed_languages = [lang[0] for lang in get_language_tuple(site.pk)]
+        if language not in allowed_languages:
+            raise Http404
+        since = request.GET.get("since")
+        if since:
+            try:
+                since = decode_cursor(since)
+            except ValueError:
+                raise ValidationError({"since": f"Invalid cursor {since!r}."})
+        with get_timer(request).phase("lookup"):
+            return Response(get_changes(request, site, language, since or None))
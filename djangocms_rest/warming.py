@@ -0,0 +1,113 @@
+"""
+Warms the REST placeholder cache (and optionally the path and placeholder index) ahead of
+the first requests, e.g., after a deploy or a cache flush. See the ``warm_rest_cache``
+management command, which spreads the pages over a process pool.
+"""
+from __future__ import annotations
+
+from collections import defaultdict, namedtuple
+from urllib.parse import urlsplit
+
+from cms.models import CMSPlugin, Page, PageContent, PageUrl, Placeholder
+from cms.utils.i18n import get_language_list
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from djangocms_rest.permissions import get_view_restrictions
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer, get_declared_slots
+
+#: Numbers of pages, placeholders, and rendered (i.e., not yet cached) placeholders warmed
+WarmingResult = namedtuple("WarmingResult", ("pages", "placeholders", "rendered"))
+
+
+def get_warming_request(site, base_url: str | None = None) -> Request:
+    """
+    Returns an anonymous request for the site (``https://<site domain>`` unless a base url
+    is given) to render the placeholders with. Placeholders varying on request headers are
+    cached for requests without these headers.
+    """
+    url = urlsplit(base_url or f"https://{site.domain}")
+    return Request(RequestFactory().get(url.path or "/", HTTP_HOST=url.netloc, secure=url.scheme == "https"))
+
+
+def get_pages_to_warm(site_ids=None, since=None) -> list[int]:
+    """
+    Returns the pks of the pages of the sites (all sites by default) in tree order. If
+    ``since`` is given, only pages whose page, page contents, or plugins have changed
+    since then are returned.
+    """
+    pages = Page.objects.all()
+    if site_ids:
+        pages = pages.filter(node__site__in=site_ids)
+    if since is not None:
+        changed_page_contents = CMSPlugin.objects.filter(
+            changed_date__gte=since,
+            placeholder__content_type=ContentType.objects.get_for_model(PageContent),
+        ).values("placeholder__object_id")
+        pages = pages.filter(
+            Q(changed_date__gte=since)
+            | Q(pagecontent_set__changed_date__gte=since)
+            | Q(pagecontent_set__in=changed_page_contents)
+        )
+    return list(dict.fromkeys(pages.order_by("node__path").values_list("pk", flat=True)))
+
+
+def warm_pages(page_pks, languages=None, index: bool = False, base_url: str | None = None) -> WarmingResult:
+    """
+    Renders the declared placeholders of the pages' contents in the given languages (all
+    languages of the pages' sites by default) into the REST placeholder cache, batched by
+    site and language. Placeholders which are already cached are not rendered again.
+
+    If ``index`` is ``True``, the pages' paths and placeholders are also added to the index
+    used by the page and placeholder detail endpoints, and the sites' view restrictions are
+    loaded into the cache.
+    """
+    from djangocms_rest import views
+
+    page_contents = list(
+        PageContent.objects.filter(page__in=page_pks).select_related("page__node__site")
+    )
+    page_contents = [
+        page_content
+        for page_content in page_contents
+        if page_content.language in (languages or get_language_list(page_content.page.node.site_id))
+    ]
+    views._set_inherited_templates(page_contents)
+    content_type = ContentType.objects.get_for_model(PageContent)
+    placeholders_by_content = defaultdict(list)
+    for placeholder in Placeholder.objects.filter(
+        content_type=content_type, object_id__in=[page_content.pk for page_content in page_contents]
+    ):
+        placeholders_by_content[placeholder.object_id].append(placeholder)
+
+    groups = defaultdict(list)  # (site, language) -> placeholders
+    for page_content in page_contents:
+        declared_slots = get_declared_slots(page_content)
+        for placeholder in placeholders_by_content[page_content.pk]:
+            if placeholder.slot in declared_slots:
+                placeholder.page = page_content.page
+                groups[(page_content.page.node.site, page_content.language)].append(placeholder)
+
+    rendered = 0
+    for (site, language), placeholders in groups.items():
+        renderer = PlaceholderRenderer(get_warming_request(site, base_url))
+        # The current site follows the SITE_ID setting rather than the request's host
+        renderer.render_placeholders(placeholders, context={}, language=language, use_cache=True, site_id=site.pk)
+        rendered += len(renderer._rendered_placeholders)
+
+    if index:
+        for site in {page_content.page.node.site for page_content in page_contents}:
+            get_view_restrictions(site.pk)
+        page_urls = PageUrl.objects.filter(page__in=page_pks, path__isnull=False).select_related("page__node__site")
+        for page_url in page_urls:
+            if not languages or page_url.language in languages:
+                views.PageDetail().get_object(page_url.page.node.site, page_url.path, page_url.language)
+        for placeholders in groups.values():
+            for placeholder in placeholders:
+                views.PlaceholderDetail().get_placeholder(content_type.pk, placeholder.object_id, placeholder.slot)
+
+    return WarmingResult(
+        len(page_pks), sum(len(placeholders) for placeholders in groups.values()), rendered
+    )
@@ -0,0 +1,7 @@
+from django.urls import include, path
+
+
+urlpatterns = [
+    path("api/", include("djangocms_rest.async_urls")),
+    path("", include("cms.urls")),
+]
@@ -0,0 +1,31 @@
+from cms.api import add_plugin, create_page
+from cms.test_utils.testcases import CMSTestCase
+from django.core.cache import cache
+from django.urls import reverse
+
+
+class RESTTestCase(CMSTestCase):
+    prefix = "http://testserver"
+
+
+class PageTestCase(RESTTestCase):
+    """
+    Starts each test with an empty cache and a page "page" whose "content" placeholder
+    holds a link plugin labelled ``link_label`` (no plugin if ``None``).
+    """
+
+    link_label = "link"
+
+    def setUp(self):
+        cache.clear()
+        self.page = create_page("page", language="en", template="page.html")
+        self.page_content = self.page.get_content_obj("en")
+        self.placeholder = self.page_content.get_placeholders().get(slot="content")
+        self.plugin = None
+        if self.link_label is not None:
+            self.plugin = add_plugin(self.placeholder, "DummyLinkPlugin", "en", label=self.link_label)
+        self.page_url = reverse("cms-page-detail", args=["en", "page"])
+        self.placeholder_url = reverse(
+            "cms-placeholder-detail",
+            args=["en", self.placeholder.content_type_id, self.page_content.pk, "content"],
+        )
@@ -0,0 +1,161 @@
+"""
+Benchmarks the API endpoints on a synthetic site (see ``synthetic_site``) in a fresh
+SQLite test database with the locmem cache. For each endpoint, the latency (median and
+95th percentile), throughput (sequential requests per second of wall time), and number of
+queries of cold requests (empty cache) and warm requests (cached index entries and
+placeholder contents) are recorded.
+
+The run fails (exit status 1) if an endpoint exceeds its query budget (``QUERY_BUDGETS``)
+or its median latency exceeds the baseline in ``baselines.json`` by more than the
+tolerance factor. Baselines are only compared for runs with the site parameters they
+were recorded with, and they depend on the machine: Record them with
+``--update-baselines`` before comparing changes.
+
+Run with ``python -m tests.benchmarks.bench_endpoints``, see ``--help`` for the options.
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+
+BASELINES = Path(__file__).with_name("baselines.json")
+
+#: Maximum number of queries of a request by endpoint for a cold and a warm cache. The
+#: number of queries must not depend on the number of pages or plugins.
+QUERY_BUDGETS = {
+    # Languages come from the settings
+    "language-list": {"cold": 0, "warm": 0},
+    # Validators (2), pages, urls, page contents, placeholders
+    "page-list": {"cold": 6, "warm": 6},
+    # Page url (or indexed page content), page contents, inherited template, placeholders
+    "page-detail": {"cold": 4, "warm": 3},
+    # Page url, page contents, placeholders, plugin validators, plugin tree, one query per
+    # plugin type; warm: indexed page content, placeholders, plugin validators
+    "page-detail-expanded": {"cold": 7, "warm": 3},
+    # Placeholder, page content, plugin validators, plugin tree, one query per plugin type;
+    # warm: indexed placeholder, plugin validators
+    "placeholder-detail": {"cold": 6, "warm": 1},
+    # Placeholders, page contents, inherited templates, plugin validators, plugin tree, one
+    # query per plugin type; warm: placeholders, page contents, templates, validators
+    "placeholder-list": {"cold": 7, "warm": 4},
+}
+
+
+def get_urls(site, language="en"):
+    from django.contrib.contenttypes.models import ContentType
+    from django.urls import reverse
+
+    deepest = site.pages[-1]
+    heavy = site.heavy_pages[0].get_content_obj(language)
+    content_type_id = ContentType.objects.get_for_model(heavy).pk
+    placeholders = "&".join(
+        f"placeholder={content_type_id}:{page.get_content_obj(language).pk}:content"
+        for page in site.heavy_pages + site.pages[-10:]
+    )
+    return {
+        "language-list": reverse("cms-language-list"),
+        "page-list": reverse("cms-page-list", args=[language]),
+        "page-detail": reverse("cms-page-detail", args=[language, deepest.get_path(language)]),
+        "page-detail-expanded": reverse("cms-page-detail", args=[language, heavy.page.get_path(language)])
+        + "?expand=placeholders",
+        "placeholder-detail": reverse("cms-placeholder-detail", args=[language, content_type_id, heavy.pk, "content"]),
+        "placeholder-list": reverse("cms-placeholder-list", args=[language]) + "?" + placeholders,
+    }
+
+
+def measure(client, url, requests, cold):
+    """
+    Returns the latencies (in seconds), the wall time of all requests (in seconds, including
+    clearing the cache before cold requests), and the query count of the last request.
+    """
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    latencies = []
+    if not cold:
+        client.get(url)
+    wall_time = time.perf_counter()
+    for _ in range(requests):
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = client.get(url)
+            latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, (url, response.status_code)
+    return latencies, time.perf_counter() - wall_time, len(queries)
+
+
+def run(pages=2000, branching=4, heavy_pages=5, plugins=300, requests=20, tolerance=2.0, update_baselines=False):
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+
+    from tests.benchmarks.synthetic_site import build_site
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        start = time.perf_counter()
+        site = build_site(pages=pages, branching=branching, heavy_pages=heavy_pages, plugins=plugins)
+        print(f"Built {pages} pages ({heavy_pages} with {plugins} plugins) in {time.perf_counter() - start:.1f}s")
+
+        client = Client()
+        parameters = {"pages": pages, "branching": branching, "heavy_pages": heavy_pages, "plugins": plugins}
+        baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+        if baselines.get("parameters") != parameters:
+            print("No time baselines for these parameters")
+            baselines = {}
+        results, failures = {}, []
+        for name, url in get_urls(site).items():
+            for state in ("cold", "warm"):
+                latencies, wall_time, queries = measure(client, url, requests, cold=state == "cold")
+                median = statistics.median(latencies) * 1000
+                # Nearest-rank percentile
+                p95 = sorted(latencies)[math.ceil(0.95 * len(latencies)) - 1] * 1000
+                results.setdefault(name, {})[state] = round(median, 2)
+                print(
+                    f"{name:>21} {state}: {median:8.2f}ms median {p95:8.2f}ms p95 "
+                    f"{requests / wall_time:8.1f} req/s {queries:4d} queries"
+                )
+                if queries > QUERY_BUDGETS[name][state]:
+                    failures.append(f"{name} ({state}): {queries} queries, budget {QUERY_BUDGETS[name][state]}")
+                baseline = baselines.get("medians", {}).get(name, {}).get(state)
+                if baseline and not update_baselines and median > baseline * tolerance:
+                    failures.append(f"{name} ({state}): {median:.2f}ms, baseline {baseline:.2f}ms")
+    finally:
+        connection.creation.destroy_test_db(":memory:", verbosity=0)
+
+    if update_baselines:
+        BASELINES.write_text(json.dumps({"parameters": parameters, "medians": results}, indent=4) + "\n")
+        print(f"Baselines written to {BASELINES}")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--branching", type=int, default=4, help="child pages per page")
+    parser.add_argument("--heavy-pages", type=int, default=5, help="pages with nested plugins")
+    parser.add_argument("--plugins", type=int, default=300, help="plugins per heavy page")
+    parser.add_argument("--requests", type=int, default=20, help="requests per endpoint and cache state")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed factor over the time baselines")
+    parser.add_argument("--update-baselines", action="store_true")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+    sys.exit(0 if run(**vars(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
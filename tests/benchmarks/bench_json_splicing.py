@@ -0,0 +1,57 @@
+"""
+Compares cache hits of placeholder contents stored as Python structures (decoded from
+the cache and re-encoded by DRF's JSON renderer) with cache hits of contents stored as
+JSON (spliced into the response as is).
+
+Run with ``python -m tests.benchmarks.bench_json_splicing``.
+"""
+import os
+import pickle
+import timeit
+
+import django
+
+
+def make_content(plugins, depth):
+    return [
+        {
+            "plugin_type": "DummyLinkPlugin",
+            "label": f"Link {i} – ünïcödé",
+            "external_link": f"https://example.com/{i}/",
+            "children": make_content(plugins // 4, depth - 1) if depth else [],
+        }
+        for i in range(plugins)
+    ]
+
+
+def run(placeholders=5, plugins=20, depth=1, number=500):
+    from rest_framework import renderers
+
+    from djangocms_rest.renderers import JSONRenderer, RawJSON
+
+    contents = [make_content(plugins, depth) for _ in range(placeholders)]
+    python_cache = [pickle.dumps(content) for content in contents]
+    json_cache = [pickle.dumps(RawJSON.dumps(content)) for content in contents]
+
+    def render(cache, renderer_class):
+        return renderer_class().render([
+            {"slot": f"slot {i}", "content": pickle.loads(content)} for i, content in enumerate(cache)
+        ])
+
+    assert render(python_cache, renderers.JSONRenderer) == render(json_cache, JSONRenderer)
+    results = {}
+    for name, cache, renderer_class in (
+        ("python structures", python_cache, renderers.JSONRenderer),
+        ("pre-encoded JSON", json_cache, JSONRenderer),
+    ):
+        seconds = min(timeit.repeat(lambda: render(cache, renderer_class), number=number, repeat=5))
+        results[name] = number / seconds
+        print(f"{name:>20}: {results[name]:10.0f} responses/s")
+    print(f"{'speedup':>20}: {results['pre-encoded JSON'] / results['python structures']:10.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+    run()
@@ -0,0 +1,54 @@
+"""
+Builds synthetic sites for benchmarks and query budget tests: a page tree of a given
+size and branching factor (i.e., depth) and placeholders with nested plugins.
+"""
+from collections import namedtuple
+
+from cms.api import add_plugin, create_page
+
+SyntheticSite = namedtuple("SyntheticSite", ("pages", "heavy_pages"))
+
+
+def add_nested_plugins(placeholder, plugins, children=4, language="en"):
+    """
+    Adds ``plugins`` plugins to the placeholder as ``children`` complete trees with
+    ``children`` children per plugin: ``DummyParentPlugin`` plugins with
+    ``DummyLinkPlugin`` plugins as leaves.
+    """
+    created = []
+    for i in range(plugins):
+        parent = created[(i - children) // children] if i >= children else None
+        has_children = children + children * i < plugins
+        created.append(add_plugin(
+            placeholder,
+            "DummyParentPlugin" if has_children else "DummyLinkPlugin",
+            language,
+            target=parent,
+            label=f"plugin {i}",
+        ))
+    return created
+
+
+def build_site(pages=100, branching=4, heavy_pages=5, plugins=100, language="en"):
+    """
+    Creates ``pages`` pages: the first one at the root, each following page a child of
+    the page ``(i - 1) // branching``. Child pages inherit their template. The content
+    placeholders of the first ``heavy_pages`` pages get ``plugins`` nested plugins each,
+    those of all other pages a single link.
+    """
+    created = []
+    for i in range(pages):
+        parent = created[(i - 1) // branching] if i else None
+        created.append(create_page(
+            f"page {i}",
+            template="INHERIT" if parent else "page.html",
+            language=language,
+            parent=parent,
+        ))
+    for i, page in enumerate(created):
+        placeholder = page.get_content_obj(language).get_placeholders().get(slot="content")
+        if i < heavy_pages:
+            add_nested_plugins(placeholder, plugins, language=language)
+        else:
+            add_plugin(placeholder, "DummyLinkPlugin", language, label=f"link {i}")
+    return SyntheticSite(created, created[:heavy_pages])
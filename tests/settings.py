@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'filer',
     'easy_thumbnails',
 
+    'djangocms_rest',
     'tests.test_app',
 ]
 
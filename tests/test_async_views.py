@@ -0,0 +1,86 @@
+import threading
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from cms.api import add_plugin, create_page
+from cms.test_utils.testcases import BaseCMSTestCase
+from django.core.cache import cache
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer
+from tests.base import PageTestCase
+
+
+class AsyncViewsTestCase(PageTestCase):
+    def setUp(self):
+        super().setUp()
+        create_page("child", language="en", template="page.html", parent=self.page)
+        add_plugin(self.placeholder, "TextPlugin", "en", body="<p>text</p>")
+        content_type_id = self.placeholder.content_type_id
+        self.urls = [
+            reverse("cms-language-list"),
+            reverse("cms-page-list", args=["en"]),
+            self.page_url,
+            self.page_url + "?expand=placeholders",
+            self.page_url + "?expand=placeholders&fields=title",
+            reverse("cms-page-detail", args=["en", "unknown"]),
+            self.placeholder_url,
+            reverse("cms-placeholder-list", args=["en"]) + f"?placeholder={content_type_id}:{self.page_content.pk}:content",
+        ]
+
+    async def test_same_results(self):
+        for url in self.urls:
+            response = await sync_to_async(self.client.get)(url)
+            with self.subTest(url=url), override_settings(ROOT_URLCONF="tests.async_urls"):
+                async_response = await self.async_client.get(url)
+                self.assertEqual(async_response.status_code, response.status_code)
+                if response.status_code == 200:
+                    self.assertEqual(async_response.json(), response.json())
+                    self.assertEqual(async_response.get("ETag"), response.get("ETag"))
+
+    @override_settings(ROOT_URLCONF="tests.async_urls")
+    async def test_not_modified(self):
+        url = reverse("cms-page-detail", args=["en", "page"]) + "?expand=placeholders"
+        etag = (await self.async_client.get(url))["ETag"]
+
+        response = await self.async_client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+
+class ConcurrentRenderingTestCase(BaseCMSTestCase, TransactionTestCase):
+    # Placeholders are rendered in other threads which need to see the test data: no test transaction
+    prefix = "http://testserver"
+
+    def setUp(self):
+        cache.clear()
+        self.request = self.get_request("/")
+        self.placeholders = []
+        for i in range(3):
+            page = create_page(f"page {i}", language="en", template="page.html")
+            placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=f"link {i}")
+            self.placeholders.append(placeholder)
+
+    def render(self):
+        renderer = PlaceholderRenderer(self.request)
+        return async_to_sync(renderer.arender_placeholders)(self.placeholders, {}, "en", use_cache=True)
+
+    def test_concurrent_rendering(self):
+        threads = set()
+        render_in_thread = PlaceholderRenderer._render_in_thread
+
+        def record_thread(*args, **kwargs):
+            threads.add(threading.get_ident())
+            return render_in_thread(*args, **kwargs)
+
+        with mock.patch.object(PlaceholderRenderer, "_render_in_thread", autospec=True, side_effect=record_thread):
+            contents = self.render()
+
+        self.assertEqual(list(contents), [placeholder.pk for placeholder in self.placeholders])
+        self.assertEqual([content[0]["label"] for content in contents.values()], ["link 0", "link 1", "link 2"])
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+        # Cached contents are read at once
+        self.assertEqual(self.render(), contents)
@@ -0,0 +1,333 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from cms.api import add_plugin, create_page
+from cms.test_utils.testcases import BaseCMSTestCase
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.test import TransactionTestCase, override_settings
+
+from djangocms_rest.cache import LocalCache, get_local_cache
+from djangocms_rest.serializers.placeholder import (
+    PlaceholderRenderer,
+    StaleableCacheEntry,
+    _get_placeholder_rest_cache_keys,
+    get_placeholder_rest_cache,
+    get_placeholder_rest_cache_entries,
+    get_placeholder_rest_cache_many,
+    lock_placeholder_rest_cache,
+    set_placeholder_rest_cache,
+    set_placeholder_rest_cache_many,
+)
+from tests.test_app.models import DummyLink
+from tests.base import PageTestCase, RESTTestCase
+
+
+class PlaceholderCacheTestCase(PageTestCase):
+    link_label = "link 0"
+
+    def setUp(self):
+        super().setUp()
+        self.request = self.get_request("/")
+        self.placeholders = [self.placeholder] + [
+            self.page_content.get_placeholders().create(slot=f"slot {i}") for i in range(2)
+        ]
+        for i, placeholder in enumerate(self.placeholders[1:], 1):
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=f"link {i}")
+
+    def count_cache_calls(self):
+        get_many = mock.Mock(wraps=cache.get_many)
+        set_many = mock.Mock(wraps=cache.set_many)
+        patcher = mock.patch.multiple(cache, get_many=get_many, set_many=set_many)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return get_many, set_many
+
+    def test_get_and_set(self):
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request))
+        set_placeholder_rest_cache(self.placeholders[0], "en", 1, [{"label": "link"}], self.request)
+
+        self.assertEqual(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request), [{"label": "link"}])
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholders[0], "fr", 1, self.request))
+
+    def test_get_and_set_many(self):
+        contents = {placeholder: [{"label": placeholder.slot}] for placeholder in self.placeholders[:2]}
+        set_placeholder_rest_cache_many(contents, "en", 1, self.request)
+
+        self.assertEqual(
+            get_placeholder_rest_cache_many(self.placeholders, "en", 1, self.request),
+            {placeholder.pk: content for placeholder, content in contents.items()},
+        )
+
+    def test_invalidation(self):
+        set_placeholder_rest_cache(self.placeholders[0], "en", 1, [{"label": "link"}], self.request)
+        self.placeholders[0].clear_cache("en", site_id=1)
+
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request))
+
+    def test_render_placeholders_cache_calls(self):
+        renderer = PlaceholderRenderer(self.request)
+        get_many, set_many = self.count_cache_calls()
+        contents = renderer.render_placeholders(self.placeholders, {}, "en", use_cache=True)
+        # Read versions, read contents, write contents and new versions
+        self.assertEqual(get_many.call_count, 2)
+        self.assertEqual(set_many.call_count, 1)
+
+        get_many.reset_mock()
+        set_many.reset_mock()
+        renderer = PlaceholderRenderer(self.request)
+        with self.assertNumQueries(0):
+            self.assertEqual(renderer.render_placeholders(self.placeholders, {}, "en", use_cache=True), contents)
+        # Read versions, read contents
+        self.assertEqual(get_many.call_count, 2)
+        set_many.assert_not_called()
+
+    def test_invalidation_while_rendering(self):
+        PlaceholderRenderer(self.request).render_placeholders(self.placeholders, {}, "en", use_cache=True)
+        self.placeholders[0].clear_cache("en", site_id=1)
+        renderer = PlaceholderRenderer(self.request)
+        renderer.get_cached_contents(self.placeholders, "en", 1)
+        # The plugins change after the cache lookup
+        self.placeholders[0].clear_cache("en", site_id=1)
+        renderer._render_placeholders(self.placeholders[:1], {}, "en", 1, use_cache=True)
+
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request))
+
+
+class SingleFlightTestCase(PageTestCase):
+    link_label = None
+
+    def setUp(self):
+        super().setUp()
+        self.request = self.get_request("/")
+        self.placeholder.page = self.page
+        # Keep the threads off the database: the plugins are "rendered" by ``render_plugins`` below
+        self.placeholder._plugins_cache = self.placeholder._all_plugins_cache = []
+        get_current_site(self.request)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def render_plugins(self, placeholder, language, context):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.2)
+        return [{"label": "link"}]
+
+    def render_concurrently(self, count):
+        results = []
+        barrier = threading.Barrier(count)
+
+        def render():
+            barrier.wait()
+            renderer = PlaceholderRenderer(self.request)
+            results.append(renderer.render_placeholder(self.placeholder, {}, "en", use_cache=True))
+
+        with mock.patch.object(PlaceholderRenderer, "render_plugins", side_effect=self.render_plugins, autospec=False):
+            threads = [threading.Thread(target=render) for _ in range(count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return results
+
+    @override_settings(DJANGOCMS_REST_SINGLE_FLIGHT=True)
+    def test_single_flight(self):
+        results = self.render_concurrently(5)
+
+        self.assertEqual(results, [[{"label": "link"}]] * 5)
+        self.assertEqual(self.calls, 1)
+
+    def test_without_single_flight(self):
+        results = self.render_concurrently(5)
+
+        self.assertEqual(results, [[{"label": "link"}]] * 5)
+        self.assertEqual(self.calls, 5)
+
+    @override_settings(DJANGOCMS_REST_SINGLE_FLIGHT=True, DJANGOCMS_REST_SINGLE_FLIGHT_WAIT=0.05)
+    def test_wait_timeout(self):
+        results = self.render_concurrently(3)
+
+        self.assertEqual(results, [[{"label": "link"}]] * 3)
+        self.assertEqual(self.calls, 3)
+
+    @override_settings(DJANGOCMS_REST_SINGLE_FLIGHT=True)
+    def test_lock_released_on_error(self):
+        renderer = PlaceholderRenderer(self.request)
+        with mock.patch.object(PlaceholderRenderer, "render_plugins", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                renderer.render_placeholder(self.placeholder, {}, "en", use_cache=True)
+
+        _, held = lock_placeholder_rest_cache([self.placeholder], "en", 1, self.request, timeout=10)
+        self.assertEqual(held, {})
+
+
+@override_settings(DJANGOCMS_REST_STALE_WHILE_REVALIDATE=60)
+class StaleWhileRevalidateTestCase(BaseCMSTestCase, TransactionTestCase):
+    # Refreshes are scheduled on commit and run in another thread: no test transaction
+    prefix = "http://testserver"
+
+    def setUp(self):
+        cache.clear()
+        self.request = self.get_request("/")
+        page = create_page("page", language="en", template="page.html")
+        self.placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+        add_plugin(self.placeholder, "DummyLinkPlugin", "en", label="old")
+        executor = ThreadPoolExecutor(max_workers=1)
+        patcher = mock.patch("djangocms_rest.serializers.placeholder._refresh_executor", executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(executor.shutdown)
+        self.executor = executor
+
+    def render(self):
+        return PlaceholderRenderer(self.request).render_placeholder(self.placeholder, {}, "en", use_cache=True)
+
+    def render_stale_entry(self):
+        self.render()
+        key = _get_placeholder_rest_cache_keys([self.placeholder], "en", 1, self.request)[self.placeholder.pk]
+        cache.set(key, cache.get(key)._replace(expires=time.time() - 1))
+        # Change the content without invalidating the cache
+        DummyLink.objects.update(label="new")
+
+    def test_fresh_entry(self):
+        self.render()
+        DummyLink.objects.update(label="new")
+
+        self.assertEqual(self.render()[0]["label"], "old")
+        self.executor.shutdown(wait=True)
+        self.assertEqual(self.render()[0]["label"], "old")
+
+    def test_stale_entry_is_served_and_refreshed(self):
+        self.render_stale_entry()
+
+        self.assertEqual(self.render()[0]["label"], "old")
+
+        self.executor.shutdown(wait=True)
+        entries = get_placeholder_rest_cache_entries([self.placeholder], "en", 1, self.request)
+        self.assertEqual(entries[self.placeholder.pk], (mock.ANY, False))
+        self.assertEqual(self.render()[0]["label"], "new")
+
+    def test_single_refresh(self):
+        self.render_stale_entry()
+
+        with mock.patch.object(self.executor, "submit") as submit:
+            self.render()
+            self.render()
+        self.assertEqual(submit.call_count, 1)
+
+    @override_settings(DJANGOCMS_REST_STALE_WHILE_REVALIDATE=0)
+    def test_disabled(self):
+        self.render()
+
+        key = _get_placeholder_rest_cache_keys([self.placeholder], "en", 1, self.request)[self.placeholder.pk]
+        self.assertNotIsInstance(cache.get(key), StaleableCacheEntry)
+
+
+class LocalCacheTestCase(RESTTestCase):
+    def test_get_and_set(self):
+        local_cache = LocalCache(max_entries=10, max_size=1000, ttl=60)
+        local_cache.set_many({"a": [1], "b": [2]})
+
+        self.assertEqual(local_cache.get_many(["a", "b", "c"]), {"a": [1], "b": [2]})
+        self.assertEqual(local_cache.stats()["hits"], 2)
+        self.assertEqual(local_cache.stats()["misses"], 1)
+
+    def test_max_entries(self):
+        local_cache = LocalCache(max_entries=2, max_size=1000, ttl=60)
+        local_cache.set_many({"a": 1, "b": 2})
+        local_cache.get_many(["a"])
+        local_cache.set_many({"c": 3})
+
+        self.assertEqual(local_cache.get_many(["a", "b", "c"]), {"a": 1, "c": 3})
+        self.assertEqual(local_cache.stats()["evictions"], 1)
+
+    def test_max_size(self):
+        size = len(pickle.dumps("x" * 100, pickle.HIGHEST_PROTOCOL))
+        local_cache = LocalCache(max_entries=10, max_size=2 * size, ttl=60)
+        local_cache.set_many({"a": "x" * 100, "b": "y" * 100, "c": "z" * 100, "d": "x" * 1000})
+
+        self.assertEqual(local_cache.get_many(["a", "b", "c", "d"]), {"b": "y" * 100, "c": "z" * 100})
+        self.assertEqual(local_cache.stats()["size"], 2 * size)
+
+    def test_ttl(self):
+        local_cache = LocalCache(max_entries=10, max_size=1000, ttl=60)
+        local_cache.set_many({"a": 1})
+        local_cache.set_many({"b": 2}, ttl=10)
+
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 30):
+            self.assertEqual(local_cache.get_many(["a", "b"]), {"a": 1})
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 90):
+            self.assertEqual(local_cache.get_many(["a", "b"]), {})
+        self.assertEqual(len(local_cache), 0)
+
+    def test_disabled(self):
+        self.assertIsNone(get_local_cache())
+
+
+@override_settings(DJANGOCMS_REST_LOCAL_CACHE_ENTRIES=10)
+class TwoLevelCacheTestCase(PlaceholderCacheTestCase):
+    def setUp(self):
+        super().setUp()
+        get_local_cache().clear()
+
+    def test_local_hits(self):
+        renderer = PlaceholderRenderer(self.request)
+        contents = renderer.render_placeholders(self.placeholders, {}, "en", use_cache=True)
+        get_many, _ = self.count_cache_calls()
+        hits = get_local_cache().stats()["hits"]
+
+        self.assertEqual(
+            get_placeholder_rest_cache_many(self.placeholders, "en", 1, self.request), contents
+        )
+        # Versions only
+        self.assertEqual(get_many.call_count, 1)
+        self.assertEqual(get_local_cache().stats()["hits"], hits + 3)
+
+    def test_local_invalidation(self):
+        set_placeholder_rest_cache(self.placeholders[0], "en", 1, [{"label": "link"}], self.request)
+        self.placeholders[0].clear_cache("en", site_id=1)
+
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request))
+        self.assertEqual(len(get_local_cache()), 1)
+
+    def test_filled_from_shared_cache(self):
+        set_placeholder_rest_cache(self.placeholders[0], "en", 1, [{"label": "link"}], self.request)
+        get_local_cache().clear()
+
+        get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request)
+        hits = get_local_cache().stats()["hits"]
+        self.assertEqual(get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request), [{"label": "link"}])
+        self.assertEqual(get_local_cache().stats()["hits"], hits + 1)
+
+    def test_filled_for_remaining_lifetime(self):
+        set_placeholder_rest_cache(self.placeholders[0], "en", 1, [{"label": "link"}], self.request)
+        key = _get_placeholder_rest_cache_keys(self.placeholders[:1], "en", 1, self.request)[self.placeholders[0].pk]
+        cache.set(key, cache.get(key)._replace(expires=time.time() + 5))
+        get_local_cache().clear()
+
+        get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request)
+        _, _, expires = get_local_cache()._entries[key]
+        self.assertLessEqual(expires, time.monotonic() + 5)
+
+        cache.set(key, cache.get(key)._replace(expires=time.time() - 1))
+        get_local_cache().clear()
+        get_placeholder_rest_cache(self.placeholders[0], "en", 1, self.request)
+        self.assertEqual(len(get_local_cache()), 0)
+
+    def test_render_placeholders_cache_calls(self):
+        renderer = PlaceholderRenderer(self.request)
+        get_many, set_many = self.count_cache_calls()
+        contents = renderer.render_placeholders(self.placeholders, {}, "en", use_cache=True)
+        # Read versions, read contents (missing locally), write contents and new versions
+        self.assertEqual(get_many.call_count, 2)
+        self.assertEqual(set_many.call_count, 1)
+
+        get_many.reset_mock()
+        renderer = PlaceholderRenderer(self.request)
+        with self.assertNumQueries(0):
+            self.assertEqual(renderer.render_placeholders(self.placeholders, {}, "en", use_cache=True), contents)
+        # Read versions
+        self.assertEqual(get_many.call_count, 1)
@@ -0,0 +1,290 @@
+from datetime import timedelta
+
+from cms import operations
+from cms.api import add_plugin, create_page
+from cms.models import PageContent, Placeholder
+from cms.operations.helpers import send_post_page_operation, send_pre_page_operation
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import ResolverMatch, reverse
+
+from djangocms_rest.changes import _page_paths, encode_cursor
+from djangocms_rest.models import DeletionLogEntry
+from tests.base import RESTTestCase
+
+
+@override_settings(DJANGOCMS_REST_CHANGES_CURSOR_LAG=0)
+class ChangeListTestCase(RESTTestCase):
+    def setUp(self):
+        cache.clear()
+        self.page = create_page("page", language="en", template="page.html")
+        self.other = create_page("other", language="en", template="page.html")
+        self.url = reverse("cms-change-list", args=["en"])
+        self.content_type_id = ContentType.objects.get_for_model(PageContent).pk
+
+    def get_changes(self, since=None):
+        response = self.client.get(self.url, {"since": since} if since else {})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def page_url(self, path):
+        return self.prefix + reverse("cms-page-detail", args=["en", path])
+
+    def placeholder_url(self, page):
+        page_content = page.get_content_obj("en")
+        return self.prefix + reverse(
+            "cms-placeholder-detail", args=["en", self.content_type_id, page_content.pk, "content"]
+        )
+
+    def test_without_cursor(self):
+        changes = self.get_changes()
+
+        self.assertTrue(changes["reset"])
+        self.assertEqual(
+            [page["path"] for page in changes["pages"]["added"]], [self.page_url("page"), self.page_url("other")]
+        )
+        self.assertEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["added"]],
+            [self.placeholder_url(self.page), self.placeholder_url(self.other)],
+        )
+
+    def test_no_changes(self):
+        changes = self.get_changes(self.get_changes()["cursor"])
+
+        self.assertFalse(changes["reset"])
+        for kind in ("pages", "placeholders"):
+            self.assertEqual(changes[kind], {"added": [], "updated": [], "deleted": []})
+
+    def test_changes(self):
+        cursor = self.get_changes()["cursor"]
+        page_content = self.page.get_content_obj("en")
+        page_content.title = "changed"
+        page_content.save()
+        placeholder = self.other.get_content_obj("en").get_placeholders().get(slot="content")
+        add_plugin(placeholder, "DummyLinkPlugin", "en", label="link")
+        new = create_page("new", language="en", template="page.html")
+
+        changes = self.get_changes(cursor)
+
+        self.assertEqual(changes["pages"]["added"], [{"path": self.page_url("new")}])
+        self.assertEqual(changes["pages"]["updated"], [{"path": self.page_url("page")}])
+        self.assertEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["added"]], [self.placeholder_url(new)]
+        )
+        self.assertEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["updated"]],
+            [self.placeholder_url(self.other)],
+        )
+        self.assertFalse(changes["reset"])
+
+    def test_deletions(self):
+        placeholder = self.other.get_content_obj("en").get_placeholders().get(slot="content")
+        plugin = add_plugin(placeholder, "DummyLinkPlugin", "en", label="link")
+        cursor = self.get_changes()["cursor"]
+        placeholder_url = self.placeholder_url(self.page)
+        with self.captureOnCommitCallbacks(execute=True):
+            plugin.delete()
+            self.page.delete()
+
+        changes = self.get_changes(cursor)
+
+        self.assertEqual(changes["pages"]["deleted"], [{"path": self.page_url("page")}])
+        self.assertEqual([placeholder["details"] for placeholder in changes["placeholders"]["deleted"]], [placeholder_url])
+        self.assertEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["updated"]],
+            [self.placeholder_url(self.other)],
+        )
+        self.assertEqual(changes["pages"]["updated"], [])
+
+    @override_settings(DJANGOCMS_REST_DELETION_LOG_DAYS=1)
+    def test_expired_cursor(self):
+        DeletionLogEntry.objects.create(kind=DeletionLogEntry.PAGE, language="en", url_args=["en", "expired"])
+        DeletionLogEntry.objects.update(deleted_date=self.page.changed_date - timedelta(days=2))
+        changes = self.get_changes(encode_cursor(self.page.changed_date - timedelta(days=2)))
+
+        self.assertTrue(changes["reset"])
+        self.assertEqual(len(changes["pages"]["added"]), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.delete()
+        self.assertFalse(DeletionLogEntry.objects.filter(url_args=["en", "expired"]).exists())
+
+    @override_settings(DJANGOCMS_REST_DELETION_LOG_DAYS=1)
+    def test_expired_entries_dropped_by_any_deletion(self):
+        placeholder = self.page.get_content_obj("en").get_placeholders().get(slot="content")
+        plugin = add_plugin(placeholder, "DummyLinkPlugin", "en", label="link")
+        DeletionLogEntry.objects.create(kind=DeletionLogEntry.PAGE, language="en", url_args=["en", "expired"])
+        DeletionLogEntry.objects.update(deleted_date=self.page.changed_date - timedelta(days=2))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            plugin.delete()
+
+        self.assertFalse(DeletionLogEntry.objects.filter(url_args=["en", "expired"]).exists())
+        self.assertTrue(DeletionLogEntry.objects.filter(kind=DeletionLogEntry.PLUGIN).exists())
+
+    def test_deletion_log_queries(self):
+        placeholder = self.page.get_content_obj("en").get_placeholders().get(slot="content")
+        for label in ("one", "two", "three"):
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=label)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.page.delete()
+
+        # One query drops expired entries, one saves the entries of the page, its placeholders and plugins
+        log_queries = [query for query in queries if "djangocms_rest_deletionlogentry" in query["sql"]]
+        self.assertEqual(len(log_queries), 2)
+        self.assertEqual(DeletionLogEntry.objects.filter(kind=DeletionLogEntry.PLUGIN).count(), 1)
+
+    def test_rolled_back_deletion(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.page.delete()
+                transaction.set_rollback(True)
+            self.other.delete()
+
+        self.assertFalse(DeletionLogEntry.objects.filter(url_args=["en", "page"]).exists())
+        self.assertTrue(DeletionLogEntry.objects.filter(url_args=["en", "other"]).exists())
+
+    @override_settings(DJANGOCMS_REST_CHANGES_CURSOR_LAG=60)
+    def test_cursor_lag(self):
+        changes = self.get_changes(self.get_changes()["cursor"])
+
+        # Changes within the lag are reported again
+        self.assertFalse(changes["reset"])
+        self.assertEqual(len(changes["pages"]["added"]), 2)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"since": "invalid"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.json())
+
+    def test_view_restrictions(self):
+        self.other.login_required = True
+        self.other.save()
+        cursor = encode_cursor(self.page.changed_date - timedelta(seconds=1))
+
+        changes = self.get_changes(cursor)
+
+        self.assertEqual(changes["pages"]["added"], [{"path": self.page_url("page")}])
+
+    def test_page_move(self):
+        create_page("child", language="en", template="page.html", parent=self.page)
+        cursor = self.get_changes()["cursor"]
+        # As the admin moves pages
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+        with self.captureOnCommitCallbacks(execute=True):
+            token = send_pre_page_operation(request, operations.MOVE_PAGE, obj=self.page)
+            self.page.move_page(self.other.node, position="first-child")
+            send_post_page_operation(request, operations.MOVE_PAGE, token, obj=self.page)
+
+        changes = self.get_changes(cursor)
+
+        self.assertCountEqual(
+            changes["pages"]["deleted"], [{"path": self.page_url("page")}, {"path": self.page_url("page/child")}]
+        )
+        self.assertCountEqual(
+            changes["pages"]["updated"],
+            [{"path": self.page_url("other/page")}, {"path": self.page_url("other/page/child")}],
+        )
+
+    def test_page_url_change(self):
+        create_page("child", language="en", template="page.html", parent=self.page)
+        cursor = self.get_changes()["cursor"]
+        page_url = self.page.urls.get(language="en")
+        page_url.slug = page_url.path = "renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            page_url.save()
+            self.page._update_url_path_recursive("en")
+
+        changes = self.get_changes(cursor)
+
+        self.assertCountEqual(
+            changes["pages"]["deleted"], [{"path": self.page_url("page")}, {"path": self.page_url("page/child")}]
+        )
+        self.assertCountEqual(
+            changes["pages"]["updated"], [{"path": self.page_url("renamed")}, {"path": self.page_url("renamed/child")}]
+        )
+
+    def test_page_translation_change(self):
+        create_page("child", language="en", template="page.html", parent=self.page)
+        cursor = self.get_changes()["cursor"]
+        # As the admin's page content change form changes the slug
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+        request.resolver_match = ResolverMatch(
+            lambda request: None, (), {"object_id": str(self.page.get_content_obj("en").pk)}
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            token = send_pre_page_operation(request, operations.CHANGE_PAGE_TRANSLATION, language="en")
+            # Only the page's subtree is recorded
+            self.assertEqual(
+                sorted(path for _, _, path in _page_paths[token].values()), ["page", "page/child"]
+            )
+            self.page.update_urls("en", slug="renamed", path="renamed")
+            self.page._update_url_path_recursive("en")
+            send_post_page_operation(
+                request, operations.CHANGE_PAGE_TRANSLATION, token, obj=self.page, language="en"
+            )
+
+        changes = self.get_changes(cursor)
+
+        self.assertCountEqual(
+            changes["pages"]["deleted"], [{"path": self.page_url("page")}, {"path": self.page_url("page/child")}]
+        )
+        self.assertCountEqual(
+            changes["pages"]["updated"], [{"path": self.page_url("renamed")}, {"path": self.page_url("renamed/child")}]
+        )
+
+    def test_deleted_page_view_restrictions(self):
+        self.other.login_required = True
+        self.other.save()
+        cursor = self.get_changes()["cursor"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.delete()
+
+        self.assertEqual(self.get_changes(cursor)["pages"]["deleted"], [])
+        self.assertEqual(self.get_changes(cursor)["placeholders"]["deleted"], [])
+        with self.login_user_context(self.get_superuser()):
+            self.assertEqual(self.get_changes(cursor)["pages"]["deleted"], [{"path": self.page_url("other")}])
+
+    def test_plugin_move(self):
+        source = self.page.get_content_obj("en").get_placeholders().get(slot="content")
+        target = self.other.get_content_obj("en").get_placeholders().get(slot="content")
+        plugin = add_plugin(source, "DummyLinkPlugin", "en", label="link")
+        cursor = self.get_changes()["cursor"]
+        with self.captureOnCommitCallbacks(execute=True):
+            source.move_plugin(plugin, 1, target_placeholder=target)
+
+        changes = self.get_changes(cursor)
+
+        self.assertCountEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["updated"]],
+            [self.placeholder_url(self.page), self.placeholder_url(self.other)],
+        )
+
+    def test_plugin_operation(self):
+        placeholder = self.page.get_content_obj("en").get_placeholders().get(slot="content")
+        plugin = add_plugin(placeholder, "DummyLinkPlugin", "en", label="link")
+        cursor = self.get_changes()["cursor"]
+        # As the admin pastes plugins
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+        with self.captureOnCommitCallbacks(execute=True):
+            token = send_pre_page_operation(request, operations.PASTE_PLUGIN, sender=Placeholder, plugin=plugin)
+            send_post_page_operation(
+                request, operations.PASTE_PLUGIN, token, sender=Placeholder, plugin=plugin, target_language="en",
+                target_placeholder=placeholder,
+            )
+
+        changes = self.get_changes(cursor)
+
+        self.assertEqual(
+            [placeholder["details"] for placeholder in changes["placeholders"]["updated"]],
+            [self.placeholder_url(self.page)],
+        )
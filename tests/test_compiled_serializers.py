@@ -0,0 +1,91 @@
+from cms.api import add_plugin, create_page
+from cms.models import Placeholder
+from cms.test_utils.testcases import CMSTestCase
+from djangocms_text.models import Text
+from rest_framework import serializers
+
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer
+from djangocms_rest.serializers.plugins import (
+    compile_serializer,
+    get_compiled_plugin_serializer,
+    get_plugin_serializer,
+)
+from tests.test_app.models import DummyLink, DummySpacer, Pizza, SimpleText, Topping
+
+
+def model_serializer(serializer_model):
+    class Serializer(serializers.ModelSerializer):
+        class Meta:
+            model = serializer_model
+            fields = "__all__"
+
+    return Serializer
+
+
+class CompiledSerializerTestCase(CMSTestCase):
+    def setUp(self):
+        page = create_page("page", language="en", template="page.html")
+        placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+        parent = add_plugin(placeholder, "DummyParentPlugin", "en", label="parent")
+        add_plugin(placeholder, "DummyLinkPlugin", "en", target=parent, label="child")
+        add_plugin(placeholder, "DummyLinkPlugin", "en", label="")
+        add_plugin(placeholder, "DummySpacerPlugin", "en")
+        pizza = Pizza.objects.create(description="<p>Margherita</p>")
+        Topping.objects.create(name="Basil", description="", pizza=pizza)
+        SimpleText.objects.create(text="<b>text</b>")
+
+    def assertEquivalent(self, serializer_class, queryset):
+        compiled = compile_serializer(serializer_class)
+        self.assertIsNotNone(compiled)
+        self.assertTrue(queryset.exists())
+        for instance in queryset:
+            self.assertEqual(compiled.to_representation(instance), serializer_class(instance).data)
+
+    def test_plugin_models(self):
+        for model in (DummyLink, DummySpacer):
+            with self.subTest(model=model):
+                self.assertEquivalent(get_plugin_serializer(model), model.objects.all())
+
+    def test_all_model_fields(self):
+        # Includes foreign keys, nullable foreign keys, dates and integers
+        for model in (DummyLink, DummySpacer, Pizza, SimpleText, Topping):
+            with self.subTest(model=model):
+                self.assertEquivalent(model_serializer(model), model.objects.all())
+
+    def test_field_order(self):
+        serializer_class = model_serializer(DummyLink)
+        instance = DummyLink.objects.first()
+
+        self.assertEqual(
+            list(compile_serializer(serializer_class).to_representation(instance)),
+            list(serializer_class(instance).data),
+        )
+
+    def test_unsupported_fields(self):
+        # The text plugin model has a JSON field
+        self.assertIsNone(compile_serializer(model_serializer(Text)))
+        self.assertIsNone(get_compiled_plugin_serializer(Text))
+
+    def test_declared_fields(self):
+        class Serializer(serializers.ModelSerializer):
+            upper_label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = DummyLink
+                fields = ("label", "upper_label")
+
+            def get_upper_label(self, obj):
+                return obj.label.upper()
+
+        self.assertIsNone(compile_serializer(Serializer))
+
+    def test_renderer_output(self):
+        placeholder = DummyLink.objects.first().placeholder
+
+        def render():
+            renderer = PlaceholderRenderer(self.get_request("/"))
+            return renderer.render_plugins(Placeholder.objects.get(pk=placeholder.pk), "en", {})
+
+        expected = render()
+        with self.settings(DJANGOCMS_REST_COMPILED_SERIALIZERS=True):
+            self.assertEqual(render(), expected)
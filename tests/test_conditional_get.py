@@ -0,0 +1,128 @@
+import time
+
+from cms.api import create_page
+from cms.models import PagePermission
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+
+from tests.base import PageTestCase
+
+
+class ConditionalGetTestCase(PageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.urls = {
+            "page-list": reverse("cms-page-list", args=["en"]),
+            "page-detail": self.page_url,
+            "placeholder-detail": self.placeholder_url,
+        }
+
+    def test_validators(self):
+        for name, url in self.urls.items():
+            with self.subTest(name=name):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.has_header("ETag"))
+                self.assertFalse(response.has_header("Last-Modified"))
+                self.assertEqual(self.client.get(url)["ETag"], response["ETag"])
+
+    def test_if_none_match(self):
+        for name, url in self.urls.items():
+            with self.subTest(name=name):
+                etag = self.client.get(url)["ETag"]
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response["ETag"], etag)
+                response = self.client.get(url, HTTP_IF_NONE_MATCH='"other"')
+                self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since_after_delete(self):
+        url = self.urls["placeholder-detail"]
+        self.client.get(url)
+        self.plugin.delete()
+        self.placeholder.clear_cache("en")
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["content"], [])
+
+    def test_if_modified_since_after_move(self):
+        url = self.urls["page-list"]
+        other = create_page("other", language="en", template="page.html")
+        self.client.get(url)
+        self.page.move_page(other.node, position="first-child")
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["children"][0]["title"], "page")
+
+    def test_variants(self):
+        url = self.urls["placeholder-detail"]
+        etag = self.client.get(url)["ETag"]
+
+        self.assertNotEqual(self.client.get(url + "?html=1")["ETag"], etag)
+
+    def test_not_modified_skips_rendering(self):
+        url = self.urls["placeholder-detail"]
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(1):
+            # Placeholder and source are indexed: plugin validators only
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_plugin_change(self):
+        url = self.urls["placeholder-detail"]
+        etag = self.client.get(url)["ETag"]
+        self.plugin.label = "changed"
+        self.plugin.save()
+        self.placeholder.clear_cache("en")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["content"][0]["label"], "changed")
+
+    def test_plugin_delete(self):
+        url = self.urls["placeholder-detail"]
+        etag = self.client.get(url)["ETag"]
+        self.plugin.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_page_change(self):
+        for name in ("page-list", "page-detail"):
+            with self.subTest(name=name):
+                url = self.urls[name]
+                etag = self.client.get(url)["ETag"]
+                self.page_content.title = f"changed {name}"
+                self.page_content.save()
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+
+    def test_new_page(self):
+        url = self.urls["page-list"]
+        etag = self.client.get(url)["ETag"]
+        create_page("other page", language="en", template="page.html")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_view_restriction(self):
+        urls = {
+            "page-list": self.urls["page-list"],
+            "placeholder-list": reverse("cms-placeholder-list", args=["en"])
+            + f"?placeholder={self.placeholder.content_type_id}:{self.page_content.pk}:content",
+        }
+        etags = {name: self.client.get(url)["ETag"] for name, url in urls.items()}
+        PagePermission.objects.create(page=self.page, user=self.get_superuser(), can_view=True)
+
+        for name, url in urls.items():
+            with self.subTest(name=name):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[name])
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), [])
@@ -0,0 +1,52 @@
+from pathlib import Path
+from unittest import mock
+
+from cms.api import create_page
+from django.urls import reverse
+from django.utils.autoreload import file_changed
+
+from djangocms_rest.serializers import placeholder as placeholder_module
+from djangocms_rest.serializers.placeholder import PlaceholderRelationFieldSerializer, get_declared_slots
+from tests.base import RESTTestCase
+
+
+class DeclaredSlotsTestCase(RESTTestCase):
+    def setUp(self):
+        placeholder_module._declared_slots.clear()
+        self.pages = [create_page(f"page {i}", language="en", template="page.html") for i in range(3)]
+
+    def test_memoized_per_template(self):
+        with mock.patch(
+            "djangocms_rest.serializers.placeholder.get_declared_placeholders_for_obj",
+            wraps=placeholder_module.get_declared_placeholders_for_obj,
+        ) as get_declared_placeholders:
+            slots = [get_declared_slots(page.get_content_obj("en")) for page in self.pages]
+
+        self.assertEqual(get_declared_placeholders.call_count, 1)
+        self.assertEqual(slots, [("content",)] * 3)
+
+    def test_cleared_on_template_change(self):
+        get_declared_slots(self.pages[0].get_content_obj("en"))
+
+        file_changed.send(sender=None, file_path=Path("views.py"))
+        self.assertEqual(len(placeholder_module._declared_slots), 1)
+        file_changed.send(sender=None, file_path=Path("templates/page.html"))
+        self.assertEqual(placeholder_module._declared_slots, {})
+
+    def test_page_list(self):
+        with mock.patch(
+            "djangocms_rest.serializers.placeholder.get_declared_placeholders_for_obj",
+            wraps=placeholder_module.get_declared_placeholders_for_obj,
+        ) as get_declared_placeholders:
+            response = self.client.get(reverse("cms-page-list", args=["en"]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_declared_placeholders.call_count, 1)
+
+    def test_relation_field_serializer(self):
+        page_content = self.pages[0].get_content_obj("en")
+        page_content.get_placeholders().create(slot="undeclared")
+        request = self.get_request("/")
+
+        data = PlaceholderRelationFieldSerializer(request, page_content, None, "en").data
+        self.assertEqual(list(data), ["content"])
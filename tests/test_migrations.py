@@ -18,13 +18,14 @@ class MigrationTestCase(TestCase):
             'check_changes': True,
         }
 
-        try:
-            call_command('makemigrations', 'djangocms_text', **options)
-        except SystemExit as e:
-            status_code = str(e)
-        else:
-            # the "no changes" exit code is 0
-            status_code = '0'
+        for app_label in ('djangocms_text', 'djangocms_rest'):
+            try:
+                call_command('makemigrations', app_label, **options)
+            except SystemExit as e:
+                status_code = str(e)
+            else:
+                # the "no changes" exit code is 0
+                status_code = '0'
 
-        if status_code == '1':
-            self.fail(f'There are missing migrations:\n {output.getvalue()}')
+            if status_code == '1':
+                self.fail(f'There are missing migrations:\n {output.getvalue()}')
@@ -0,0 +1,129 @@
+from cms import operations
+from cms.api import create_page
+from cms.signals import post_obj_operation
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from djangocms_rest.page_index import (
+    clear_page_index,
+    get_page_index_entry,
+    get_placeholder_index_entry,
+    set_page_index_entry,
+)
+from tests.base import PageTestCase
+
+
+class PageIndexTestCase(PageTestCase):
+    link_label = None
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response, len(queries)
+
+    def test_indexed_path(self):
+        response, query_count = self.get(self.page_url)
+        indexed_response, indexed_query_count = self.get(self.page_url)
+
+        self.assertEqual(indexed_response.status_code, 200)
+        self.assertEqual(indexed_response.json(), response.json())
+        self.assertLess(indexed_query_count, query_count)
+        _, entry = get_page_index_entry(Site.objects.get_current().pk, "en", "page")
+        self.assertEqual(entry[0], self.page.get_content_obj("en").pk)
+
+    def test_fallback_language(self):
+        url = reverse("cms-page-detail", args=["fr", "page"])
+        response, _ = self.get(url)
+        indexed_response, _ = self.get(url)
+
+        self.assertEqual(indexed_response.json(), response.json())
+        self.assertEqual(indexed_response.json()["language"], "en")
+
+    def test_unknown_path(self):
+        response, _ = self.get(reverse("cms-page-detail", args=["en", "unknown"]))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(get_page_index_entry(1, "en", "unknown")[1], None)
+
+    def test_invalidated_by_page_url_change(self):
+        self.get(self.page_url)
+        page_url = self.page.urls.get(language="en")
+        page_url.slug = page_url.path = "renamed"
+        page_url.save()
+
+        self.assertEqual(self.get(self.page_url)[0].status_code, 404)
+        self.assertEqual(self.get(reverse("cms-page-detail", args=["en", "renamed"]))[0].status_code, 200)
+
+    def test_invalidated_by_page_content_change(self):
+        self.get(self.page_url)
+        page_content = self.page.get_content_obj("en")
+        page_content.title = "changed"
+        page_content.save()
+
+        self.assertEqual(self.get(self.page_url)[0].json()["title"], "changed")
+
+    def test_invalidated_by_page_delete(self):
+        self.get(self.page_url)
+        self.page.delete()
+
+        self.assertEqual(self.get(self.page_url)[0].status_code, 404)
+
+    def test_invalidated_by_page_operation(self):
+        self.get(self.page_url)
+        version, entry = get_page_index_entry(1, "en", "page")
+        self.assertIsNotNone(entry)
+
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+        post_obj_operation.send(
+            sender=self.__class__, operation=operations.MOVE_PAGE, request=request, token=None, obj=self.page
+        )
+        self.assertEqual(get_page_index_entry(1, "en", "page")[1], None)
+
+    def test_invalidated_by_page_move(self):
+        other = create_page("other", language="en", template="page.html")
+        self.get(self.page_url)
+        self.page.move_page(other.node, position="first-child")
+
+        self.assertEqual(self.get(self.page_url)[0].status_code, 404)
+        self.assertEqual(self.get(reverse("cms-page-detail", args=["en", "other/page"]))[0].status_code, 200)
+
+    def test_outdated_entry(self):
+        version, _ = get_page_index_entry(1, "en", "page")
+        clear_page_index()
+        set_page_index_entry(1, "en", "page", version, 1, [])
+
+        self.assertEqual(get_page_index_entry(1, "en", "page")[1], None)
+
+
+class PlaceholderIndexTestCase(PageTestCase):
+    link_label = None
+
+    def test_indexed_placeholder(self):
+        response = self.client.get(self.placeholder_url)
+        with CaptureQueriesContext(connection) as queries:
+            indexed_response = self.client.get(self.placeholder_url)
+
+        self.assertEqual(indexed_response.status_code, 200)
+        self.assertEqual(indexed_response.json(), response.json())
+        # Plugin validators only
+        self.assertLessEqual(len(queries), 1, [q["sql"] for q in queries])
+        _, (placeholder, page_content) = get_placeholder_index_entry(
+            self.placeholder.content_type_id, self.page_content.pk, "content"
+        )
+        self.assertEqual(placeholder, self.placeholder)
+        self.assertEqual(page_content.page.node.path, self.page.node.path)
+
+    def test_unknown_slot(self):
+        url = reverse(
+            "cms-placeholder-detail", args=["en", self.placeholder.content_type_id, self.page_content.pk, "unknown"]
+        )
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_invalidated_by_placeholder_delete(self):
+        self.client.get(self.placeholder_url)
+        self.placeholder.delete()
+
+        self.assertEqual(self.client.get(self.placeholder_url).status_code, 404)
@@ -0,0 +1,70 @@
+import threading
+from unittest import mock
+
+from cms.api import add_plugin, create_page
+from cms.test_utils.testcases import BaseCMSTestCase
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+
+from djangocms_rest.serializers.placeholder import (
+    PlaceholderRenderer,
+    can_render_concurrently,
+    get_render_executor,
+)
+
+
+@override_settings(DJANGOCMS_REST_RENDER_WORKERS=2)
+class ParallelRenderingTestCase(BaseCMSTestCase, TransactionTestCase):
+    # Placeholders are rendered in other threads which need to see the test data: no test transaction
+    prefix = "http://testserver"
+
+    def setUp(self):
+        cache.clear()
+        self.request = self.get_request("/")
+        self.placeholders = []
+        for i in range(5):
+            page = create_page(f"page {i}", language="en", template="page.html")
+            placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=f"link {i}")
+            self.placeholders.append(placeholder)
+        self.threads = set()
+        render_missing = PlaceholderRenderer.render_missing
+
+        def record_thread(*args, **kwargs):
+            # Render workers do not hand work on to other workers
+            self.threads.add((threading.current_thread().name, can_render_concurrently()))
+            return render_missing(*args, **kwargs)
+
+        patcher = mock.patch.object(PlaceholderRenderer, "render_missing", autospec=True, side_effect=record_thread)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def render(self):
+        return PlaceholderRenderer(self.request).render_placeholders(self.placeholders, {}, "en", use_cache=True)
+
+    def test_parallel_rendering(self):
+        contents = self.render()
+
+        self.assertEqual(list(contents), [placeholder.pk for placeholder in self.placeholders])
+        self.assertEqual([content[0]["label"] for content in contents.values()], [f"link {i}" for i in range(5)])
+        self.assertEqual({name[:21] for name, _ in self.threads}, {"djangocms-rest-render"})
+        self.assertEqual({concurrent for _, concurrent in self.threads}, {False})
+        # The contents have been cached by the workers
+        self.threads.clear()
+        self.assertEqual(self.render(), contents)
+        self.assertEqual({name for name, _ in self.threads}, {threading.current_thread().name})
+
+    def test_serial_rendering_in_transaction(self):
+        with transaction.atomic():
+            self.assertFalse(can_render_concurrently())
+            contents = self.render()
+
+        self.assertEqual(len(contents), 5)
+        self.assertEqual({name for name, _ in self.threads}, {threading.current_thread().name})
+
+    @override_settings(DJANGOCMS_REST_RENDER_WORKERS=0)
+    def test_disabled(self):
+        self.assertIsNone(get_render_executor())
+        self.assertEqual(len(self.render()), 5)
+        self.assertEqual({name for name, _ in self.threads}, {threading.current_thread().name})
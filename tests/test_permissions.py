@@ -0,0 +1,104 @@
+from cms.api import create_page
+from cms.models import ACCESS_DESCENDANTS, ACCESS_PAGE, Page, PagePermission
+from cms.utils.page_permissions import user_can_view_page
+from django.contrib.auth.models import AnonymousUser, Group
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from djangocms_rest.permissions import PermissionEvaluator, get_view_restrictions
+from tests.base import RESTTestCase
+
+
+@override_settings(CMS_PERMISSION=True)
+class PermissionEvaluatorTestCase(RESTTestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_current()
+        self.public = create_page("public", language="en", template="page.html")
+        self.parent = create_page("parent", language="en", template="page.html")
+        self.child = create_page("child", language="en", template="page.html", parent=self.parent)
+        self.private = create_page("private", language="en", template="page.html")
+        self.user = self._create_user("user", is_staff=False)
+        self.group_user = self._create_user("group_user", is_staff=False)
+        self.other = self._create_user("other", is_staff=False)
+        group = Group.objects.create(name="group")
+        self.group_user.groups.add(group)
+        PagePermission.objects.create(page=self.parent, user=self.user, grant_on=ACCESS_DESCENDANTS, can_view=True)
+        PagePermission.objects.create(page=self.private, group=group, grant_on=ACCESS_PAGE, can_view=True)
+        self.pages = [self.public, self.parent, self.child, self.private]
+
+    def visible(self, user):
+        return [page.get_slug("en") for page in PermissionEvaluator(user, self.site).filter(self.pages)]
+
+    def test_view_restrictions(self):
+        self.assertEqual(self.visible(AnonymousUser()), ["public", "parent"])
+        self.assertEqual(self.visible(self.user), ["public", "parent", "child"])
+        self.assertEqual(self.visible(self.group_user), ["public", "parent", "private"])
+        self.assertEqual(self.visible(self.other), ["public", "parent"])
+        self.assertEqual(self.visible(self.get_superuser()), ["public", "parent", "child", "private"])
+
+    def test_matches_user_can_view_page(self):
+        for user in (AnonymousUser(), self.user, self.group_user, self.other, self.get_superuser()):
+            evaluator = PermissionEvaluator(user, self.site)
+            for page in self.pages:
+                with self.subTest(user=str(user), page=page.get_slug("en")):
+                    self.assertEqual(evaluator.can_view(page), user_can_view_page(user, page, self.site))
+
+    def test_can_view_audience(self):
+        restrictions = get_view_restrictions(self.site.pk)
+        for user in (AnonymousUser(), self.user, self.group_user, self.other, self.get_superuser()):
+            evaluator = PermissionEvaluator(user, self.site)
+            for page in self.pages:
+                with self.subTest(user=str(user), page=page.get_slug("en")):
+                    audience = restrictions.get_audience(page.node.path)
+                    self.assertEqual(evaluator.can_view_audience(audience), evaluator.can_view(page))
+
+    @override_settings(CMS_PUBLIC_FOR="staff")
+    def test_public_for_staff(self):
+        self.assertEqual(self.visible(AnonymousUser()), [])
+        self.assertEqual(self.visible(self.user), ["child"])
+
+    def test_cached_restrictions(self):
+        pages = list(Page.objects.select_related("node"))
+        get_view_restrictions(self.site.pk)
+        with self.assertNumQueries(0):
+            PermissionEvaluator(AnonymousUser(), self.site).filter(pages)
+
+    def test_invalidated_by_permission_change(self):
+        self.assertEqual(self.visible(AnonymousUser()), ["public", "parent"])
+        PagePermission.objects.filter(page=self.parent).delete()
+
+        self.assertEqual(self.visible(AnonymousUser()), ["public", "parent", "child"])
+
+    def test_invalidated_by_page_move(self):
+        get_view_restrictions(self.site.pk)
+        self.private.move_page(self.public.node, position="first-child")
+        private = Page.objects.select_related("node").get(pk=self.private.pk)
+
+        for user in (AnonymousUser(), self.other):
+            with self.subTest(user=str(user)):
+                self.assertFalse(PermissionEvaluator(user, self.site).can_view(private))
+        self.assertTrue(PermissionEvaluator(self.group_user, self.site).can_view(private))
+
+    def test_invalidated_by_new_page(self):
+        get_view_restrictions(self.site.pk)
+        page = create_page("new", language="en", template="page.html")
+
+        self.assertTrue(PermissionEvaluator(AnonymousUser(), self.site).can_view(page))
+
+    def test_endpoints(self):
+        response = self.client.get(reverse("cms-page-list", args=["en"]))
+        self.assertEqual([page["title"] for page in response.json()], ["public", "parent"])
+        self.assertEqual(self.client.get(reverse("cms-page-detail", args=["en", "parent/child"])).status_code, 404)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(reverse("cms-page-detail", args=["en", "public"])).status_code, 200)
+        self.assertFalse([query for query in queries if "cms_pagepermission" in query["sql"]])
+
+        with self.login_user_context(self.user):
+            response = self.client.get(reverse("cms-page-detail", args=["en", "parent/child"]))
+        self.assertEqual(response.status_code, 200)
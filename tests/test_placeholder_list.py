@@ -0,0 +1,78 @@
+from cms.api import add_plugin, create_page
+from cms.models import PagePermission
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
+from django.urls import reverse
+
+from tests.base import RESTTestCase
+
+
+class PlaceholderListTestCase(RESTTestCase):
+    def setUp(self):
+        self.page_contents = []
+        for i in range(3):
+            page = create_page(f"page {i}", language="en", template="page.html")
+            page_content = page.get_content_obj("en")
+            placeholder = page_content.get_placeholders().get(slot="content")
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=f"link {i}")
+            add_plugin(placeholder, "TextPlugin", "en", body=f"<p>text {i}</p>")
+            self.page_contents.append(page_content)
+        self.content_type_id = ContentType.objects.get_for_model(self.page_contents[0]).pk
+
+    def get_url(self, *page_contents, slot="content"):
+        query = "&".join(
+            f"placeholder={self.content_type_id}:{page_content.pk}:{slot}" for page_content in page_contents
+        )
+        return reverse("cms-placeholder-list", args=["en"]) + "?" + query
+
+    def test_placeholder_list(self):
+        result = self.client.get(self.get_url(*reversed(self.page_contents)))
+        self.assertEqual(result.status_code, 200)
+        data = result.json()
+
+        self.assertEqual([item["object_id"] for item in reversed(data)], [pc.pk for pc in self.page_contents])
+        for item in data:
+            details = self.client.get(item["details"]).json()
+            for key in ("slot", "label", "language", "content"):
+                self.assertEqual(item[key], details[key])
+
+    def test_missing_placeholders(self):
+        result = self.client.get(self.get_url(self.page_contents[0]) + "&" + self.get_url(slot="other")[-30:])
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(len(result.json()), 1)
+
+        result = self.client.get(self.get_url(self.page_contents[0], slot="other"))
+        self.assertEqual(result.json(), [])
+
+    def test_invalid_lookup(self):
+        result = self.client.get(reverse("cms-placeholder-list", args=["en"]) + "?placeholder=1:content")
+        self.assertEqual(result.status_code, 400)
+
+    @override_settings(DJANGOCMS_REST_PLACEHOLDER_LIST_MAX=2)
+    def test_max_lookups(self):
+        self.assertEqual(self.client.get(self.get_url(*self.page_contents[:2])).status_code, 200)
+
+        with self.assertNumQueries(0):
+            result = self.client.get(self.get_url(*self.page_contents))
+        self.assertEqual(result.status_code, 400)
+        self.assertIn("placeholder", result.json())
+
+    def test_query_count(self):
+        # Placeholders, sources, plugin validators, plugins and one query per plugin type
+        with self.assertNumQueries(6):
+            self.client.get(self.get_url(*self.page_contents))
+        # Cached contents
+        with self.assertNumQueries(3):
+            self.client.get(self.get_url(*self.page_contents))
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_view_restrictions(self):
+        PagePermission.objects.create(page=self.page_contents[1].page, user=self.get_superuser(), can_view=True)
+        result = self.client.get(self.get_url(*self.page_contents))
+
+        self.assertEqual(
+            [item["object_id"] for item in result.json()],
+            [self.page_contents[0].pk, self.page_contents[2].pk],
+        )
+        self.assertIsInstance(result.wsgi_request.user, AnonymousUser)
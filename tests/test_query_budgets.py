@@ -0,0 +1,41 @@
+from cms.models import PageContent
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from djangocms_rest.views import _set_inherited_templates
+from tests.benchmarks.bench_endpoints import QUERY_BUDGETS, get_urls
+from tests.benchmarks.synthetic_site import build_site
+from tests.base import RESTTestCase
+
+
+class QueryBudgetTestCase(RESTTestCase):
+    """The query budgets of the endpoint benchmarks on a small synthetic site"""
+
+    def setUp(self):
+        cache.clear()
+        self.site = build_site(pages=30, branching=3, heavy_pages=3, plugins=40)
+
+    def test_query_budgets(self):
+        for name, url in get_urls(self.site).items():
+            for state in ("cold", "warm"):
+                with self.subTest(endpoint=name, cache=state):
+                    if state == "cold":
+                        cache.clear()
+                    with CaptureQueriesContext(connection) as queries:
+                        response = self.client.get(url)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertLessEqual(len(queries), QUERY_BUDGETS[name][state])
+
+    def test_inherited_templates(self):
+        page_contents = list(PageContent.objects.select_related("page__node"))
+        page_contents[0].template = "plugin_with_sekizai.html"
+        page_contents[0].save()
+        page_contents = list(PageContent.objects.select_related("page__node"))
+        with self.assertNumQueries(1):
+            _set_inherited_templates(page_contents)
+
+        for page_content in page_contents:
+            expected = PageContent.objects.get(pk=page_content.pk).get_template()
+            self.assertEqual(page_content.get_template(), expected)
+        self.assertEqual(page_contents[-1].get_template(), "plugin_with_sekizai.html")
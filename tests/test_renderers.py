@@ -0,0 +1,77 @@
+import json
+import pickle
+from unittest import mock
+
+from rest_framework import renderers
+
+from djangocms_rest.renderers import JSONRenderer, RawJSON
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer
+from tests.base import PageTestCase, RESTTestCase
+
+
+class JSONRendererTestCase(RESTTestCase):
+    data = {
+        "slot": "content",
+        "content": [{"label": "link ✓", "children": [{"label": " "}]}],
+        "details": None,
+    }
+
+    def test_raw_json(self):
+        raw = RawJSON.dumps(self.data["content"])
+
+        self.assertIsInstance(raw, bytes)
+        self.assertEqual(raw.loads(), self.data["content"])
+        self.assertEqual(pickle.loads(pickle.dumps(raw)), raw)
+        self.assertIsInstance(pickle.loads(pickle.dumps(raw)), RawJSON)
+
+    def test_splicing(self):
+        expected = renderers.JSONRenderer().render(self.data)
+        data = {**self.data, "content": RawJSON.dumps(self.data["content"])}
+
+        self.assertEqual(JSONRenderer().render(data), expected)
+        self.assertEqual(JSONRenderer().render([data, data]), renderers.JSONRenderer().render([self.data, self.data]))
+
+    def test_indent(self):
+        data = {**self.data, "content": RawJSON.dumps(self.data["content"])}
+
+        rendered = JSONRenderer().render(data, "application/json; indent=4")
+        self.assertEqual(json.loads(rendered), self.data)
+        self.assertIn(b'\n    "slot"', rendered)
+
+    def test_sentinel_like_strings(self):
+        data = {
+            "slot": "\x00rawjson:0",
+            "content": RawJSON.dumps(self.data["content"]),
+            "details": "\x00rawjson:7",
+        }
+
+        rendered = JSONRenderer().render(data)
+        self.assertEqual(
+            json.loads(rendered), {"slot": "\x00rawjson:0", "content": self.data["content"], "details": "\x00rawjson:7"}
+        )
+
+    def test_no_raw_json(self):
+        self.assertEqual(JSONRenderer().render(self.data), renderers.JSONRenderer().render(self.data))
+        self.assertEqual(JSONRenderer().render(None), b"")
+
+
+class CachedResponseTestCase(PageTestCase):
+    link_label = "link ✓"
+
+    def setUp(self):
+        super().setUp()
+        self.urls = {
+            "page-detail": self.page_url + "?expand=placeholders",
+            "placeholder-detail": self.placeholder_url,
+        }
+
+    def test_cache_hits_are_not_decoded(self):
+        for name, url in self.urls.items():
+            with self.subTest(name=name):
+                response = self.client.get(url)
+                with mock.patch.object(RawJSON, "loads") as loads, \
+                        mock.patch.object(PlaceholderRenderer, "render_plugins") as render_plugins:
+                    cached_response = self.client.get(url)
+                loads.assert_not_called()
+                render_plugins.assert_not_called()
+                self.assertEqual(cached_response.content, response.content)
@@ -1,10 +1,17 @@
-from cms.api import create_page
-from cms.test_utils.testcases import CMSTestCase
-from django.urls import reverse
+from unittest import mock
 
+from cms.api import add_plugin, create_page
+from cms.models import Placeholder
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
 
-class RESTTestCase(CMSTestCase):
-    prefix = "http://testserver"
+from djangocms_rest.serializers import plugins
+from djangocms_rest.serializers.placeholder import PlaceholderRenderer
+from djangocms_rest.serializers.plugins import get_plugin_serializer
+from tests.base import PageTestCase, RESTTestCase
+from tests.test_app.models import DummyLink
 
 
 class RenderingTestCase(RESTTestCase):
@@ -41,3 +48,153 @@ class RenderingTestCase(RESTTestCase):
             for item in check_items:
                 self.assertEqual(lang_config[item], data[lang][item])
             self.assertEqual(data[lang]["pages"], self.prefix + reverse("cms-page-list", args=[lang]))
+
+    def test_page_list(self):
+        result = self.client.get(reverse("cms-page-list", args=["en"]))
+        self.assertEqual(result.status_code, 200)
+        data = result.json()
+
+        self.assertEqual([item["title"] for item in data], ["page 0", "page 1", "page 2"])
+        self.assertEqual([len(item["children"]) for item in data], [2, 2, 2])
+        self.assertEqual(data[1]["children"][0]["template"], "INHERIT")
+        self.assertIn("content", data[1]["children"][0]["placeholders"])
+
+    def test_page_list_fallback_language(self):
+        result = self.client.get(reverse("cms-page-list", args=["fr"]))
+        self.assertEqual(result.status_code, 200)
+        data = result.json()
+
+        self.assertEqual([item["title"] for item in data], ["page 0", "page 1", "page 2"])
+        self.assertEqual(data[0]["language"], "en")
+
+    def test_page_list_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("cms-page-list", args=["en"]))
+        num_queries = len(ctx.captured_queries)
+
+        parent = create_page("parent", language="en", template="page.html")
+        self._create_pages([5, 5], parent=parent)
+        with self.assertNumQueries(num_queries):
+            result = self.client.get(reverse("cms-page-list", args=["en"]))
+        self.assertEqual(len(result.json()[3]["children"]), 2)
+
+
+class PlaceholderRenderingTestCase(PageTestCase):
+    link_label = None
+
+    def _add_plugins(self, placeholder, count):
+        for i in range(count):
+            parent = add_plugin(placeholder, "DummyParentPlugin", "en", label=f"parent {i}")
+            add_plugin(placeholder, "DummyLinkPlugin", "en", target=parent, label=f"child {i}")
+            add_plugin(placeholder, "TextPlugin", "en", body=f"<p>text {i}</p>")
+
+    def _render_plugins(self, placeholder):
+        renderer = PlaceholderRenderer(self.get_request("/"))
+        return renderer.render_plugins(placeholder, language="en", context={})
+
+    def test_render_plugins(self):
+        self._add_plugins(self.placeholder, 2)
+        content = self._render_plugins(self.placeholder)
+
+        self.assertEqual(
+            [plugin["plugin_type"] for plugin in content],
+            ["DummyParentPlugin", "TextPlugin", "DummyParentPlugin", "TextPlugin"],
+        )
+        self.assertEqual(content[0]["label"], "parent 0")
+        self.assertEqual(content[0]["children"], [{"plugin_type": "DummyLinkPlugin", "label": "child 0"}])
+        self.assertEqual(content[3]["body"], "<p>text 1</p>")
+
+    def test_render_plugins_query_count(self):
+        self._add_plugins(self.placeholder, 20)
+        placeholder = Placeholder.objects.get(pk=self.placeholder.pk)
+
+        # One query for the plugin tree, one per plugin type
+        with self.assertNumQueries(4):
+            content = self._render_plugins(placeholder)
+        self.assertEqual(len(content), 40)
+
+    def test_prefetch_plugins(self):
+        other_placeholder = self.page_content.get_placeholders().create(slot="other")
+        self._add_plugins(self.placeholder, 2)
+        self._add_plugins(other_placeholder, 3)
+        placeholders = list(Placeholder.objects.filter(pk__in=[self.placeholder.pk, other_placeholder.pk]))
+
+        renderer = PlaceholderRenderer(self.get_request("/"))
+        with self.assertNumQueries(4):
+            renderer.prefetch_plugins(placeholders, "en")
+        with self.assertNumQueries(0):
+            content = [renderer.render_plugins(placeholder, "en", {}) for placeholder in placeholders]
+        self.assertEqual(sorted(len(item) for item in content), [4, 6])
+
+    def test_plugin_serializer_registry(self):
+        serializer = get_plugin_serializer(DummyLink)
+
+        self.assertIs(get_plugin_serializer(DummyLink), serializer)
+        self.assertEqual(serializer.Meta.model, DummyLink)
+        self.assertEqual(
+            serializer(DummyLink(plugin_type="DummyLinkPlugin", label="link")).data,
+            {"plugin_type": "DummyLinkPlugin", "label": "link"},
+        )
+
+    def test_plugin_supplied_serializer(self):
+        class LabelSerializer(serializers.Serializer):
+            label = serializers.CharField()
+
+        add_plugin(self.placeholder, "DummyLinkPlugin", "en", label="link")
+        with mock.patch.dict(plugins._plugin_serializers, clear=True), \
+                mock.patch.object(DummyLink, "serializer", LabelSerializer, create=True):
+            content = self._render_plugins(self.placeholder)
+        self.assertEqual(content, [{"label": "link"}])
+
+    def test_plugin_supplied_serializer_per_instance(self):
+        class InstanceSerializer(serializers.Serializer):
+            label = serializers.CharField()
+
+            def __init__(self, instance=None, **kwargs):
+                super().__init__(instance, **kwargs)
+                self.fields["pk"] = serializers.ReadOnlyField(default=instance.pk)
+
+        links = [add_plugin(self.placeholder, "DummyLinkPlugin", "en", label=f"link {i}") for i in range(2)]
+        with mock.patch.dict(plugins._plugin_serializers, clear=True), \
+                mock.patch.object(DummyLink, "serializer", InstanceSerializer, create=True):
+            content = self._render_plugins(self.placeholder)
+        self.assertEqual(content, [{"label": link.label, "pk": link.pk} for link in links])
+
+    def test_render_placeholders(self):
+        other_placeholder = self.page_content.get_placeholders().create(slot="other")
+        self._add_plugins(self.placeholder, 2)
+        self._add_plugins(other_placeholder, 3)
+        placeholders = list(Placeholder.objects.filter(pk__in=[self.placeholder.pk, other_placeholder.pk]))
+
+        renderer = PlaceholderRenderer(self.get_request("/"))
+        with self.assertNumQueries(4):
+            contents = renderer.render_placeholders(placeholders, {}, "en")
+        self.assertEqual(len(contents[self.placeholder.pk]), 4)
+        self.assertEqual(len(contents[other_placeholder.pk]), 6)
+
+    def test_page_detail_expand_placeholders(self):
+        self._add_plugins(self.placeholder, 2)
+        url = reverse("cms-page-detail", args=["en", "page"])
+
+        placeholders = self.client.get(url).json()["placeholders"]
+        result = self.client.get(url + "?expand=placeholders")
+        self.assertEqual(result.status_code, 200)
+        expanded = result.json()["placeholders"]["content"]
+        details = self.client.get(placeholders["content"]).json()
+
+        self.assertEqual(expanded["details"], placeholders["content"])
+        self.assertEqual(expanded["content"], details["content"])
+        self.assertEqual(expanded["label"], details["label"])
+
+    def test_page_detail_expand_placeholders_cache(self):
+        self._add_plugins(self.placeholder, 2)
+        url = reverse("cms-page-detail", args=["en", "page"]) + "?expand=placeholders"
+        content = self.client.get(url).json()["placeholders"]["content"]["content"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = self.client.get(url)
+        self.assertEqual(result.json()["placeholders"]["content"]["content"], content)
+        # Only the validators look at the plugins
+        plugin_queries = [query["sql"] for query in ctx.captured_queries if "cms_cmsplugin" in query["sql"]]
+        self.assertEqual(len(plugin_queries), 1)
+        self.assertIn("COUNT", plugin_queries[0])
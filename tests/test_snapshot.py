@@ -0,0 +1,83 @@
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cms.api import add_plugin, create_page
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+
+from djangocms_rest.snapshot import SnapshotExporter
+from tests.benchmarks.synthetic_site import build_site
+from tests.base import RESTTestCase
+
+
+class SnapshotTestCase(RESTTestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = build_site(pages=5, branching=2, heavy_pages=1, plugins=5)
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def export(self, incremental=False):
+        return SnapshotExporter(self.directory, "http://testserver", incremental=incremental).export()
+
+    def read(self, file):
+        return json.loads((self.directory / file).read_text())
+
+    def test_export(self):
+        result = self.export()
+
+        page = self.site.pages[1]
+        placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+        for file, url in (
+            ("index.json", reverse("cms-language-list")),
+            ("en/pages.json", reverse("cms-page-list", args=["en"])),
+            ("en/pages/page-0/page-1/index.json", reverse("cms-page-detail", args=["en", page.get_path("en")])),
+            (
+                f"en/placeholders/{placeholder.content_type_id}/{placeholder.object_id}/content/index.json",
+                reverse(
+                    "cms-placeholder-detail", args=["en", placeholder.content_type_id, placeholder.object_id, "content"]
+                ),
+            ),
+        ):
+            with self.subTest(file=file):
+                self.assertEqual(self.read(file), self.client.get(url).json())
+        self.assertEqual(result.unchanged, [])
+        self.assertEqual(result.deleted, [])
+        self.assertEqual(set(self.read("manifest.json")["resources"]), set(result.written))
+
+    def test_incremental_export(self):
+        self.export()
+        self.assertEqual(self.export(incremental=True).written, [])
+
+        placeholder = self.site.pages[2].get_content_obj("en").get_placeholders().get(slot="content")
+        add_plugin(placeholder, "DummyLinkPlugin", "en", label="new link")
+        placeholder.clear_cache("en")
+        written = self.export(incremental=True).written
+
+        self.assertIn(
+            reverse("cms-placeholder-detail", args=["en", placeholder.content_type_id, placeholder.object_id, "content"]),
+            written,
+        )
+        self.assertNotIn(reverse("cms-page-detail", args=["en", self.site.pages[3].get_path("en")]), written)
+
+    def test_deleted_page(self):
+        page = create_page("deleted", language="en", template="page.html")
+        self.export()
+        self.assertTrue((self.directory / "en/pages/deleted/index.json").exists())
+
+        page.delete()
+        result = self.export(incremental=True)
+
+        self.assertIn(reverse("cms-page-detail", args=["en", "deleted"]), result.deleted)
+        self.assertFalse((self.directory / "en/pages/deleted/index.json").exists())
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("export_rest_snapshot", str(self.directory), base_url="http://testserver", stdout=stdout)
+
+        self.assertIn("0 unchanged, 0 deleted", stdout.getvalue())
+        self.assertEqual(self.read("index.json")[0]["pages"], "http://testserver/api/en/pages")
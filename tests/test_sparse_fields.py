@@ -0,0 +1,72 @@
+from unittest import mock
+
+from cms.api import add_plugin, create_page
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from djangocms_rest.serializers.pageserializer import PageContentSerializer
+from tests.base import RESTTestCase
+
+
+class SparseFieldsTestCase(RESTTestCase):
+    def setUp(self):
+        home = create_page("home", language="en", template="page.html")
+        home.set_as_homepage()
+        for i in range(3):
+            page = create_page(f"page {i}", language="en", template="page.html", parent=home)
+            placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+            add_plugin(placeholder, "DummyLinkPlugin", "en", label=f"link {i}")
+        self.list_url = reverse("cms-page-list", args=["en"])
+        self.detail_url = reverse("cms-page-detail", args=["en", "page-0"])
+
+    def test_fields(self):
+        response = self.client.get(self.list_url + "?fields=title,path")
+
+        self.assertEqual(response.status_code, 200)
+        home = response.json()[0]
+        self.assertEqual(set(home), {"title", "path", "children"})
+        self.assertEqual(set(home["children"][0]), {"title", "path"})
+        self.assertEqual(home["children"][0]["path"], self.prefix + self.detail_url)
+
+    def test_omit(self):
+        response = self.client.get(self.detail_url + "?omit=placeholders,absolute_url")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()), set(PageContentSerializer.representation_fields) - {"placeholders", "absolute_url"}
+        )
+
+    def test_fields_and_omit(self):
+        response = self.client.get(self.detail_url + "?fields=title,path,language&omit=path")
+
+        self.assertEqual(response.json(), {"title": "page 0", "language": "en"})
+
+    def test_all_fields(self):
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(list(response.json()), list(PageContentSerializer.representation_fields))
+
+    def test_unknown_field(self):
+        for query in ("?fields=title,children", "?omit=foo"):
+            with self.subTest(query=query):
+                response = self.client.get(self.list_url + query)
+                self.assertEqual(response.status_code, 400)
+
+    def test_skipped_fields_are_not_computed(self):
+        with mock.patch(
+            "djangocms_rest.serializers.pageserializer.get_page_placeholders"
+        ) as get_page_placeholders, mock.patch(
+            "cms.models.Page.get_absolute_url"
+        ) as get_absolute_url:
+            self.client.get(self.list_url + "?fields=title,menu_title")
+            self.client.get(self.detail_url + "?fields=title&expand=placeholders")
+        get_page_placeholders.assert_not_called()
+        get_absolute_url.assert_not_called()
+
+    def test_fewer_queries(self):
+        with CaptureQueriesContext(connection) as all_fields:
+            self.client.get(self.list_url)
+        with CaptureQueriesContext(connection) as some_fields:
+            self.client.get(self.list_url + "?fields=title,path")
+        self.assertLess(len(some_fields), len(all_fields))
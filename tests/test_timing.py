@@ -0,0 +1,62 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from djangocms_rest import views
+from djangocms_rest.signals import request_timed
+from djangocms_rest.timing import NULL_TIMER, get_timer
+from tests.base import PageTestCase
+
+
+class TimingTestCase(PageTestCase):
+    def get_metrics(self, response):
+        return dict(
+            metric.split(";", 1) for metric in response["Server-Timing"].split(", ")
+        )
+
+    def test_disabled(self):
+        response = self.client.get(self.page_url)
+
+        self.assertFalse(response.has_header("Server-Timing"))
+        self.assertIs(get_timer(response.wsgi_request), NULL_TIMER)
+
+    @override_settings(DJANGOCMS_REST_SERVER_TIMING=True)
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.placeholder_url)
+
+        metrics = self.get_metrics(response)
+        for phase in ("lookup", "permissions", "validate", "cache-get", "plugins", "cache-set", "serialize", "json"):
+            self.assertTrue(metrics[phase].startswith("dur="), phase)
+        self.assertLessEqual(float(metrics["json"][4:]), float(metrics["total"][4:]))
+        self.assertEqual(metrics["cache-misses"], 'desc="1"')
+        self.assertEqual(metrics["queries"], f'desc="{len(queries)}"')
+
+        metrics = self.get_metrics(self.client.get(self.placeholder_url))
+        self.assertEqual(metrics["cache-hits"], 'desc="1"')
+        self.assertNotIn("plugins", metrics)
+
+    @override_settings(DJANGOCMS_REST_SERVER_TIMING=True)
+    def test_not_modified(self):
+        etag = self.client.get(self.page_url)["ETag"]
+        response = self.client.get(self.page_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("validate", self.get_metrics(response))
+
+    def test_signal(self):
+        calls = []
+
+        def receiver(sender, request, response, timings, counters, **kwargs):
+            calls.append((sender, response.status_code, timings, counters))
+
+        request_timed.connect(receiver, sender=views.PageDetail)
+        self.addCleanup(request_timed.disconnect, receiver, sender=views.PageDetail)
+        self.client.get(self.placeholder_url)
+        response = self.client.get(self.page_url + "?expand=placeholders")
+
+        self.assertFalse(response.has_header("Server-Timing"))
+        [(sender, status_code, timings, counters)] = calls
+        self.assertEqual((sender, status_code), (views.PageDetail, 200))
+        self.assertEqual(set(timings), {"lookup", "permissions", "validate", "serialize", "urls", "cache-get", "json", "total"})
+        self.assertEqual(counters["cache-hits"], 1)
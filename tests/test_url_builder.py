@@ -0,0 +1,66 @@
+from unittest import mock
+
+from django.urls import clear_script_prefix, reverse, set_script_prefix
+
+from djangocms_rest import utils
+from djangocms_rest.utils import URLBuilder, get_url_builder
+from tests.base import RESTTestCase
+
+
+class URLBuilderTestCase(RESTTestCase):
+    urls = [
+        ("cms-language-list",),
+        ("cms-page-list", "en"),
+        ("cms-page-list", "zh-hans"),
+        ("cms-page-root", "en"),
+        ("cms-page-detail", "en", "page"),
+        ("cms-page-detail", "en", "parent/child page"),
+        ("cms-page-detail", "de", "über/straße"),
+        ("cms-page-detail", "en", "a%20b/{c}?d#e"),
+        ("cms-placeholder-list", "en"),
+        ("cms-placeholder-detail", "en", 12, 345, "content"),
+        ("cms-placeholder-detail", "en", 1, 2, "my slot & more"),
+        ("cms-placeholder-detail", "en", 1, 2, "ümläut@:~!$'()*+,;="),
+    ]
+
+    def setUp(self):
+        self.request = self.get_request("/")
+
+    def test_equals_reverse(self):
+        url_builder = URLBuilder(self.request)
+        for viewname, *args in self.urls * 2:
+            with self.subTest(viewname=viewname, args=args):
+                self.assertEqual(
+                    url_builder.build(viewname, *args),
+                    "http://testserver" + reverse(viewname, args=args),
+                )
+
+    def test_script_prefix(self):
+        set_script_prefix("/prefix/")
+        self.addCleanup(clear_script_prefix)
+        url_builder = URLBuilder(self.request)
+        for viewname, *args in self.urls:
+            with self.subTest(viewname=viewname, args=args):
+                url = url_builder.build(viewname, *args)
+                self.assertEqual(url, "http://testserver" + reverse(viewname, args=args))
+                self.assertTrue(url.startswith("http://testserver/prefix/"))
+
+    def test_reverses_once(self):
+        url_builder = URLBuilder(self.request)
+        with mock.patch("djangocms_rest.utils.reverse", wraps=reverse) as reverse_mock:
+            for i in range(10):
+                url_builder.build("cms-placeholder-detail", "en", 1, i, f"slot {i}")
+        # Markers and verification
+        self.assertEqual(reverse_mock.call_count, 2)
+
+    def test_fallback(self):
+        url_builder = URLBuilder(self.request)
+        with mock.patch.object(utils, "_STR_MARKER", "s"):
+            # The marker appears twice in the URL: "/api/s/pages"
+            self.assertEqual(url_builder.build("cms-page-list", "en"), "http://testserver" + reverse(
+                "cms-page-list", args=["en"]
+            ))
+        self.assertIsNone(url_builder._templates["cms-page-list", 1])
+
+    def test_get_url_builder(self):
+        self.assertIs(get_url_builder(self.request), get_url_builder(self.request))
@@ -0,0 +1,73 @@
+from datetime import timedelta
+from io import StringIO
+
+from cms.api import add_plugin, create_page
+from cms.models import Page
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from djangocms_rest.serializers.placeholder import get_placeholder_rest_cache_many
+from djangocms_rest.warming import get_pages_to_warm, get_warming_request
+from tests.benchmarks.bench_endpoints import QUERY_BUDGETS, get_urls
+from tests.benchmarks.synthetic_site import build_site
+from tests.base import RESTTestCase
+
+
+class WarmCacheTestCase(RESTTestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = build_site(pages=10, branching=3, heavy_pages=2, plugins=20)
+
+    def warm(self, *args, **options):
+        stdout = StringIO()
+        call_command("warm_rest_cache", *args, processes=1, batch_size=4, stdout=stdout, stderr=StringIO(), **options)
+        return stdout.getvalue()
+
+    def test_warmed_endpoints(self):
+        output = self.warm(index=True)
+
+        self.assertIn("10/10 pages, 10 placeholders rendered", output)
+        urls = get_urls(self.site)
+        for name in ("page-detail", "page-detail-expanded", "placeholder-detail"):
+            with self.subTest(endpoint=name):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(urls[name])
+                self.assertEqual(response.status_code, 200)
+                self.assertLessEqual(len(queries), QUERY_BUDGETS[name]["warm"])
+
+    def test_cached_placeholders_are_skipped(self):
+        self.warm()
+
+        self.assertIn("Warmed 10 pages: rendered 0 of 10 placeholders", self.warm())
+
+    def test_since(self):
+        since = timezone.now() + timedelta(minutes=1)
+        self.assertEqual(get_pages_to_warm(since=since), [])
+
+        page = self.site.pages[3]
+        placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+        plugin = add_plugin(placeholder, "DummyLinkPlugin", "en", label="changed")
+        Page.objects.filter(pk=page.pk).update(changed_date=since - timedelta(days=1))
+        type(plugin).objects.filter(pk=plugin.pk).update(changed_date=since)
+
+        self.assertEqual(get_pages_to_warm(since=since), [page.pk])
+        self.assertIn("Warmed 1 pages", self.warm(since=since.isoformat()))
+
+    def test_invalid_since(self):
+        with self.assertRaises(CommandError):
+            self.warm(since="yesterday")
+
+    def test_other_site(self):
+        site = Site.objects.create(domain="other.example.com", name="other")
+        page = create_page("other", language="en", template="page.html", site=site)
+        placeholder = page.get_content_obj("en").get_placeholders().get(slot="content")
+        add_plugin(placeholder, "DummyLinkPlugin", "en", label="link")
+
+        self.assertIn("Warmed 1 pages: rendered 1 of 1 placeholders", self.warm(site=[site.pk], language=["en"]))
+        request = get_warming_request(site)
+        self.assertEqual(len(get_placeholder_rest_cache_many([placeholder], "en", site.pk, request)), 1)
+        self.assertEqual(get_placeholder_rest_cache_many([placeholder], "en", 1, request), {})
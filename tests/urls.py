@@ -7,6 +7,7 @@ admin.autodiscover()
 
 urlpatterns = [
     path("api/", include("djangocms_rest.urls")),
+    path("", include("cms.urls")),
 ]
 
 urlpatterns += staticfiles_urlpatterns()